@@ -1,4 +1,37 @@
+import weakref
 from datetime import date
+from functools import lru_cache
+from itertools import repeat
+
+from SortedIndex import SortedIndex
+
+
+def _date_key(day):
+    """
+    Packs a date into an integer that orders like the date, e.g. 19990812.
+
+    Args:
+        day (date): The date to pack.
+
+    Returns:
+        int: The packed date.
+    """
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+@lru_cache(maxsize=4096)
+def _age_on(dob, today):
+    """
+    Computes an age in whole years, caching the result per (dob, today).
+
+    Args:
+        dob (date): The date of birth.
+        today (date): The date to compute the age on.
+
+    Returns:
+        int: The age on the given date.
+    """
+    return (_date_key(today) - _date_key(dob)) // 10000
 
 
 class Employee:
@@ -7,8 +40,27 @@ class Employee:
 
     Attributes:
         minimum_wage (int): The minimum wage for all employees. Default is 1000.
+        minimum_wage_epoch (int): Incremented on every minimum wage change, so cached
+            values derived from the wage can tell they are stale.
     """
     minimum_wage = 1000
+    minimum_wage_epoch = 0
+
+    # Sorted (salary, id) keys of every live employee, with the indexed salary
+    # and a weak reference stored per id. Salary changes and garbage collected
+    # employees are queued and only applied to the index when it is queried,
+    # so the salary setter stays a dict assignment. The queue is keyed by id,
+    # so rewriting salaries does not grow it, and holds weak references, so
+    # employees collected before a query are never indexed. Their entries are
+    # pruned once the queue reaches _pending_limit, which then doubles, so
+    # code that writes salaries and never queries cannot pile them up.
+    _salary_index = SortedIndex()
+    _indexed_salaries = {}
+    _indexed_employees = {}
+    _pending = {}
+    _collected = []
+    _PENDING_LIMIT = 10_000
+    _pending_limit = _PENDING_LIMIT
 
     @classmethod
     def change_minimum_wage(cls, new_wage):
@@ -18,12 +70,73 @@ class Employee:
         Args:
             new_wage (int): The new minimum wage.
 
+        Returns:
+            list: The employees whose salary is below the new minimum wage.
+
         Raises:
             ValueError: If the new wage is greater than 3000.
         """
         if new_wage > 3000:
             raise ValueError("Company is bankrupt")
         cls.minimum_wage = new_wage
+        cls.minimum_wage_epoch += 1
+        return cls.below_minimum_wage(new_wage)
+
+    @classmethod
+    def below_minimum_wage(cls, wage=None):
+        """
+        Finds the employees earning less than a wage using the sorted salary index.
+
+        Args:
+            wage (int, optional): The wage to compare against. Default is the minimum wage.
+
+        Returns:
+            list: The employees whose salary is below the wage, lowest salary first.
+        """
+        if wage is None:
+            wage = cls.minimum_wage
+        Employee._flush_salary_index()
+        employees = (Employee._indexed_employees[key]() for _, key in Employee._salary_index.below((wage,)))
+        return [employee for employee in employees if employee is not None]
+
+    @staticmethod
+    def _flush_salary_index():
+        """
+        Applies the queued salary changes and collected employees to the salary index.
+        """
+        index = Employee._salary_index
+        salaries = Employee._indexed_salaries
+        refs = Employee._indexed_employees
+        collected, Employee._collected = Employee._collected, []
+        for key in collected:
+            del refs[key]
+            index.remove((salaries.pop(key), key))
+        pending, Employee._pending = Employee._pending, {}
+        Employee._pending_limit = Employee._PENDING_LIMIT
+        added = []
+        for key, ref in pending.items():
+            employee = ref()
+            if employee is None:
+                continue
+            old = salaries.get(key)
+            if old is None:
+                refs[key] = weakref.ref(employee, lambda _, key=key: Employee._collected.append(key))
+            else:
+                index.remove((old, key))
+            salaries[key] = employee._salary
+            added.append((employee._salary, key))
+        index.update(added)
+
+    @staticmethod
+    def _prune_pending():
+        """
+        Drops the queued salary changes of employees that were garbage collected.
+
+        The next prune waits until the queue has doubled, so pruning costs
+        amortized constant time per salary change.
+        """
+        pending = Employee._pending = {key: ref for key, ref in Employee._pending.items() if ref() is not None}
+        Employee._pending_limit = max(2 * len(pending), Employee._PENDING_LIMIT)
 
     @classmethod
     def new_employee(cls, name, dob):
@@ -37,9 +150,70 @@ class Employee:
         Returns:
             Employee: A new instance of Employee.
         """
-        now = date.today()
-        age = now.year - dob.year - ((now.month, now.day) < (dob.month, dob.day))
-        return cls(name, age, cls.minimum_wage)
+        return cls(name, _age_on(dob, date.today()), cls.minimum_wage)
+
+    @classmethod
+    def new_employees(cls, names, dobs):
+        """
+        Creates a batch of new employees with the minimum wage salary.
+
+        Today's date is read once for the whole batch and the ages are computed
+        with integer arithmetic on packed dates.
+
+        Args:
+            names (iterable): The names of the employees.
+            dobs (iterable): The dates of birth of the employees, in the same order.
+
+        Returns:
+            list: The new Employee instances.
+
+        Raises:
+            ValueError: If there are not as many dates of birth as names.
+        """
+        names = list(names)
+        today = _date_key(date.today())
+        ages = [(today - _date_key(dob)) // 10000 for dob in dobs]
+        if len(names) != len(ages):
+            raise ValueError(f"Got {len(names)} names but {len(ages)} dates of birth")
+        return cls.from_records(zip(names, ages, repeat(cls.minimum_wage)))
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Creates employees in bulk from (name, age, salary) records.
+
+        The instances are filled in directly instead of going through the
+        salary setter for every row. A batch with a salary below the minimum
+        wage is scanned again so the error can list every failed row.
+
+        Args:
+            records (iterable): The (name, age, salary) records.
+
+        Returns:
+            list: The new Employee instances, in record order.
+
+        Raises:
+            ValueError: If any salary is less than the minimum wage, listing every failed row.
+        """
+        records = list(records)
+        minimum_wage = Employee.minimum_wage
+        employees = []
+        new = cls.__new__
+        for name, age, salary in records:
+            if salary < minimum_wage:
+                break
+            employee = new(cls)
+            employee.name = name
+            employee.age = age
+            employee._salary = salary
+            employees.append(employee)
+        else:
+            Employee._pending.update((id(employee), weakref.ref(employee)) for employee in employees)
+            if len(Employee._pending) >= Employee._pending_limit:
+                Employee._prune_pending()
+            return employees
+        failed = [row for row, (_, _, salary) in enumerate(records) if salary < minimum_wage]
+        raise ValueError(f"Minimum wage is ${minimum_wage}; rows below it: {failed}")
 
     def __init__(self, name, age, salary) -> None:
         """
@@ -87,25 +261,30 @@ class Employee:
         if salary < Employee.minimum_wage:
             raise ValueError('Minimum wage is $1000')
         self._salary = salary
+        pending = Employee._pending
+        pending[id(self)] = weakref.ref(self)
+        if len(pending) >= Employee._pending_limit:
+            Employee._prune_pending()
 
 
-# Create an instance of Employee
-e = Employee("Abi", 39, 50000)
+if __name__ == "__main__":
+    # Create an instance of Employee
+    e = Employee("Abi", 39, 50000)
 
-# Increase the salary of the employee using the increase_salary method
-Employee.__dict__["increase_salary"](e, 20)
-print(e.salary)  # Output the salary after increase
+    # Increase the salary of the employee using the increase_salary method
+    Employee.__dict__["increase_salary"](e, 20)
+    print(e.salary)  # Output the salary after increase
 
-# Output the minimum wage for the employee instance and the Employee class
-print(e.minimum_wage)  # This will output 1000
-print(Employee.minimum_wage)  # This will output 1000
+    # Output the minimum wage for the employee instance and the Employee class
+    print(e.minimum_wage)  # This will output 1000
+    print(Employee.minimum_wage)  # This will output 1000
 
-# Change the minimum wage using the class method
-Employee.change_minimum_wage(400)
-print(Employee.minimum_wage)  # Output the updated minimum wage, which will be 400
+    # Change the minimum wage using the class method
+    Employee.change_minimum_wage(400)
+    print(Employee.minimum_wage)  # Output the updated minimum wage, which will be 400
 
-# Create a new employee using the class method
-f = Employee.new_employee("Mary", date(1999, 8, 12))
-print(f.name)  # Output the name of the new employee
-print(f.age)  # Output the age of the new employee
-print(f.salary)  # Output the salary of the new employee, which will be the minimum wage
+    # Create a new employee using the class method
+    f = Employee.new_employee("Mary", date(1999, 8, 12))
+    print(f.name)  # Output the name of the new employee
+    print(f.age)  # Output the age of the new employee
+    print(f.salary)  # Output the salary of the new employee, which will be the minimum wage
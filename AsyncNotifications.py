@@ -0,0 +1,174 @@
+import asyncio
+
+from UsingDataClasses import Project
+
+
+class MemorySink:
+    """
+    An in-process notification sink that records what it is sent.
+
+    Stands in for the real notification service in tests and benchmarks. A
+    sink is any object with an ``async send(client, projects)`` method.
+
+    Attributes:
+        latency (float): The seconds every send waits, to simulate a network call.
+        sent (list): The (client, projects) pairs sent so far.
+    """
+
+    def __init__(self, latency=0) -> None:
+        """
+        Initializes a MemorySink object.
+
+        Args:
+            latency (float, optional): The seconds every send waits. Default is 0.
+        """
+        self.latency = latency
+        self.sent = []
+
+    async def send(self, client, projects):
+        """
+        Records one notification to a client about some of its projects.
+
+        Args:
+            client (str): The client to notify.
+            projects (list): The projects the client is notified about.
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.sent.append((client, projects))
+
+
+class AsyncNotifier:
+    """
+    Sends client notifications concurrently, grouping them per client.
+
+    Projects passed to notify wait in a bounded queue. A dispatcher takes
+    everything queued, groups it by client and sends one notification per
+    client, with at most ``concurrency`` sends in flight. When all sends are
+    busy the dispatcher stops draining the queue, and once the queue is full
+    notify waits, so a fast producer is slowed down to the pace of the sink
+    instead of buffering without bound.
+
+    Use it as an async context manager; leaving the block waits for every
+    queued notification to be sent.
+
+    Attributes:
+        sink: The object whose send(client, projects) coroutine delivers notifications.
+        concurrency (int): The maximum number of sends in flight.
+        failures (list): The (client, projects, exception) of every failed send.
+    """
+
+    def __init__(self, sink, concurrency=10, max_pending=1000) -> None:
+        """
+        Initializes an AsyncNotifier object.
+
+        Args:
+            sink: The object whose send(client, projects) coroutine delivers notifications.
+            concurrency (int, optional): The maximum number of sends in flight. Default is 10.
+            max_pending (int, optional): The maximum number of queued projects. Default is 1000.
+        """
+        self.sink = sink
+        self.concurrency = concurrency
+        self.failures = []
+        self._queue = asyncio.Queue(max_pending)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._sending = set()
+        self._dispatcher = None
+
+    async def __aenter__(self):
+        """Starts the dispatcher."""
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Waits for every queued notification, then stops the dispatcher."""
+        await self.flush()
+        self._dispatcher.cancel()
+        try:
+            await self._dispatcher
+        except asyncio.CancelledError:
+            pass
+
+    async def notify(self, project: Project):
+        """
+        Queues a notification to the client of a project, waiting while the queue is full.
+
+        Args:
+            project (Project): The project whose client is notified.
+        """
+        await self._queue.put(project)
+
+    async def flush(self):
+        """
+        Waits until every queued notification has been sent or has failed.
+
+        Raises:
+            Exception: Whatever stopped the dispatcher, e.g. a queued object without a client.
+        """
+        joined = asyncio.create_task(self._queue.join())
+        await asyncio.wait((joined, self._dispatcher), return_when=asyncio.FIRST_COMPLETED)
+        if not joined.done():
+            joined.cancel()
+            self._dispatcher.result()
+
+    async def _dispatch(self):
+        """
+        Takes batches from the queue and starts one send per client.
+        """
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            groups = {}
+            for project in batch:
+                groups.setdefault(project.client, []).append(project)
+            for client, projects in groups.items():
+                await self._slots.acquire()
+                task = asyncio.create_task(self._send(client, projects))
+                self._sending.add(task)
+                task.add_done_callback(self._sending.discard)
+
+    async def _send(self, client, projects):
+        """
+        Sends one grouped notification and frees its slot.
+        """
+        try:
+            await self.sink.send(client, projects)
+        except Exception as exc:
+            self.failures.append((client, projects, exc))
+        finally:
+            self._slots.release()
+            for _ in projects:
+                self._queue.task_done()
+
+
+async def notify_clients(projects, sink, concurrency=10, max_pending=1000):
+    """
+    Notifies the clients of many projects through an AsyncNotifier.
+
+    Args:
+        projects (iterable): The projects whose clients are notified.
+        sink: The object whose send(client, projects) coroutine delivers notifications.
+        concurrency (int, optional): The maximum number of sends in flight. Default is 10.
+        max_pending (int, optional): The maximum number of queued projects. Default is 1000.
+
+    Returns:
+        list: The (client, projects, exception) of every failed send.
+    """
+    async with AsyncNotifier(sink, concurrency, max_pending) as notifier:
+        for project in projects:
+            await notifier.notify(project)
+    return notifier.failures
+
+
+if __name__ == "__main__":
+    # Notify two clients about three projects with two sends
+    sink = MemorySink(latency=0.01)
+    asyncio.run(notify_clients([
+        Project("Django App", 20000, "Globomantics"),
+        Project("Flask API", 8000, "Globomantics"),
+        Project("Mobile App", 12000, "Carved Rock"),
+    ], sink))
+    for client, projects in sink.sent:
+        print(f"Notifying {client} about the progress of {', '.join(project.name for project in projects)} ...")
@@ -0,0 +1,296 @@
+import atexit
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+from itertools import accumulate
+from operator import itemgetter
+from random import getrandbits
+
+_SWAP = sys.byteorder == "big"
+
+
+def _little_endian(typecode, values):
+    """
+    Packs numbers into little-endian bytes.
+    """
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _from_little_endian(typecode, data):
+    """
+    Unpacks numbers from little-endian bytes.
+    """
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if _SWAP:
+        unpacked.byteswap()
+    return unpacked
+
+
+class SalaryAuditLog:
+    """
+    An append-only binary log of every salary written, flushed in batches.
+
+    Writers only append the record to a bounded in-memory buffer; a
+    background thread moves the buffered records to the log file in one
+    write per batch, every flush_interval seconds or as soon as the buffer
+    is half full. When the buffer is full, writers wait for the next flush
+    instead of dropping records. If a flush fails, e.g. with an OSError,
+    the thread stops and the error is raised again by the next record and
+    by close, instead of leaving writers waiting for a flush that never
+    comes.
+
+    The buffer is a deque used as a ring buffer: its append and popleft are
+    atomic, so recording a write takes no lock, which would otherwise cost
+    more than the rest of the setter.
+
+    Every record carries a key identifying its employee, so employees with
+    the same name are told apart. The key is a random 64-bit number given
+    to the employee, as its _audit_key attribute, the first time one of its
+    salaries is recorded, so it stays the same across logs as long as the
+    employee object lives. Nothing about the employee itself is stable
+    enough to derive it from, names are not unique, so the keys only match
+    employees back within the process that wrote them; after a restart a
+    rebuilt log tells employees apart but identifies them by name only.
+
+    Attributes:
+        path (str): The log file. Records are appended to it.
+        capacity (int): The number of records the buffer holds before writers wait.
+        flush_interval (float): The longest time in seconds a record waits in the buffer.
+    """
+
+    MAGIC = b"SAL2"
+    # Every flush appends one batch: the record count and the size of the
+    # UTF-8 names, then the timestamps and salaries as float64, the employee
+    # keys as uint64, the name lengths in characters as uint32 and the names.
+    # Numbers are little-endian.
+    BATCH = struct.Struct("<II")
+
+    def __init__(self, path, capacity=65536, flush_interval=0.1) -> None:
+        """
+        Opens the log for appending and starts the flush thread.
+
+        Args:
+            path (str): The log file, created if it does not exist.
+            capacity (int, optional): The number of records the buffer holds before
+                writers wait. Default is 65536.
+            flush_interval (float, optional): The longest time in seconds a record
+                waits in the buffer. Default is 0.1.
+        """
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = deque()
+        self._high_water = capacity // 2
+        self._not_full = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._error = None
+        self._fp = open(path, "ab")
+        if self._fp.tell() == 0:
+            self._fp.write(self.MAGIC)
+        self._thread = threading.Thread(target=self._run, name="salary-audit-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def key(employee):
+        """
+        Returns the key identifying an employee in audit logs, giving it one if needed.
+
+        Args:
+            employee: The employee.
+
+        Returns:
+            int: The key.
+        """
+        try:
+            return employee._audit_key
+        except AttributeError:
+            employee._audit_key = getrandbits(64)
+            return employee._audit_key
+
+    def record(self, employee, salary):
+        """
+        Appends a salary write to the buffer, waiting while the buffer is full.
+
+        Args:
+            employee: The employee whose salary was written.
+            salary (float): The salary written.
+
+        Raises:
+            ValueError: If the log is closed.
+            Exception: The error that stopped the flush thread, if a flush failed.
+        """
+        if self._closed or self._error is not None:
+            self._check()
+        try:
+            key = employee._audit_key
+        except AttributeError:
+            key = self.key(employee)
+        buffer = self._buffer
+        buffer.append((time.time(), key, employee.name, salary))
+        if len(buffer) >= self._high_water:
+            self._wake.set()
+            if len(buffer) >= self.capacity:
+                with self._not_full:
+                    while len(buffer) >= self.capacity and not self._closed and self._error is None:
+                        self._not_full.wait()
+                if self._error is not None:
+                    raise self._error
+
+    def _check(self):
+        """
+        Raises the error that stopped the flush thread, or ValueError if the log is closed.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise ValueError("The salary audit log is closed")
+
+    def flush(self):
+        """
+        Writes every buffered record to the log file.
+        """
+        with self._write_lock:
+            popleft = self._buffer.popleft
+            # Records appended while draining are left for the next flush
+            batch = [popleft() for _ in range(len(self._buffer))]
+            with self._not_full:
+                self._not_full.notify_all()
+            if not batch:
+                return
+            names = list(map(itemgetter(2), batch))
+            blob = "".join(names).encode()
+            self._fp.write(b"".join((
+                self.BATCH.pack(len(batch), len(blob)),
+                _little_endian("d", map(itemgetter(0), batch)),
+                _little_endian("d", map(itemgetter(3), batch)),
+                _little_endian("Q", map(itemgetter(1), batch)),
+                _little_endian("I", map(len, names)),
+                blob,
+            )))
+            self._fp.flush()
+
+    def _run(self):
+        """
+        Flushes the buffer every flush_interval seconds, or when woken, until closed.
+
+        A failed flush stops the thread; its error is kept for record and
+        close to raise, and writers waiting for room are woken.
+        """
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as error:
+                with self._not_full:
+                    self._error = error
+                    self._not_full.notify_all()
+                return
+
+    def close(self):
+        """
+        Stops the flush thread, writes the remaining records and closes the file.
+
+        Raises:
+            Exception: The error that stopped the flush thread, if a flush failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            self._fp.close()
+            atexit.unregister(self.close)
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        """Returns the log for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the log at the end of a with statement."""
+        self.close()
+
+    @classmethod
+    def replay(cls, path):
+        """
+        Reads back every record of a log, oldest first.
+
+        Args:
+            path (str): The log file.
+
+        Yields:
+            tuple: The timestamp, employee key, name and salary of each write.
+
+        Raises:
+            ValueError: If the file is not a salary log or ends with a partial batch.
+        """
+        with open(path, "rb") as fp:
+            if fp.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not a salary audit log")
+            while True:
+                header = fp.read(cls.BATCH.size)
+                if not header:
+                    return
+                if len(header) < cls.BATCH.size:
+                    raise ValueError(f"{path} ends with a partial batch")
+                count, size = cls.BATCH.unpack(header)
+                data = fp.read(28 * count + size)
+                if len(data) < 28 * count + size:
+                    raise ValueError(f"{path} ends with a partial batch")
+                timestamps = _from_little_endian("d", data[:8 * count])
+                salaries = _from_little_endian("d", data[8 * count:16 * count])
+                keys = _from_little_endian("Q", data[16 * count:24 * count])
+                ends = list(accumulate(_from_little_endian("I", data[24 * count:28 * count])))
+                text = data[28 * count:].decode()
+                names = [text[start:end] for start, end in zip([0] + ends, ends)]
+                yield from zip(timestamps, keys, names, salaries)
+
+    @classmethod
+    def rebuild(cls, path):
+        """
+        Rebuilds the latest name and salary of every employee from a log.
+
+        The keys are those SalaryAuditLog.key gave the employees, so they
+        only identify employee objects of the process that wrote the log.
+
+        Args:
+            path (str): The log file.
+
+        Returns:
+            dict: The last (name, salary) written for each employee key.
+        """
+        return {key: (name, salary) for _, key, name, salary in cls.replay(path)}
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from writeonly import Employee
+
+    # Record every salary write of two namesakes, then rebuild the salaries from the log
+    path = os.path.join(tempfile.mkdtemp(), "salaries.log")
+    Employee.audit_log = SalaryAuditLog(path)
+    abi, other_abi = Employee("Abi", 2000), Employee("Abi", 3000)
+    abi.increase_salary(10)
+    Employee.from_records([("Mary", 3000)])
+    Employee.audit_log.close()
+    Employee.audit_log = None
+    salaries = SalaryAuditLog.rebuild(path)
+    print(salaries[SalaryAuditLog.key(abi)], salaries[SalaryAuditLog.key(other_abi)], len(salaries))
+    os.remove(path)
@@ -0,0 +1,186 @@
+from functools import partial
+from itertools import compress, repeat
+from keyword import iskeyword
+from operator import is_
+from types import FunctionType
+
+from ImplementingClassInheritance import Employee, Tester, Developer
+
+# (method name, number of arguments) -> a comprehension calling the method on every object
+_plain_loops = {}
+
+
+def _increase_salaries(employees, percent):
+    """
+    Runs Employee.increase_salary on a group, giving the same salaries.
+    """
+    rate = percent / 100
+    for employee in employees:
+        employee.salary += employee.salary * rate
+    return [None] * len(employees)
+
+
+def _increase_developer_salaries(developers, percent, bonus=0):
+    """
+    Runs Developer.increase_salary on a group without a super() call per developer.
+    """
+    rate = percent / 100
+    for developer in developers:
+        salary = developer.salary
+        salary += salary * rate
+        developer.salary = salary + bonus
+    return [None] * len(developers)
+
+
+# Methods with a version that runs over a whole group of objects in one call.
+# Keyed by the resolved function, so a subclass overriding the method does
+# not use the batch version of its base.
+BATCH_METHODS = {
+    Employee.increase_salary: _increase_salaries,
+    Developer.increase_salary: _increase_developer_salaries,
+}
+
+
+def resolve(cls, name):
+    """
+    Returns the function a method call on instances of a class runs.
+
+    Plain functions found along the MRO are returned as they are; anything
+    else (static and class methods, other descriptors) is wrapped so it is
+    still called through the instance. Nothing is cached: call_batch
+    resolves once per class and call, so methods replaced on a class, e.g.
+    by Instrumentation or ThreadSafeSalaries, are picked up at once.
+
+    Args:
+        cls (type): The class of the instances.
+        name (str): The method name.
+
+    Returns:
+        callable: Takes the instance followed by the method arguments.
+
+    Raises:
+        AttributeError: If no class in the MRO defines the method.
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            attribute = klass.__dict__[name]
+            break
+    else:
+        raise AttributeError(f"{cls.__name__!r} object has no attribute {name!r}")
+    if isinstance(attribute, FunctionType):
+        return attribute
+
+    def function(obj, *args, **kwargs):
+        return getattr(obj, name)(*args, **kwargs)
+
+    return function
+
+
+def _plain_loop(name, arity):
+    """
+    Returns a function calling a method on every object, like a loop written for it.
+
+    A comprehension naming the method runs faster than one calling getattr,
+    since CPython specializes the attribute load, so one is compiled per
+    method name and number of arguments, as namedtuple compiles its methods.
+    Names that are not identifiers fall back to getattr.
+
+    Args:
+        name (str): The method name.
+        arity (int): The number of arguments passed to every call.
+
+    Returns:
+        function: Takes the objects followed by the arguments.
+    """
+    try:
+        return _plain_loops[name, arity]
+    except KeyError:
+        pass
+    if name.isidentifier() and not iskeyword(name):
+        args = ", ".join(f"arg{i}" for i in range(arity))
+        namespace = {}
+        exec(f"def loop(objects, {args}):\n    return [obj.{name}({args}) for obj in objects]\n", namespace)
+        loop = namespace["loop"]
+    else:
+        def loop(objects, *args):
+            return [getattr(obj, name)(*args) for obj in objects]
+    _plain_loops[name, arity] = loop
+    return loop
+
+
+def _call_group(function, objects, args):
+    """
+    Calls a function on every object with the same arguments.
+
+    Uses the batch version of the function when there is one. Otherwise a
+    comprehension calling the function directly runs faster than map or
+    unpacking *args in every call, so the usual arities get their own loop.
+
+    Args:
+        function (callable): Takes an object followed by the arguments.
+        objects (list): The objects.
+        args (tuple): The arguments.
+
+    Returns:
+        list: The return value of every call.
+    """
+    batch = BATCH_METHODS.get(function)
+    if batch is not None:
+        return batch(objects, *args)
+    if not args:
+        return [function(obj) for obj in objects]
+    if len(args) == 1:
+        (arg,) = args
+        return [function(obj, arg) for obj in objects]
+    return list(map(function, objects, *map(repeat, args)))
+
+
+def call_batch(objects, name, *args):
+    """
+    Calls a method on every object, resolving it once per concrete type.
+
+    The objects are grouped by type and the method is resolved once per
+    group. Groups whose method is in BATCH_METHODS are handed to its batch
+    version in one call; the others call the resolved function directly,
+    skipping the per-object method lookup. The grouping and the merge of
+    the results back into the original order are built from map and
+    compress, so no Python code runs per object for them. Calls run group
+    by group.
+
+    Grouping only pays off when a group runs a batch version, so a method
+    no BATCH_METHODS entry is named after is called object by object, in
+    the original order, like a plain loop.
+
+    Args:
+        objects (iterable): The objects to call the method on.
+        name (str): The method name.
+        *args: The arguments passed to every call.
+
+    Returns:
+        list: The return value of every call, in the order of the objects.
+    """
+    if not any(function.__name__ == name for function in BATCH_METHODS):
+        return _plain_loop(name, len(args))(objects, *args)
+    objects = list(objects)
+    classes = dict.fromkeys(map(type, objects))
+    if len(classes) <= 1:
+        return _call_group(resolve(type(objects[0]), name), objects, args) if objects else []
+    types = list(map(type, objects))
+    returned = False
+    for cls in classes:
+        results = _call_group(resolve(cls, name), list(compress(objects, map(partial(is_, cls), types))), args)
+        returned = returned or results.count(None) != len(results)
+        classes[cls] = iter(results)
+    if not returned:
+        # Methods like increase_salary return None, there is nothing to reorder
+        return [None] * len(objects)
+    # Take the next result of each object's group, in the original order
+    return list(map(next, map(classes.__getitem__, types)))
+
+
+if __name__ == "__main__":
+    # Raise a mixed team in one batch; Tester and Developer resolve different methods
+    team = [Tester("Abi", 23, 1200), Developer("Bill", 44, 200, "JS"), Employee("Mary", 31, 3000)]
+    call_batch(team, "increase_salary", 50)
+    print([employee.salary for employee in team])
+    print(call_batch(team, "has_slots"))
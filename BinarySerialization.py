@@ -0,0 +1,322 @@
+import io
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+
+import ImplementingClassInheritance
+import InstantiatingCustomClasses
+import UsingDataClasses
+
+MAGIC = b"EMPB"
+VERSION = 1
+RECORDS = 1
+PROJECTS = 2
+
+# The classes the codec knows, with their constructor arguments in order and
+# the type of each: "s" str, "i" int, "n" number (int or float), "p" Project.
+# The position of a class in this list is its tag in the stream. A Project
+# on its own is stored as a reference to a project definition.
+SCHEMAS = [
+    (ImplementingClassInheritance.Employee, (("name", "s"), ("age", "i"), ("salary", "n"))),
+    (ImplementingClassInheritance.Tester, (("name", "s"), ("age", "i"), ("salary", "n"))),
+    (ImplementingClassInheritance.Developer, (("name", "s"), ("age", "i"), ("salary", "n"), ("framework", "s"))),
+    (InstantiatingCustomClasses.Employee, (("name", "s"), ("age", "i"), ("salary", "n"), ("position", "s"))),
+    (UsingDataClasses.Employee, (("name", "s"), ("age", "i"), ("salary", "n"), ("project", "p"))),
+    (UsingDataClasses.Project, ((None, "p"),)),
+]
+PROJECT_FIELDS = (("name", "s"), ("payment", "n"), ("client", "s"))
+
+_TAGS = {cls: tag for tag, (cls, _) in enumerate(SCHEMAS)}
+_HEADER = struct.Struct("<4sBH")
+_BLOCK = struct.Struct("<BI")
+_SIZE = struct.Struct("<I")
+_SWAP = sys.byteorder == "big"
+
+
+def _class_path(cls):
+    """
+    Returns the name a class is recorded under in the schema header.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        str: The module and qualified name, e.g. "UsingDataClasses:Project".
+    """
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _spec(fields):
+    """
+    Returns the text form of a schema, e.g. "name:s,age:i".
+    """
+    return ",".join(f"{name}:{kind}" for name, kind in fields)
+
+
+def _to_bytes(typecode, values):
+    """
+    Packs numbers into little-endian bytes.
+    """
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _from_bytes(typecode, data):
+    """
+    Unpacks numbers from little-endian bytes.
+    """
+    unpacked = array(typecode)
+    unpacked.frombytes(data)
+    if _SWAP:
+        unpacked.byteswap()
+    return unpacked
+
+
+def _write_column(write, kind, values):
+    """
+    Writes one field of a block of records as a column.
+
+    Strings are written as their character lengths followed by one UTF-8
+    blob, numbers as an array of doubles with one byte per row telling which
+    were ints, and ints and project ids as plain arrays.
+
+    Args:
+        write (callable): Writes bytes to the stream.
+        kind (str): The field type.
+        values (list): The field value of every record in the block.
+    """
+    if kind == "s":
+        blob = "".join(values).encode()
+        write(_SIZE.pack(len(blob)) + _to_bytes("I", map(len, values)) + blob)
+    elif kind == "n":
+        write(_to_bytes("d", values) + bytes([type(value) is int for value in values]))
+    elif kind == "i":
+        write(_to_bytes("q", values))
+    else:
+        write(_to_bytes("I", values))
+
+
+def _read_column(read, kind, count):
+    """
+    Reads one column written by _write_column.
+
+    Args:
+        read (callable): Reads bytes from the stream.
+        kind (str): The field type.
+        count (int): The number of records in the block.
+
+    Returns:
+        list: The field value of every record in the block.
+    """
+    if kind == "s":
+        (size,) = _SIZE.unpack(read(_SIZE.size))
+        ends = list(accumulate(_from_bytes("I", read(4 * count))))
+        text = read(size).decode()
+        return [text[start:end] for start, end in zip([0] + ends, ends)]
+    if kind == "n":
+        values = _from_bytes("d", read(8 * count)).tolist()
+        ints = read(count)
+        if not any(ints):
+            return values
+        if all(ints):
+            return list(map(int, values))
+        return [int(value) if is_int else value for value, is_int in zip(values, ints)]
+    if kind == "i":
+        return _from_bytes("q", read(8 * count)).tolist()
+    return _from_bytes("I", read(4 * count)).tolist()
+
+
+def _write_header(write):
+    """
+    Writes the magic bytes, the version and the schema of every record type.
+    """
+    write(_HEADER.pack(MAGIC, VERSION, len(SCHEMAS)))
+    for cls, fields in SCHEMAS:
+        for text in (_class_path(cls), _spec(fields)):
+            data = text.encode()
+            write(_SIZE.pack(len(data)) + data)
+
+
+def _read_header(read):
+    """
+    Reads the schema header and checks it matches the known classes.
+
+    Args:
+        read (callable): Reads bytes from the stream.
+
+    Returns:
+        list: The class of every tag used in the stream.
+
+    Raises:
+        ValueError: If the stream is not an employee stream or its schema is unknown.
+    """
+    magic, version, count = _HEADER.unpack(read(_HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not an employee stream of a supported version")
+    known = {_class_path(cls): (cls, fields) for cls, fields in SCHEMAS}
+    classes = []
+    for _ in range(count):
+        path, spec = (read(_SIZE.unpack(read(_SIZE.size))[0]).decode() for _ in range(2))
+        if path not in known:
+            raise ValueError(f"Unknown class {path} in stream")
+        cls, fields = known[path]
+        if spec != _spec(fields):
+            raise ValueError(f"Schema of {path} has changed")
+        classes.append(cls)
+    return classes
+
+
+def encode_stream(objects, fp, block_size=4096):
+    """
+    Writes employees and projects to a binary stream.
+
+    The objects are written in blocks of up to block_size records. A block
+    stores the tag of every record, then the records of each class field by
+    field, so packing is done a column at a time. Every distinct Project is
+    written once, in a project block before the first block that refers to
+    it, and referred to by id afterwards, so shared projects stay shared
+    after decoding.
+
+    Args:
+        objects (iterable): The Employee, Tester, Developer and Project instances.
+        fp (file): The binary stream to write to.
+        block_size (int, optional): The number of records per block. Default is 4096.
+
+    Raises:
+        TypeError: If an object's class has no schema.
+    """
+    write = fp.write
+    _write_header(write)
+    # The id of every project written, with the project itself so its object
+    # id cannot be reused by a new project while the stream is encoded
+    project_ids = {}
+    objects = iter(objects)
+    while True:
+        block = list(islice(objects, block_size))
+        if not block:
+            return
+        groups = {}
+        tags = bytearray()
+        for obj in block:
+            try:
+                tag = _TAGS[type(obj)]
+            except KeyError:
+                raise TypeError(f"Cannot encode {type(obj).__name__} objects") from None
+            tags.append(tag)
+            groups.setdefault(tag, []).append(obj)
+
+        columns = {}
+        new_projects = []
+        for tag, group in groups.items():
+            for name, kind in SCHEMAS[tag][1]:
+                values = group if name is None else [getattr(obj, name) for obj in group]
+                if kind == "p":
+                    ids = []
+                    for project in values:
+                        known = project_ids.get(id(project))
+                        if known is None:
+                            known = project_ids[id(project)] = (len(project_ids), project)
+                            new_projects.append(project)
+                        ids.append(known[0])
+                    values = ids
+                columns[tag, name] = values
+
+        if new_projects:
+            write(_BLOCK.pack(PROJECTS, len(new_projects)))
+            for name, kind in PROJECT_FIELDS:
+                _write_column(write, kind, [getattr(project, name) for project in new_projects])
+        write(_BLOCK.pack(RECORDS, len(block)) + tags)
+        for tag in sorted(groups):
+            for name, kind in SCHEMAS[tag][1]:
+                _write_column(write, kind, columns[tag, name])
+
+
+def decode_stream(fp):
+    """
+    Reads employees and projects back from a binary stream.
+
+    Args:
+        fp (file): The binary stream to read from.
+
+    Yields:
+        The decoded objects, in the order they were encoded.
+    """
+    read = fp.read
+    classes = _read_header(read)
+    projects = []
+    while True:
+        header = read(_BLOCK.size)
+        if not header:
+            return
+        kind, count = _BLOCK.unpack(header)
+        if kind == PROJECTS:
+            columns = [_read_column(read, field, count) for _, field in PROJECT_FIELDS]
+            projects.extend(map(UsingDataClasses.Project, *columns))
+            continue
+        tags = read(count)
+        decoded = {}
+        for tag in sorted(set(tags)):
+            cls = classes[tag]
+            size = tags.count(tag)
+            columns = []
+            for _, field in SCHEMAS[_TAGS[cls]][1]:
+                values = _read_column(read, field, size)
+                if field == "p":
+                    values = [projects[project_id] for project_id in values]
+                columns.append(values)
+            if cls is UsingDataClasses.Project:
+                decoded[tag] = iter(columns[0])
+            else:
+                decoded[tag] = map(cls, *columns)
+        if len(decoded) == 1:
+            yield from decoded[tags[0]]
+        else:
+            for tag in tags:
+                yield next(decoded[tag])
+
+
+def dumps(objects):
+    """
+    Encodes employees and projects to bytes.
+
+    Args:
+        objects (iterable): The objects to encode.
+
+    Returns:
+        bytes: The encoded stream.
+    """
+    fp = io.BytesIO()
+    encode_stream(objects, fp)
+    return fp.getvalue()
+
+
+def loads(data):
+    """
+    Decodes employees and projects from bytes.
+
+    Args:
+        data (bytes): The encoded stream.
+
+    Returns:
+        list: The decoded objects.
+    """
+    return list(decode_stream(io.BytesIO(data)))
+
+
+if __name__ == "__main__":
+    # Round-trip a mixed workforce, including a name eval(repr(...)) cannot handle
+    p = UsingDataClasses.Project("Django App", 20000, "Globomantics")
+    workforce = [
+        ImplementingClassInheritance.Developer("Bill", 44, 200, "JS"),
+        InstantiatingCustomClasses.Employee("Dan O'Brien", 39, 2000.5, "Programmer"),
+        UsingDataClasses.Employee("Abi", 39, 1000, p),
+        UsingDataClasses.Employee("Mary", 25, 1200, p),
+    ]
+    data = dumps(workforce)
+    copy = loads(data)
+    print(len(data), "bytes")
+    print(copy[1])
+    print(copy[2].project, copy[2].project is copy[3].project)
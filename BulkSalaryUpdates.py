@@ -0,0 +1,140 @@
+from array import array
+
+import AccessingClassAttributesMethods
+import ImplementingClassInheritance
+from ColumnarStorage import EmployeeTable, KINDS
+
+# The increase_salary implementations that have a bulk equivalent. The value
+# says whether the implementation adds the bonus after the percentage.
+BULK_FORMULAS = {
+    ImplementingClassInheritance.Employee.increase_salary: False,
+    ImplementingClassInheritance.Developer.increase_salary: True,
+    AccessingClassAttributesMethods.Employee.increase_salary: False,
+}
+_FORMULA_CACHE = {}
+
+
+def _bonus_per_row(bonus, count):
+    """
+    Expands the bonus argument to one value per row.
+
+    Args:
+        bonus (float or sequence or None): A single bonus, one bonus per row, or None.
+        count (int): The number of rows.
+
+    Returns:
+        list: One bonus per row.
+    """
+    if bonus is None:
+        return [0] * count
+    if isinstance(bonus, (int, float)):
+        return [bonus] * count
+    bonus = list(bonus)
+    if len(bonus) != count:
+        raise ValueError(f"Expected {count} bonuses, got {len(bonus)}")
+    return bonus
+
+
+def _check_minimum_wage(salaries, minimum_wage):
+    """
+    Checks every new salary against the minimum wage.
+
+    Args:
+        salaries (list): The new salaries.
+        minimum_wage (float): The lowest salary allowed.
+
+    Raises:
+        ValueError: Listing every row whose new salary is below the minimum wage.
+    """
+    failed = [row for row, salary in enumerate(salaries) if salary < minimum_wage]
+    if failed:
+        raise ValueError(f"Minimum wage is ${minimum_wage}; rows below it: {failed}")
+
+
+def bulk_formula(cls):
+    """
+    Resolves which bulk formula matches the increase_salary of a class.
+
+    Args:
+        cls (type): The class of an employee.
+
+    Returns:
+        bool: True if the class adds a bonus after the percentage.
+
+    Raises:
+        TypeError: If the class overrides increase_salary with no bulk equivalent.
+    """
+    try:
+        return _FORMULA_CACHE[cls]
+    except KeyError:
+        pass
+    method = cls.increase_salary
+    if method not in BULK_FORMULAS:
+        raise TypeError(f"{cls.__name__}.increase_salary has no bulk equivalent")
+    _FORMULA_CACHE[cls] = BULK_FORMULAS[method]
+    return _FORMULA_CACHE[cls]
+
+
+def increase_salary_bulk(employees, percent, bonus=None, minimum_wage=None):
+    """
+    Increases the salary of a whole population in one pass.
+
+    Rows whose class resolves ``increase_salary`` to ``Developer.increase_salary``
+    get the percentage followed by their bonus, every other row gets the base
+    ``Employee.increase_salary`` percentage only, exactly as calling the method
+    on each instance would. All new salaries are checked against the minimum
+    wage before any of them is written, so a failure leaves every row untouched.
+
+    Args:
+        employees (EmployeeTable or iterable): The employees to give a raise to.
+        percent (float): The percentage to increase the salaries by.
+        bonus (float or sequence, optional): A bonus for every developer, or one bonus per row.
+        minimum_wage (float, optional): The lowest salary allowed.
+            Default is the current ``Employee.minimum_wage`` of AccessingClassAttributesMethods.
+
+    Returns:
+        list: The new salaries, in row order.
+
+    Raises:
+        ValueError: If any new salary is below the minimum wage.
+        TypeError: If an employee overrides increase_salary with no bulk equivalent.
+    """
+    if minimum_wage is None:
+        minimum_wage = AccessingClassAttributesMethods.Employee.minimum_wage
+    if isinstance(employees, EmployeeTable):
+        salaries = employees.salaries
+        with_bonus = [BULK_FORMULAS[KINDS[kind].increase_salary] for kind in employees.kinds]
+    else:
+        employees = list(employees)
+        salaries = [employee.salary for employee in employees]
+        with_bonus = [bulk_formula(type(employee)) for employee in employees]
+    bonuses = _bonus_per_row(bonus, len(salaries))
+
+    new_salaries = [
+        salary + salary * (percent / 100) + extra if developer else salary + salary * (percent / 100)
+        for salary, developer, extra in zip(salaries, with_bonus, bonuses)
+    ]
+    _check_minimum_wage(new_salaries, minimum_wage)
+
+    if isinstance(employees, EmployeeTable):
+        employees.salaries[:] = array("d", new_salaries)
+    else:
+        for employee, salary in zip(employees, new_salaries):
+            employee.salary = salary
+    return new_salaries
+
+
+if __name__ == "__main__":
+    # Give a raise to a mixed table of testers and developers
+    table = EmployeeTable([
+        ImplementingClassInheritance.Tester("Abi", 23, 1200),
+        ImplementingClassInheritance.Developer("Bill", 44, 1500, "JS"),
+    ])
+    print(increase_salary_bulk(table, 10, bonus=100))
+
+    # A raise that leaves rows below the minimum wage is rejected as a whole
+    try:
+        increase_salary_bulk(table, -50, minimum_wage=1000)
+    except ValueError as error:
+        print(error)
+    print(list(table.salaries))
@@ -0,0 +1,239 @@
+import asyncio
+import threading
+from collections import OrderedDict, namedtuple
+
+from ImplementingClassInheritance import Developer
+from InstantiatingCustomClasses import Employee
+from WatchingAttributes import watch, unwatch
+
+# One attribute change: old is the value before the first write since the
+# last drain, WatchingAttributes.MISSING for an attribute set for the first
+# time, and new the value of the last write.
+ChangeEvent = namedtuple("ChangeEvent", ("employee", "name", "old", "new"))
+
+
+class ChangeFeed:
+    """
+    A bounded, coalescing queue of the attribute changes of subscribed classes.
+
+    subscribe watches attributes of a class, e.g. salary and position, so
+    every assignment, including those made by setters and increase_salary,
+    queues a ChangeEvent. Events are keyed by employee and attribute, and a
+    later write to the same attribute before the next drain only updates the
+    new value of the queued event, so a consumer sees one event per changed
+    attribute however often it changed. Events hold the employees and values
+    themselves, nothing is copied.
+
+    Classes are only wrapped while subscribed: before subscribe and after
+    close their attributes are the original ones and cost nothing extra,
+    except that instances without slots assigned while subscribed keep the
+    __dict__ the watch wrapper created, which CPython assigns to slower
+    than its inline attribute storage.
+
+    When the queue is full the oldest event is dropped to make room and
+    counted in dropped; a consumer that sees it grow has missed changes and
+    should resynchronize, e.g. with a full scan.
+
+    Attributes:
+        maxsize (int): The maximum number of queued events.
+        dropped (int): The number of events dropped because the queue was full.
+    """
+
+    def __init__(self, maxsize=10000) -> None:
+        """
+        Initializes a ChangeFeed object.
+
+        Args:
+            maxsize (int, optional): The maximum number of queued events. Default is 10000.
+        """
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._subscribed = set()
+        # Called when an event is queued into an empty queue, to wake an async consumer
+        self._wakeup = None
+        self._closed = False
+
+    def subscribe(self, cls, names=("salary",)):
+        """
+        Queues the changes of attributes of a class and its subclasses.
+
+        Args:
+            cls (type): The class to watch.
+            names (iterable, optional): The attributes to watch. Default is salary.
+        """
+        for name in names:
+            if (cls, name) not in self._subscribed:
+                watch(cls, name, self._record)
+                self._subscribed.add((cls, name))
+        with self._lock:
+            self._closed = False
+
+    def unsubscribe(self, cls, names=None):
+        """
+        Stops queueing the changes of attributes of a class.
+
+        Events already queued stay in the queue.
+
+        Args:
+            cls (type): A subscribed class.
+            names (iterable, optional): The attributes to stop watching. Default is
+                every subscribed attribute of the class.
+        """
+        if names is None:
+            names = [name for klass, name in self._subscribed if klass is cls]
+        for name in names:
+            self._subscribed.remove((cls, name))
+            unwatch(cls, name, self._record)
+
+    def _record(self, employee, name, old, new):
+        """
+        Queues a change, coalescing it with a queued change of the same attribute.
+        """
+        key = (id(employee), name)
+        with self._lock:
+            pending = self._pending
+            queued = pending.get(key)
+            if queued is not None:
+                queued[3] = new
+                return
+            if len(pending) >= self.maxsize:
+                pending.popitem(last=False)
+                self.dropped += 1
+            # A list, so coalescing can update it in place; drain makes it a ChangeEvent
+            pending[key] = [employee, name, old, new]
+            wakeup = self._wakeup if len(pending) == 1 else None
+        if wakeup is not None:
+            wakeup()
+
+    def drain(self, max_events=None):
+        """
+        Takes queued events, oldest first.
+
+        Args:
+            max_events (int, optional): The maximum number of events to take.
+                Default is every queued event.
+
+        Returns:
+            list: The events.
+        """
+        with self._lock:
+            pending = self._pending
+            if max_events is None or max_events >= len(pending):
+                self._pending = OrderedDict()
+                queued = pending.values()
+            else:
+                queued = [pending.popitem(last=False)[1] for _ in range(max_events)]
+        return list(map(ChangeEvent._make, queued))
+
+    async def next_batch(self, max_events=None):
+        """
+        Waits until events are queued, then takes them like drain.
+
+        Changes recorded in other threads wake the waiting consumer too. A
+        feed has a single consumer: only one call may wait at a time.
+
+        Args:
+            max_events (int, optional): The maximum number of events to take.
+                Default is every queued event.
+
+        Returns:
+            list: The events, or an empty list once the feed is closed.
+
+        Raises:
+            RuntimeError: If another call is already waiting for events.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self.drain(max_events)
+            if batch:
+                return batch
+            ready = asyncio.Event()
+            with self._lock:
+                if self._pending:
+                    # Events arrived since the drain
+                    continue
+                if self._closed:
+                    return batch
+                if self._wakeup is not None:
+                    raise RuntimeError("Another consumer is already waiting for events of this feed")
+                self._wakeup = lambda: loop.call_soon_threadsafe(ready.set)
+            try:
+                await ready.wait()
+            finally:
+                with self._lock:
+                    self._wakeup = None
+
+    async def batches(self, max_events=None):
+        """
+        Yields batches of events as they are queued, until the feed is closed.
+
+        Args:
+            max_events (int, optional): The maximum number of events per batch.
+                Default is every queued event.
+
+        Yields:
+            list: The events of one batch.
+        """
+        while True:
+            batch = await self.next_batch(max_events)
+            if not batch:
+                return
+            yield batch
+
+    def close(self):
+        """
+        Stops watching every subscribed class and ends the async batches once drained.
+        """
+        for cls, name in self._subscribed:
+            unwatch(cls, name, self._record)
+        self._subscribed.clear()
+        with self._lock:
+            self._closed = True
+            wakeup = self._wakeup
+        if wakeup is not None:
+            wakeup()
+
+    def __len__(self) -> int:
+        """Returns the number of queued events."""
+        return len(self._pending)
+
+    def __enter__(self):
+        """Returns the feed for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the feed at the end of a with statement."""
+        self.close()
+
+
+if __name__ == "__main__":
+    # Follow salary and position changes, coalesced between drains
+    feed = ChangeFeed()
+    feed.subscribe(Employee, ("salary", "position"))
+    feed.subscribe(Developer, ("salary", "framework"))
+    abi = Employee("Abi", 39, 2000, "Programmer")
+    bill = Developer("Bill", 44, 2000, "JS")
+    feed.drain()
+    abi.increase_salary(10)
+    abi.increase_salary(10)
+    abi.position = "Manager"
+    bill.framework = "Python"
+    for event in feed.drain():
+        print(event.employee.name, event.name, event.old, event.new)
+
+    # Read the changes asynchronously in batches while they are made
+    async def consume():
+        async for batch in feed.batches():
+            print([(event.employee.name, event.name, event.new) for event in batch])
+
+    async def main():
+        consumer = asyncio.create_task(consume())
+        for percent in (5, 10):
+            bill.increase_salary(percent, 100)
+            await asyncio.sleep(0)
+        feed.close()
+        await consumer
+
+    asyncio.run(main())
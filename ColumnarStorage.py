@@ -0,0 +1,266 @@
+import sys
+from array import array
+
+from ImplementingClassInheritance import Employee, Tester, Developer
+
+
+class _RowView:
+    """
+    A mixin that redirects the slotted Employee attributes to a column store.
+
+    Subclasses shadow the ``name``, ``age`` and ``salary`` slots of Employee
+    with properties, so every inherited method (``increase_salary``,
+    ``has_slots``, ...) reads and writes the store instead of the instance.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, store, index) -> None:
+        """
+        Initializes a row view.
+
+        Args:
+            store: The column store holding the row.
+            index (int): The position of the row in the store.
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def name(self):
+        """Gets the name from the store."""
+        return self._store.name_at(self._index)
+
+    @name.setter
+    def name(self, name):
+        """Writes the name to the store."""
+        self._store.set_name_at(self._index, name)
+
+    @property
+    def age(self):
+        """Gets the age from the store."""
+        return self._store.age_at(self._index)
+
+    @age.setter
+    def age(self, age):
+        """Writes the age to the store."""
+        self._store.set_age_at(self._index, age)
+
+    @property
+    def salary(self):
+        """Gets the salary from the store."""
+        return self._store.salary_at(self._index)
+
+    @salary.setter
+    def salary(self, salary):
+        """Writes the salary to the store."""
+        self._store.set_salary_at(self._index, salary)
+
+    def __repr__(self) -> str:
+        """Returns the row class, index and store of the view."""
+        return f"<{type(self).__name__} {self._index} of {self._store!r}>"
+
+
+class EmployeeRow(_RowView, Employee):
+    """
+    A row view that behaves like an Employee.
+    """
+
+    __slots__ = ("_store", "_index")
+
+
+class TesterRow(_RowView, Tester):
+    """
+    A row view that behaves like a Tester.
+    """
+
+    __slots__ = ("_store", "_index")
+
+
+class DeveloperRow(_RowView, Developer):
+    """
+    A row view that behaves like a Developer.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    @property
+    def framework(self):
+        """Gets the framework from the store."""
+        return self._store.framework_at(self._index)
+
+    @framework.setter
+    def framework(self, framework):
+        """Writes the framework to the store."""
+        self._store.set_framework_at(self._index, framework)
+
+
+# Kind codes stored in the ``kinds`` column, in the order they are checked
+KINDS = (Developer, Tester, Employee)
+ROW_TYPES = (DeveloperRow, TesterRow, EmployeeRow)
+NO_FRAMEWORK = -1
+
+
+class EmployeeTable:
+    """
+    A columnar container for Employee, Tester and Developer records.
+
+    Instead of one Python object per record, the table keeps one column per
+    attribute: interned names, ``age`` as int16, ``salary`` as float64 and
+    ``framework`` as a categorical code into ``frameworks``. Indexing the
+    table hands out lightweight row views that pass ``isinstance`` checks for
+    the class the record was added as.
+
+    Attributes:
+        names (list): The interned names of the employees.
+        ages (array): The ages of the employees (int16).
+        salaries (array): The salaries of the employees (float64).
+        kinds (array): Index into KINDS for each row.
+        framework_codes (array): Index into frameworks, or -1 for non developers.
+        frameworks (list): The distinct frameworks seen so far.
+    """
+
+    def __init__(self, employees=()) -> None:
+        """
+        Initializes an EmployeeTable object.
+
+        Args:
+            employees (iterable, optional): Employees to copy into the table.
+        """
+        self.names = []
+        self.ages = array("h")
+        self.salaries = array("d")
+        self.kinds = array("b")
+        self.framework_codes = array("h")
+        self.frameworks = []
+        self._framework_index = {}
+        for employee in employees:
+            self.append(employee)
+
+    def add(self, name, age, salary, kind=Employee, framework=None):
+        """
+        Adds a record to the table without creating an instance first.
+
+        Args:
+            name (str): The name of the employee.
+            age (int): The age of the employee.
+            salary (float): The salary of the employee.
+            kind (type, optional): Employee, Tester or Developer. Default is Employee.
+            framework (str, optional): The framework of a Developer.
+
+        Returns:
+            int: The index of the new row.
+        """
+        self.names.append(sys.intern(name))
+        self.ages.append(age)
+        self.salaries.append(salary)
+        self.kinds.append(KINDS.index(kind))
+        if kind is Developer:
+            self.framework_codes.append(self._framework_code(framework))
+        else:
+            self.framework_codes.append(NO_FRAMEWORK)
+        return len(self.names) - 1
+
+    def append(self, employee):
+        """
+        Copies an Employee, Tester or Developer instance into the table.
+
+        Args:
+            employee (Employee): The instance to copy.
+
+        Returns:
+            int: The index of the new row.
+        """
+        for kind in KINDS:
+            if isinstance(employee, kind):
+                break
+        framework = employee.framework if kind is Developer else None
+        return self.add(employee.name, employee.age, employee.salary, kind, framework)
+
+    def _framework_code(self, framework):
+        """Returns the categorical code for a framework, adding it if new."""
+        code = self._framework_index.get(framework)
+        if code is None:
+            code = self._framework_index[framework] = len(self.frameworks)
+            self.frameworks.append(framework)
+        return code
+
+    def name_at(self, index):
+        """Returns the name stored at the given row."""
+        return self.names[index]
+
+    def set_name_at(self, index, name):
+        """Stores an interned name at the given row."""
+        self.names[index] = sys.intern(name)
+
+    def age_at(self, index):
+        """Returns the age stored at the given row."""
+        return self.ages[index]
+
+    def set_age_at(self, index, age):
+        """Stores an age at the given row."""
+        self.ages[index] = age
+
+    def salary_at(self, index):
+        """Returns the salary stored at the given row."""
+        return self.salaries[index]
+
+    def set_salary_at(self, index, salary):
+        """Stores a salary at the given row."""
+        self.salaries[index] = salary
+
+    def framework_at(self, index):
+        """Returns the framework of the developer at the given row."""
+        code = self.framework_codes[index]
+        if code == NO_FRAMEWORK:
+            raise AttributeError("framework")
+        return self.frameworks[code]
+
+    def set_framework_at(self, index, framework):
+        """Stores the framework of the developer at the given row."""
+        self.framework_codes[index] = self._framework_code(framework)
+
+    def __len__(self) -> int:
+        """Returns the number of records in the table."""
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Returns a row view for the record at the given index.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            Employee: An EmployeeRow, TesterRow or DeveloperRow view.
+        """
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError("EmployeeTable index out of range")
+        return ROW_TYPES[self.kinds[index]](self, index)
+
+    def __iter__(self):
+        """Yields a row view for every record in the table."""
+        for index, kind in enumerate(self.kinds):
+            yield ROW_TYPES[kind](self, index)
+
+    def __repr__(self) -> str:
+        """Returns the number of rows in the table."""
+        return f"<EmployeeTable with {len(self)} rows>"
+
+
+if __name__ == "__main__":
+    # Copy a few employees into a table
+    table = EmployeeTable([Tester("Abi", 23, 1200), Developer("Bill", 44, 200, "JS")])
+    table.add("Mary", 31, 3000)
+
+    # Row views behave like the original instances
+    d = table[1]
+    d.increase_salary(50, 50)
+    print(d.name, d.salary, d.framework)
+    print(isinstance(d, Developer), isinstance(table[0], Tester))
+    print(d.has_slots())
+
+    # The data lives in the columns
+    print(table.salaries)
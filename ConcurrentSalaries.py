@@ -0,0 +1,265 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+
+import ImplementingClassInheritance
+from WatchingAttributes import MISSING, class_attribute, defining_class, replace_class_attribute
+
+
+class StripedLocks:
+    """
+    A fixed set of locks shared by all employees, picked by employee id.
+
+    One lock per employee would cost memory for every instance, and one
+    lock for all of them makes every thread wait for every other. With
+    stripes, two threads only wait for each other when their employees map
+    to the same lock. The locks are reentrant, so a locked increase_salary
+    can call the locked salary setter.
+
+    Attributes:
+        stripes (int): The number of locks.
+    """
+
+    def __init__(self, stripes=64) -> None:
+        """
+        Initializes a StripedLocks object.
+
+        Args:
+            stripes (int, optional): The number of locks. Default is 64.
+        """
+        self.stripes = stripes
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def index(self, employee):
+        """
+        Returns the stripe of an employee.
+
+        Object ids are addresses aligned to 16 bytes, so their low bits are
+        dropped before picking the stripe.
+        """
+        return (id(employee) >> 4) % self.stripes
+
+    def lock(self, employee):
+        """
+        Returns the lock guarding an employee.
+
+        Args:
+            employee: The employee.
+
+        Returns:
+            threading.RLock: The lock of its stripe.
+        """
+        return self._locks[self.index(employee)]
+
+    @contextmanager
+    def holding(self, employees):
+        """
+        Holds the locks of many employees for the duration of a with block.
+
+        The stripes are acquired in ascending order, so two threads holding
+        overlapping batches cannot deadlock.
+
+        Args:
+            employees (iterable): The employees to lock.
+        """
+        stripes = sorted({self.index(employee) for employee in employees})
+        locks = [self._locks[stripe] for stripe in stripes]
+        acquired = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+
+class ThreadSafeSalaries:
+    """
+    Makes salary updates of Employee classes safe to run from many threads.
+
+    install swaps, at class level, increase_salary for a version holding
+    the employee's stripe lock around its read-modify-write, and the salary
+    attribute for one whose setter holds the same lock. Concurrent raises
+    and assignments to one employee then run one after the other instead
+    of losing updates, while updates of employees on other stripes run in
+    parallel on free-threaded builds. Classes not installed keep their
+    original, lock-free code. Salary reads do not take the lock.
+
+    Attributes:
+        locks (StripedLocks): The locks guarding the employees.
+    """
+
+    def __init__(self, locks=None) -> None:
+        """
+        Initializes a ThreadSafeSalaries object.
+
+        Args:
+            locks (StripedLocks, optional): The locks to use. Default is a new
+                StripedLocks with 64 stripes.
+        """
+        self.locks = locks if locks is not None else StripedLocks()
+        # (owner, name) -> (the attribute replaced, the wrapper installed)
+        self._installed = {}
+
+    def install(self, cls, assignments=True):
+        """
+        Makes increase_salary and salary assignments of a class take the employee's lock.
+
+        The attributes are replaced on the classes defining them, so their
+        subclasses are covered too. Locking assignments puts a property in
+        front of every salary read and write, which costs more than the
+        locking itself; callers that only assign salaries through
+        set_salaries can leave it out.
+
+        Args:
+            cls (type): An Employee class.
+            assignments (bool, optional): Also lock salary assignments. Default is True.
+        """
+        for name in ("increase_salary", "salary") if assignments else ("increase_salary",):
+            owner = defining_class(cls, name)
+            if (owner, name) in self._installed:
+                continue
+            # A watched attribute is locked inside its watch wrapper
+            original = class_attribute(owner, name)
+            if name == "increase_salary":
+                if original is None:
+                    continue
+                wrapper = self._locked_method(original)
+            else:
+                wrapper = self._locked_attribute(name, original)
+            replace_class_attribute(owner, name, wrapper)
+            self._installed[owner, name] = (original, wrapper)
+
+    def _locked_method(self, func):
+        """
+        Wraps a method so it runs holding the lock of its instance.
+        """
+        lock = self.locks.lock
+
+        @wraps(func)
+        def locked(self, *args, **kwargs):
+            with lock(self):
+                return func(self, *args, **kwargs)
+
+        return locked
+
+    def _locked_attribute(self, name, original):
+        """
+        Wraps an attribute in a property whose setter holds the lock of its instance.
+
+        A plain instance attribute, without a class-level descriptor, is kept
+        in the instance __dict__ as before.
+        """
+        lock = self.locks.lock
+        if original is None:
+            def fget(obj):
+                try:
+                    return obj.__dict__[name]
+                except KeyError:
+                    raise AttributeError(name) from None
+
+            def put(obj, value):
+                obj.__dict__[name] = value
+        else:
+            get = original.__get__
+            put = original.__set__
+
+            def fget(obj):
+                return get(obj)
+
+        def fset(obj, value):
+            with lock(obj):
+                put(obj, value)
+
+        return property(fget, fset, doc=getattr(original, "__doc__", None))
+
+    def uninstall(self):
+        """
+        Restores the original attributes of every installed class.
+        """
+        for (owner, name), (original, wrapper) in self._installed.items():
+            if class_attribute(owner, name) is wrapper:
+                replace_class_attribute(owner, name, original)
+        self._installed.clear()
+
+    def increase_salaries(self, employees, *args):
+        """
+        Raises many salaries atomically.
+
+        The locks of every employee are held for the whole batch, so no
+        other locked update of these employees runs in between. If a raise
+        fails, e.g. on a minimum wage check, the salaries already raised and
+        the one that failed are restored and the error is raised again;
+        salaries that cannot be read, like those of writeonly employees,
+        cannot be restored.
+
+        Args:
+            employees (iterable): The employees to raise.
+            *args: The arguments of increase_salary, e.g. the percentage.
+        """
+        employees = list(employees)
+        with self.locks.holding(employees):
+            previous = [getattr(employee, "salary", MISSING) for employee in employees]
+            done = 0
+            try:
+                for employee in employees:
+                    employee.increase_salary(*args)
+                    done += 1
+            except BaseException:
+                # The employee that failed may have been changed halfway
+                for employee, salary in zip(employees[:done + 1], previous):
+                    if salary is not MISSING:
+                        employee.salary = salary
+                raise
+
+    def set_salaries(self, salaries):
+        """
+        Assigns many salaries atomically.
+
+        Args:
+            salaries (dict or iterable): The new salary of each employee, as a
+                dict or as (employee, salary) pairs.
+
+        Raises:
+            ValueError: If a salary is rejected by the setter; no salary is changed then.
+        """
+        pairs = list(salaries.items() if isinstance(salaries, dict) else salaries)
+        employees = [employee for employee, _ in pairs]
+        with self.locks.holding(employees):
+            previous = [getattr(employee, "salary", MISSING) for employee in employees]
+            done = 0
+            try:
+                for employee, salary in pairs:
+                    employee.salary = salary
+                    done += 1
+            except BaseException:
+                # The employee that failed may have been changed halfway
+                for employee, salary in zip(employees[:done + 1], previous):
+                    if salary is not MISSING:
+                        employee.salary = salary
+                raise
+
+    def __enter__(self):
+        """Returns the object for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Restores the original attributes at the end of a with statement."""
+        self.uninstall()
+
+
+if __name__ == "__main__":
+    # Raise one developer from eight threads at once without losing an update
+    with ThreadSafeSalaries() as safe:
+        safe.install(ImplementingClassInheritance.Developer)
+        bill = ImplementingClassInheritance.Developer("Bill", 44, 1000.0, "JS")
+        with ThreadPoolExecutor(8) as pool:
+            for _ in range(1000):
+                pool.submit(bill.increase_salary, 0, 1)
+        print(bill.salary)
+        team = [bill, ImplementingClassInheritance.Tester("Abi", 23, 1200.0)]
+        safe.increase_salaries(team, 10)
+        print([employee.salary for employee in team])
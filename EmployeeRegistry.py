@@ -0,0 +1,276 @@
+from ImplementingClassInheritance import Developer
+from InstantiatingCustomClasses import Employee
+from SortedIndex import SortedIndex
+from WatchingAttributes import MISSING, defining_class, watch, unwatch
+
+# The attributes looked up by value, and the ones queried by range
+HASHED = ("position", "framework")
+SORTED = ("age", "salary")
+
+_LOWEST = (float("-inf"),)
+_HIGHEST = (float("inf"),)
+
+
+class EmployeeRegistry:
+    """
+    A set of employees indexed for fast queries by position, framework, age and salary.
+
+    Positions and frameworks are kept in hash indexes mapping each value to
+    the ids of its employees. Ages and salaries are kept in sorted indexes of
+    (value, id) keys, so range queries cost O(log n + k). The indexed
+    attributes an employee has are watched, so assignments, including those
+    made by the salary setter and increase_salary, keep the indexes up to
+    date. Like the salary index of AccessingClassAttributesMethods, the
+    sorted indexes are only brought up to date by the next query that uses
+    them, so repeated raises cost a dict write each.
+
+    Attributes:
+        hashed (dict): For each hashed attribute, the ids of the employees with each value.
+        sorted (dict): For each sorted attribute, a SortedIndex of (value, id) keys.
+    """
+
+    def __init__(self, employees=()) -> None:
+        """
+        Initializes an EmployeeRegistry object.
+
+        Args:
+            employees (iterable, optional): The employees to register.
+        """
+        self._members = {}
+        self._values = {name: {} for name in HASHED + SORTED}
+        # For each sorted attribute, the value still in the index of every changed employee
+        self._stale = {name: {} for name in SORTED}
+        self._watched = set()
+        self.hashed = {name: {} for name in HASHED}
+        self.sorted = {name: SortedIndex() for name in SORTED}
+        self.update(employees)
+
+    def _watch(self, cls, names):
+        """
+        Starts watching attributes of a class, once per defining class.
+        """
+        for name in names:
+            owner = defining_class(cls, name)
+            if (owner, name) not in self._watched:
+                watch(owner, name, self._changed)
+                self._watched.add((owner, name))
+
+    def _changed(self, obj, name, old, new):
+        """
+        Records the new value of a changed attribute of a registered employee.
+
+        The previous value is taken from the registry rather than old, so a
+        second call for the same assignment, e.g. from a base and a subclass
+        both being watched, changes nothing.
+        """
+        key = id(obj)
+        if self._members.get(key) is not obj:
+            return
+        values = self._values[name]
+        current = values.get(key, MISSING)
+        if current is not MISSING and current == new:
+            return
+        values[key] = new
+        if name in self.hashed:
+            index = self.hashed[name]
+            if current is not MISSING:
+                self._discard(index, current, key)
+            index.setdefault(new, set()).add(key)
+        else:
+            self._stale[name].setdefault(key, current)
+
+    @staticmethod
+    def _discard(index, value, key):
+        """
+        Removes an id from a hash index, dropping the value once it has no ids left.
+        """
+        ids = index[value]
+        ids.discard(key)
+        if not ids:
+            del index[value]
+
+    def _flush(self, name):
+        """
+        Brings a sorted index up to date with the values changed since the last query.
+
+        Args:
+            name (str): The sorted attribute.
+        """
+        stale = self._stale[name]
+        if not stale:
+            return
+        index = self.sorted[name]
+        values = self._values[name]
+        # Past a point one bulk rebuild is cheaper than a removal and an insertion per change
+        if len(stale) * 20 > len(index):
+            self.sorted[name] = SortedIndex([(value, key) for key, value in values.items()], index.load)
+        else:
+            for key, indexed in stale.items():
+                if indexed is not MISSING:
+                    index.remove((indexed, key))
+                value = values.get(key, MISSING)
+                if value is not MISSING:
+                    index.add((value, key))
+        stale.clear()
+
+    def add(self, employee):
+        """
+        Registers an employee.
+
+        Args:
+            employee: The employee to register.
+        """
+        self.update((employee,))
+
+    def update(self, employees):
+        """
+        Registers many employees, building the sorted indexes in bulk.
+
+        Args:
+            employees (iterable): The employees to register.
+        """
+        groups = {}
+        for employee in employees:
+            key = id(employee)
+            if key not in self._members:
+                self._members[key] = employee
+                groups.setdefault(type(employee), []).append((key, employee))
+        new_keys = {name: [] for name in SORTED}
+        # Read one attribute of one class at a time, which keeps the loops tight
+        for cls, group in groups.items():
+            names = []
+            for name in HASHED + SORTED:
+                column = [(key, getattr(employee, name, MISSING)) for key, employee in group]
+                column = [(key, value) for key, value in column if value is not MISSING]
+                if not column:
+                    continue
+                names.append(name)
+                self._values[name].update(column)
+                if name in self.hashed:
+                    index = self.hashed[name]
+                    for key, value in column:
+                        index.setdefault(value, set()).add(key)
+                else:
+                    # A reused id of a removed employee is still in the index, the flush replaces it
+                    stale = self._stale[name]
+                    new_keys[name] += [(value, key) for key, value in column if key not in stale]
+            self._watch(cls, names)
+        for name, keys in new_keys.items():
+            self.sorted[name].update(keys)
+
+    def remove(self, employee):
+        """
+        Unregisters an employee.
+
+        Args:
+            employee: The employee to unregister.
+
+        Raises:
+            KeyError: If the employee is not registered.
+        """
+        key = id(employee)
+        if self._members.get(key) is not employee:
+            raise KeyError(employee)
+        del self._members[key]
+        for name, values in self._values.items():
+            value = values.pop(key, MISSING)
+            if value is MISSING:
+                continue
+            if name in self.hashed:
+                self._discard(self.hashed[name], value, key)
+            else:
+                self._stale[name].setdefault(key, value)
+
+    def find(self, cls=None, **conditions):
+        """
+        Returns the registered employees matching every condition.
+
+        Hashed attributes are matched by value and sorted attributes by a
+        (low, high) range, where low is inclusive, high exclusive and either
+        can be None. The query starts from whichever index gives the fewest
+        candidates and checks the other conditions against the other hash
+        indexes and the values kept by the registry.
+
+        Args:
+            cls (type, optional): Only return instances of this class.
+            **conditions: E.g. framework="JS", salary=(3000, None).
+
+        Returns:
+            list: The matching employees, in no particular order.
+
+        Raises:
+            ValueError: If a condition is on an attribute that is not indexed.
+        """
+        for name in conditions:
+            if name not in self._values:
+                raise ValueError(f"{name} is not indexed")
+        plans = []
+        for name, value in conditions.items():
+            if name in self.hashed:
+                ids = self.hashed[name].get(value, ())
+                plans.append((len(ids), name, ids))
+            else:
+                self._flush(name)
+                low, high = value
+                bounds = (_LOWEST if low is None else (low,), _HIGHEST if high is None else (high,))
+                plans.append((self.sorted[name].count(*bounds), name, bounds))
+
+        if plans:
+            _, first, start = min(plans, key=lambda plan: plan[0])
+            if first in self.sorted:
+                start = [key for _, key in self.sorted[first].between(*start)]
+        else:
+            first, start = None, self._members
+
+        sets = [ids for _, name, ids in plans if name != first and name in self.hashed]
+        ranges = [(self._values[name], *conditions[name])
+                  for _, name, _ in plans if name != first and name in self.sorted]
+        members = self._members
+        found = []
+        for key in start:
+            if not all(key in ids for ids in sets):
+                continue
+            for values, low, high in ranges:
+                value = values.get(key, MISSING)
+                if value is MISSING or (low is not None and value < low) or (high is not None and value >= high):
+                    break
+            else:
+                employee = members[key]
+                if cls is None or isinstance(employee, cls):
+                    found.append(employee)
+        return found
+
+    def close(self):
+        """
+        Stops watching the indexed attributes, the indexes are no longer kept up to date.
+        """
+        for owner, name in self._watched:
+            unwatch(owner, name, self._changed)
+        self._watched.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of registered employees."""
+        return len(self._members)
+
+    def __contains__(self, employee) -> bool:
+        """Checks whether an employee is registered."""
+        return self._members.get(id(employee)) is employee
+
+
+if __name__ == "__main__":
+    # Index a small workforce and query it
+    registry = EmployeeRegistry([
+        Employee("Abi", 39, 2000, "Programmer"),
+        Employee("Bob", 23, 1000, "Driver"),
+        Employee("Mary", 31, 3000, "Driver"),
+        Developer("Bill", 44, 2000, "JS"),
+        Developer("Anna", 29, 3500, "Django"),
+    ])
+    print(registry.find(position="Driver", age=(None, 25)))
+    print([d.name for d in registry.find(Developer, framework="JS", salary=(2500, None))])
+
+    # Raises keep the indexes up to date
+    bill = registry.find(framework="JS")[0]
+    bill.increase_salary(50, 50)
+    print([d.name for d in registry.find(Developer, framework="JS", salary=(2500, None))])
+    registry.close()
@@ -0,0 +1,202 @@
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import accumulate
+
+from ColumnarStorage import EmployeeTable, NO_FRAMEWORK, ROW_TYPES
+from ImplementingClassInheritance import Tester, Developer
+
+MAGIC = b"EMPS"
+VERSION = 1
+BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+# magic, version, byte order, padding, row count, heap size, framework table size
+_HEADER = struct.Struct("<4sBBxxQQQ")
+
+
+def _padded(size):
+    """
+    Rounds a size up to a multiple of 8 so the next column stays aligned.
+    """
+    return (size + 7) & ~7
+
+
+def write_snapshot(path, employees):
+    """
+    Writes employees to a snapshot file.
+
+    The file holds a header, the framework names, then one fixed-width
+    column per attribute (salaries as float64, name offsets as uint64, ages
+    and framework codes as int16, kinds as uint8) and finally a heap with
+    the UTF-8 names. Every column starts on an 8 byte boundary so it can be
+    mapped straight into a typed memoryview.
+
+    Args:
+        path (str): The file to write.
+        employees (EmployeeTable or iterable): The employees to save, e.g. the rows of another snapshot.
+    """
+    table = employees if isinstance(employees, EmployeeTable) else EmployeeTable(employees)
+    names = [name.encode() for name in table.names]
+    offsets = array("Q", [0])
+    offsets.extend(accumulate(map(len, names)))
+    frameworks = "\0".join(table.frameworks).encode()
+    heap = b"".join(names)
+    columns = [
+        frameworks,
+        table.salaries.tobytes(),
+        offsets.tobytes(),
+        table.ages.tobytes(),
+        table.framework_codes.tobytes(),
+        table.kinds.tobytes(),
+        heap,
+    ]
+    with open(path, "wb") as fp:
+        fp.write(_HEADER.pack(MAGIC, VERSION, BYTE_ORDER, len(table), len(heap), len(frameworks)))
+        for column in columns:
+            fp.write(column)
+            fp.write(bytes(_padded(len(column)) - len(column)))
+
+
+class EmployeeSnapshot:
+    """
+    A memory-mapped snapshot file giving lazy row views of its employees.
+
+    Opening a snapshot only maps the file and reads its header, so it takes
+    the same time whatever the number of rows. Attributes are decoded from
+    the mapped columns when a row view reads them. Salary writes go to an
+    in-memory copy-on-write overlay and never touch the file; the other
+    attributes are read only.
+
+    Attributes:
+        path (str): The snapshot file.
+        frameworks (list): The distinct developer frameworks.
+        overlay (dict): The salaries written since the snapshot was opened, by row.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Initializes an EmployeeSnapshot object by mapping the file.
+
+        Args:
+            path (str): The snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot written on a machine with the same byte order.
+        """
+        self.path = path
+        with open(path, "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byte_order, count, heap_size, frameworks_size = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or byte_order != BYTE_ORDER:
+            self._map.close()
+            raise ValueError(f"{path} is not a compatible employee snapshot")
+        self._count = count
+        self.overlay = {}
+
+        view = memoryview(self._map)
+        offset = _HEADER.size
+        frameworks = bytes(view[offset:offset + frameworks_size]).decode()
+        self.frameworks = frameworks.split("\0") if frameworks_size else []
+        offset += _padded(frameworks_size)
+        sections = []
+        for typecode, size in (("d", 8 * count), ("Q", 8 * (count + 1)), ("h", 2 * count), ("h", 2 * count), ("B", count)):
+            sections.append(view[offset:offset + size].cast(typecode))
+            offset += _padded(size)
+        self._salaries, self._offsets, self._ages, self._framework_codes, self._kinds = sections
+        self._heap = view[offset:offset + heap_size]
+
+    def name_at(self, index):
+        """Decodes the name stored at the given row."""
+        return str(self._heap[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def set_name_at(self, index, name):
+        """Refuses to change a name, snapshots are read only."""
+        raise AttributeError("Snapshot names are read only")
+
+    def age_at(self, index):
+        """Returns the age stored at the given row."""
+        return self._ages[index]
+
+    def set_age_at(self, index, age):
+        """Refuses to change an age, snapshots are read only."""
+        raise AttributeError("Snapshot ages are read only")
+
+    def salary_at(self, index):
+        """Returns the salary at the given row, from the overlay if it was written."""
+        salary = self.overlay.get(index)
+        return self._salaries[index] if salary is None else salary
+
+    def set_salary_at(self, index, salary):
+        """Writes a salary to the copy-on-write overlay."""
+        self.overlay[index] = salary
+
+    def framework_at(self, index):
+        """Returns the framework of the developer at the given row."""
+        code = self._framework_codes[index]
+        if code == NO_FRAMEWORK:
+            raise AttributeError("framework")
+        return self.frameworks[code]
+
+    def set_framework_at(self, index, framework):
+        """Refuses to change a framework, snapshots are read only."""
+        raise AttributeError("Snapshot frameworks are read only")
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the snapshot."""
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        Returns a row view for the employee at the given index.
+
+        Args:
+            index (int): The index of the row.
+
+        Returns:
+            Employee: An EmployeeRow, TesterRow or DeveloperRow view.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("EmployeeSnapshot index out of range")
+        return ROW_TYPES[self._kinds[index]](self, index)
+
+    def __iter__(self):
+        """Yields a row view for every employee in the snapshot."""
+        for index, kind in enumerate(self._kinds):
+            yield ROW_TYPES[kind](self, index)
+
+    def close(self):
+        """
+        Releases the column views and unmaps the file.
+        """
+        for view in (self._salaries, self._offsets, self._ages, self._framework_codes, self._kinds, self._heap):
+            view.release()
+        self._map.close()
+
+    def __enter__(self):
+        """Returns the snapshot for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the snapshot at the end of a with statement."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Returns the file and number of rows of the snapshot."""
+        return f"<EmployeeSnapshot {self.path!r} with {self._count} rows>"
+
+
+if __name__ == "__main__":
+    # Save employees to a snapshot file and map it back
+    path = os.path.join(tempfile.mkdtemp(), "employees.snapshot")
+    write_snapshot(path, [Tester("Abi", 23, 1200), Developer("Bill", 44, 200, "JS")])
+    with EmployeeSnapshot(path) as snapshot:
+        d = snapshot[1]
+        d.increase_salary(50, 50)  # Written to the overlay, the file is unchanged
+        print(d.name, d.age, d.salary, d.framework, isinstance(d, Developer))
+        print(snapshot.overlay)
+    os.remove(path)
@@ -107,54 +107,53 @@ class Developer(SlotsInspectorMixin, Employee):
         self.salary += bonus
 
 
-# Create instances of Tester and Developer
-e = Tester("Abi", 23, 1200)
-d = Developer("Bill", 44, 200, 'JS')
+if __name__ == "__main__":
+    # Create instances of Tester and Developer
+    e = Tester("Abi", 23, 1200)
+    d = Developer("Bill", 44, 200, 'JS')
 
-# Increase salary for Tester and Developer
-e.increase_salary(50)
-print(e.salary)
+    # Increase salary for Tester and Developer
+    e.increase_salary(50)
+    print(e.salary)
 
-# Run tests for Tester
-e.run_tests()
+    # Run tests for Tester
+    e.run_tests()
 
-# Increase salary for Developer with bonus
-d.increase_salary(50, 50)
-print(d.salary)
-print(d.name, d.framework)
-
-
-class Test(object):
-    """
-    A simple test class.
-    """
-    pass
+    # Increase salary for Developer with bonus
+    d.increase_salary(50, 50)
+    print(d.salary)
+    print(d.name, d.framework)
 
+    class Test(object):
+        """
+        A simple test class.
+        """
+        pass
 
-# Create an instance of Test
-test = Test()
-print(repr(test))
+    # Create an instance of Test
+    test = Test()
+    print(repr(test))
 
-# Check if instances are of certain types
-print(isinstance(e, Tester))
-print(isinstance(d, Developer))
+    # Check if instances are of certain types
+    print(isinstance(e, Tester))
+    print(isinstance(d, Developer))
 
-# Check if classes are subclasses of certain classes
-print(issubclass(Developer, Employee))
-print(issubclass(Employee, object))
-print(issubclass(Developer, object))
+    # Check if classes are subclasses of certain classes
+    print(issubclass(Developer, Employee))
+    print(issubclass(Employee, object))
+    print(issubclass(Developer, object))
 
-# Create an instance of Employee and check slots
-emp = Employee("Abi", 23, 1200)
-print(emp.__slots__)
+    # Create an instance of Employee and check slots
+    emp = Employee("Abi", 23, 1200)
+    print(emp.__slots__)
 
-# Dynamically add an attribute to the Tester instance
-e.new_attribute = 2
-print(e.new_attribute)
+    # Dynamically add an attribute to the Tester instance
+    e.new_attribute = 2
+    print(e.new_attribute)
 
-# Check if Developer has slots
-print(d.has_slots())
+    # Check if Developer has slots
+    print(d.has_slots())
 
-# Print method resolution order (MRO)
-print(Developer.__mro__)
-print(Tester.__mro__)
+    # Print method resolution order (MRO)
+    print(Developer.__mro__)
+    print(Tester.__mro__)
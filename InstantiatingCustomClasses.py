@@ -77,14 +77,15 @@ class Employee:
         return f"Employee('{self.name}', {self.age}, {self.salary}, '{self.position}')"
 
 
-# Create instances of Employee
-e = Employee('Abi', 39, 2000, "Programmer")
-f = Employee('Bob', 23, 1000, "Driver")
+if __name__ == "__main__":
+    # Create instances of Employee
+    e = Employee('Abi', 39, 2000, "Programmer")
+    f = Employee('Bob', 23, 1000, "Driver")
 
-# Increase salary and print information
-e.increase_salary(30)
-print(e)
+    # Increase salary and print information
+    e.increase_salary(30)
+    print(e)
 
-# Use repr to recreate the object and print it
-g = eval(repr(e))
-print(g)
+    # Use repr to recreate the object and print it
+    g = eval(repr(e))
+    print(g)
@@ -1,3 +1,6 @@
+from WatchingAttributes import cached_derived
+
+
 class Employee:
     """
     A class to represent an employee.
@@ -12,8 +15,6 @@ class Employee:
         The monthly salary of the employee.
     position : str
         The job position of the employee.
-    _annual_salary : float
-        The cached annual salary of the employee (initialized to None).
 
     Methods
     -------
@@ -28,7 +29,9 @@ class Employee:
     salary(salary: float) -> None:
         Setter for the salary property to enforce a minimum wage.
     annual_salary() -> float:
-        Property that calculates and returns the annual salary of the employee, caching the result.
+        Cached attribute that calculates the annual salary, recomputed only after the salary changes.
+    from_records(records) -> list:
+        Creates employees in bulk without calling the salary setter per row.
     """
 
     def __init__(self, name, age, salary, position) -> None:
@@ -50,7 +53,47 @@ class Employee:
         self.age = age
         self.salary = salary  # This will use the setter to enforce the minimum wage
         self.position = position
-        self._annual_salary = None  # Initialize the cached annual salary to None
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Creates employees in bulk from (name, age, salary, position) records.
+
+        The instances are filled in directly instead of going through the salary
+        setter for every row. A batch with a salary below the minimum wage is
+        scanned again so the error can list every failed row.
+
+        Parameters
+        ----------
+        records : iterable
+            The (name, age, salary, position) records.
+
+        Returns
+        -------
+        list
+            The new Employee instances, in record order.
+
+        Raises
+        ------
+        ValueError
+            If any salary is less than the minimum wage, listing every failed row.
+        """
+        records = list(records)
+        employees = []
+        new = cls.__new__
+        for name, age, salary, position in records:
+            if salary < 1000:
+                break
+            employee = new(cls)
+            employee.name = name
+            employee.age = age
+            employee._salary = salary
+            employee.position = position
+            employees.append(employee)
+        else:
+            return employees
+        failed = [row for row, (_, _, salary, _) in enumerate(records) if salary < 1000]
+        raise ValueError(f'Minimum wage is $1000; rows below it: {failed}')
 
     def increase_salary(self, percent: float) -> None:
         """
@@ -100,7 +143,7 @@ class Employee:
     @salary.setter
     def salary(self, salary):
         """
-        Setter for the salary property to enforce a minimum wage and reset the annual salary cache.
+        Setter for the salary property to enforce a minimum wage.
 
         Parameters
         ----------
@@ -114,38 +157,37 @@ class Employee:
         """
         if salary < 1000:
             raise ValueError('Minimum wage is $1000')
-        self._annual_salary = None  # Reset the annual salary cache
         self._salary = salary
 
-    @property
+    @cached_derived(depends_on=("salary",))
     def annual_salary(self):
         """
-        Property that calculates and returns the annual salary of the employee, caching the result.
+        Calculates the annual salary of the employee, cached until the salary changes.
 
         Returns
         -------
         float
             The annual salary of the employee.
         """
-        if self._annual_salary is None:
-            self._annual_salary = self.salary * 12  # Calculate and cache the annual salary
-        return self._annual_salary
+        return self.salary * 12
+
 
-# Create instances of Employee
-e = Employee('Abi', 39, 1200, "Programmer")
-f = Employee('Bob', 23, 1000, "Driver")
+if __name__ == "__main__":
+    # Create instances of Employee
+    e = Employee('Abi', 39, 1200, "Programmer")
+    f = Employee('Bob', 23, 1000, "Driver")
 
-# Print the monthly salary of employee 'e'
-print(e.salary)
+    # Print the monthly salary of employee 'e'
+    print(e.salary)
 
-# Print the string representation of employee 'e'
-print(e)
+    # Print the string representation of employee 'e'
+    print(e)
 
-# Print the annual salary of employee 'e'
-print(e.annual_salary)
+    # Print the annual salary of employee 'e'
+    print(e.annual_salary)
 
-# Update the salary of employee 'e'
-e.salary = 1000
+    # Update the salary of employee 'e'
+    e.salary = 1000
 
-# Print the updated annual salary of employee 'e'
-print(e.annual_salary)
+    # Print the updated annual salary of employee 'e'
+    print(e.annual_salary)
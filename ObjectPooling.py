@@ -0,0 +1,299 @@
+from collections import deque
+
+from ImplementingClassInheritance import Employee, Tester
+
+
+def _slot_names(cls):
+    """
+    Returns the names of every slot of a class, including those of its bases.
+
+    Args:
+        cls (type): The class.
+
+    Returns:
+        tuple: The slot names, base classes first.
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names += [slots] if isinstance(slots, str) else slots
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+class EmployeePool:
+    """
+    Recycles instances of the slotted Employee hierarchy instead of allocating new ones.
+
+    Released objects have their slots emptied in place and are kept on a
+    free list per concrete class; acquire takes one from the list of the
+    requested class and runs __init__ on it again. Recycled objects are
+    never freed and allocated again, so workloads creating many short-lived
+    employees put less pressure on the allocator, and the cyclic garbage
+    collector, which runs after a number of allocations, runs less often.
+
+    Each free list holds at most capacity objects; objects released past
+    that are dropped and freed as usual.
+
+    Attributes:
+        capacity (int): The maximum number of free objects kept per class.
+    """
+
+    def __init__(self, capacity=1024) -> None:
+        """
+        Initializes an EmployeePool object.
+
+        Args:
+            capacity (int, optional): The maximum number of free objects kept per class.
+                Default is 1024.
+        """
+        self.capacity = capacity
+        self._free = {}
+        self._slots = {}
+        # The ids of the objects on the free lists, to catch a release of a released object
+        self._pooled = set()
+
+    def _register(self, cls):
+        """
+        Prepares the free list of a class.
+
+        Raises:
+            TypeError: If cls is not a subclass of Employee.
+        """
+        if not issubclass(cls, Employee):
+            raise TypeError(f"{cls.__name__} is not an Employee class")
+        self._slots[cls] = _slot_names(cls)
+        return self._free.setdefault(cls, [])
+
+    def acquire(self, cls, *args, **kwargs):
+        """
+        Returns an initialized instance of a class, recycling a released one if there is one.
+
+        Args:
+            cls (type): Employee or one of its subclasses.
+            *args: The arguments of cls.__init__.
+            **kwargs: The keyword arguments of cls.__init__.
+
+        Returns:
+            Employee: The instance.
+
+        Raises:
+            TypeError: If cls is not a subclass of Employee.
+        """
+        free = self._free.get(cls)
+        if free is None:
+            free = self._register(cls)
+        if not free:
+            return cls(*args, **kwargs)
+        obj = free.pop()
+        self._pooled.discard(id(obj))
+        obj.__init__(*args, **kwargs)
+        return obj
+
+    def acquire_many(self, cls, rows):
+        """
+        Returns initialized instances of a class, recycling released ones first.
+
+        Takes the free objects in one slice and runs the __init__ of cls on
+        them directly, which saves the per-object overhead of acquire. If an
+        __init__ raises, the recycled objects go back to the pool before the
+        error is raised again.
+
+        Args:
+            cls (type): Employee or one of its subclasses.
+            rows (iterable): The arguments of cls.__init__ for every instance, as tuples.
+
+        Returns:
+            list: The instances, in the order of the rows.
+
+        Raises:
+            TypeError: If cls is not a subclass of Employee.
+        """
+        rows = list(rows)
+        free = self._free.get(cls)
+        if free is None:
+            free = self._register(cls)
+        start = max(len(free) - len(rows), 0)
+        recycled = free[start:]
+        del free[start:]
+        self._pooled.difference_update(map(id, recycled))
+        init = cls.__init__
+        try:
+            for obj, row in zip(recycled, rows):
+                init(obj, *row)
+            return recycled + [cls(*row) for row in rows[len(recycled):]]
+        except BaseException:
+            # None of them reach the caller, initialized or not
+            self.release_many(recycled)
+            raise
+
+    def release(self, obj):
+        """
+        Returns an object to the pool, emptying its slots and instance dict.
+
+        The caller must not use the object afterwards; reading an emptied
+        slot raises AttributeError until the object is acquired again.
+
+        Args:
+            obj (Employee): An object that is no longer used.
+
+        Raises:
+            TypeError: If obj is not an Employee.
+            ValueError: If obj was already released.
+        """
+        self.release_many((obj,))
+
+    def release_many(self, objects):
+        """
+        Returns many objects to the pool at once.
+
+        The slots are emptied one slot at a time over all the objects of a
+        class, through the slot descriptor, which costs less than deleting
+        every slot of every object in turn.
+
+        Args:
+            objects (iterable): Objects that are no longer used.
+
+        Raises:
+            TypeError: If an object is not an Employee.
+            ValueError: If an object was already released or appears twice;
+                no object is released then.
+        """
+        objects = list(objects)
+        classes = set(map(type, objects))
+        if len(classes) == 1:
+            groups = {classes.pop(): objects}
+        else:
+            groups = {}
+            for obj in objects:
+                groups.setdefault(type(obj), []).append(obj)
+        for cls in groups:
+            if cls not in self._free:
+                self._register(cls)
+        ids = set(map(id, objects))
+        if len(ids) != len(objects) or not self._pooled.isdisjoint(ids):
+            raise ValueError("an object was already released")
+        for cls, group in groups.items():
+            self._reset(cls, group)
+            free = self._free[cls]
+            kept = group[:max(self.capacity - len(free), 0)]
+            free += kept
+            self._pooled.update(map(id, kept))
+
+    def _reset(self, cls, group):
+        """
+        Empties the slots and instance dicts of objects of one class.
+        """
+        for name in self._slots[cls]:
+            # A watched slot is wrapped by a descriptor that cannot delete, __init__ overwrites it
+            delete = getattr(getattr(cls, name), "__delete__", None)
+            if delete is None:
+                continue
+            try:
+                deque(map(delete, group), 0)
+            except AttributeError:
+                # Some slot was never set or already deleted
+                for obj in group:
+                    try:
+                        delete(obj)
+                    except AttributeError:
+                        pass
+        # Tester has no __slots__ of its own, so it also has an instance dict
+        if cls.__dictoffset__:
+            for obj in group:
+                obj.__dict__.clear()
+
+    def scope(self):
+        """
+        Returns a context manager that releases every object acquired through it on exit.
+
+        Returns:
+            PoolScope: The scope.
+        """
+        return PoolScope(self)
+
+    def clear(self):
+        """
+        Drops every free object, letting them be freed.
+        """
+        for free in self._free.values():
+            free.clear()
+        self._pooled.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of free objects in the pool."""
+        return len(self._pooled)
+
+
+class PoolScope:
+    """
+    Acquires objects from an EmployeePool and releases them all at the end of a with block.
+
+    Attributes:
+        pool (EmployeePool): The pool the objects come from.
+    """
+
+    def __init__(self, pool) -> None:
+        """
+        Initializes a PoolScope object.
+
+        Args:
+            pool (EmployeePool): The pool the objects come from.
+        """
+        self.pool = pool
+        # Kept per class, so the exit releases every class in one call
+        self._acquired = {}
+
+    def acquire(self, cls, *args, **kwargs):
+        """
+        Acquires an object from the pool, to be released when the scope exits.
+
+        Args:
+            cls (type): Employee or one of its subclasses.
+            *args: The arguments of cls.__init__.
+            **kwargs: The keyword arguments of cls.__init__.
+
+        Returns:
+            Employee: The instance.
+        """
+        obj = self.pool.acquire(cls, *args, **kwargs)
+        self._acquired.setdefault(cls, []).append(obj)
+        return obj
+
+    def acquire_many(self, cls, rows):
+        """
+        Acquires many objects from the pool, to be released when the scope exits.
+
+        Args:
+            cls (type): Employee or one of its subclasses.
+            rows (iterable): The arguments of cls.__init__ for every instance, as tuples.
+
+        Returns:
+            list: The instances, in the order of the rows.
+        """
+        objects = self.pool.acquire_many(cls, rows)
+        self._acquired.setdefault(cls, []).extend(objects)
+        return objects
+
+    def __enter__(self):
+        """Returns the scope for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Releases every object acquired in the with statement."""
+        acquired, self._acquired = self._acquired, {}
+        for objects in acquired.values():
+            self.pool.release_many(objects)
+
+
+if __name__ == "__main__":
+    # Model two raises with temporary employees; the second scope reuses the same objects
+    pool = EmployeePool()
+    with pool.scope() as scope:
+        abi = scope.acquire(Tester, "Abi", 23, 1200)
+        abi.increase_salary(10)
+        print(abi.salary)
+    with pool.scope() as scope:
+        again = scope.acquire(Tester, "Abi", 23, 1200)
+        again.increase_salary(20)
+        print(again.salary, again is abi)
+    print(len(pool))
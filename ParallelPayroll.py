@@ -0,0 +1,115 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from ManagingAttributeAccess import Employee
+
+
+def compute_payroll(salaries, results, start, stop, percent, bonus):
+    """
+    Computes the raised monthly and annual salary of a range of employees.
+
+    Both the serial and the parallel payroll run this function, so they give
+    bit-for-bit identical results.
+
+    Args:
+        salaries (sequence): The current monthly salaries.
+        results (sequence): Receives the new monthly salaries in [0, n) and the
+            annual salaries in [n, 2n), where n is len(salaries).
+        start (int): The first employee to compute.
+        stop (int): The employee after the last one to compute.
+        percent (float): The raise, as a percentage.
+        bonus (float): The monthly bonus added after the raise.
+    """
+    count = len(salaries)
+    rate = percent / 100
+    for i in range(start, stop):
+        salary = salaries[i]
+        salary = salary + salary * rate + bonus
+        results[i] = salary
+        results[count + i] = salary * 12
+
+
+def _payroll_worker(salaries_name, results_name, start, stop, percent, bonus):
+    """
+    Runs compute_payroll in a worker process on the shared salary columns.
+
+    Args:
+        salaries_name (str): The shared memory block holding the salaries.
+        results_name (str): The shared memory block receiving the results.
+        start (int): The first employee to compute.
+        stop (int): The employee after the last one to compute.
+        percent (float): The raise, as a percentage.
+        bonus (float): The monthly bonus added after the raise.
+    """
+    salaries_block = SharedMemory(name=salaries_name)
+    results_block = SharedMemory(name=results_name)
+    try:
+        with salaries_block.buf.cast("d") as salaries, results_block.buf.cast("d") as results:
+            compute_payroll(salaries, results, start, stop, percent, bonus)
+    finally:
+        salaries_block.close()
+        results_block.close()
+
+
+def run_payroll(employees, percent, bonus=0, workers=None, apply=False):
+    """
+    Computes the raised and annual salaries of a workforce across processes.
+
+    The salaries are copied once into a shared memory block that every
+    worker maps, instead of pickling Employee objects, and the workers write
+    their slice of the results into a second shared block.
+
+    Args:
+        employees (list): The employees.
+        percent (float): The raise, as a percentage.
+        bonus (float, optional): The monthly bonus added after the raise. Default is 0.
+        workers (int, optional): The number of processes. Default is the number of CPUs;
+            1 computes in the current process.
+        apply (bool, optional): Also set the new salary on every employee. Default is False.
+
+    Returns:
+        tuple: The new monthly salaries and the annual salaries, as lists.
+    """
+    count = len(employees)
+    workers = workers or os.cpu_count() or 1
+    salaries = array("d", [employee.salary for employee in employees])
+    if workers == 1 or count == 0:
+        results = array("d", bytes(16 * count))
+        compute_payroll(salaries, results, 0, count, percent, bonus)
+    else:
+        salaries_block = SharedMemory(create=True, size=max(8 * count, 1))
+        results_block = SharedMemory(create=True, size=max(16 * count, 1))
+        try:
+            salaries_block.buf[:8 * count] = salaries.tobytes()
+            step = -(-count // (workers * 4))
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [
+                    pool.submit(_payroll_worker, salaries_block.name, results_block.name,
+                                start, min(start + step, count), percent, bonus)
+                    for start in range(0, count, step)
+                ]
+                for future in futures:
+                    future.result()
+            results = array("d")
+            results.frombytes(results_block.buf[:16 * count])
+        finally:
+            for block in (salaries_block, results_block):
+                block.close()
+                block.unlink()
+    new_salaries = results[:count].tolist()
+    annual_salaries = results[count:].tolist()
+    if apply:
+        for employee, salary in zip(employees, new_salaries):
+            employee.salary = salary
+    return new_salaries, annual_salaries
+
+
+if __name__ == "__main__":
+    # Process pools re-import the main module, so the example only runs when executed directly
+    workforce = [Employee(f"Employee {i}", 30, 1000 + i, "Driver") for i in range(10_000)]
+    serial = run_payroll(workforce, 10, 50, workers=1)
+    parallel = run_payroll(workforce, 10, 50, workers=2, apply=True)
+    print(serial == parallel)
+    print(workforce[0].salary, workforce[0].annual_salary)
@@ -0,0 +1,295 @@
+from ImplementingClassInheritance import Developer
+from InstantiatingCustomClasses import Employee
+from QuantileSketch import QuantileSketch
+from WatchingAttributes import MISSING, defining_class, watch, unwatch
+
+
+class _Group:
+    """
+    The running count, salary total and salary sketch of one (class, position) group.
+    """
+
+    __slots__ = ("count", "total", "sketch")
+
+    def __init__(self, relative_accuracy) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, salary):
+        self.count += 1
+        self.total += salary
+        self.sketch.add(salary)
+
+    def remove(self, salary):
+        self.count -= 1
+        self.total -= salary
+        self.sketch.remove(salary)
+
+    def replace(self, salary, new_salary):
+        self.total += new_salary - salary
+        self.sketch.replace(salary, new_salary)
+
+
+class PayrollAggregates:
+    """
+    Payroll totals, means and percentiles kept up to date on every salary change.
+
+    Registered employees are split into groups by concrete class and
+    position (None for classes without a position), and every group keeps
+    a running count, salary total and QuantileSketch. The salary and
+    position of every registered employee are watched, so assignments,
+    including those made by the salary setter and increase_salary, move the
+    salary between totals and sketch buckets in O(1). Queries only combine
+    the groups they select, which are few, and never visit the employees.
+
+    Totals are running float sums, so after many changes they can differ
+    from a fresh sum in the last digits.
+
+    Attributes:
+        relative_accuracy (float): The relative error bound of the percentiles.
+    """
+
+    def __init__(self, employees=(), relative_accuracy=0.01) -> None:
+        """
+        Initializes a PayrollAggregates object.
+
+        Args:
+            employees (iterable, optional): The employees to register.
+            relative_accuracy (float, optional): The relative error bound of the
+                percentiles. Default is 0.01.
+        """
+        self.relative_accuracy = relative_accuracy
+        self._members = {}
+        # The group and salary each registered employee is counted with, by id
+        self._counted = {}
+        self._groups = {}
+        self._watched = set()
+        self.update(employees)
+
+    def _group(self, cls, position):
+        """
+        Returns the group of a class and position, creating it if needed.
+        """
+        key = (cls, position)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group(self.relative_accuracy)
+        return group
+
+    def _watch(self, cls, names):
+        """
+        Starts watching attributes of a class, once per defining class.
+        """
+        for name in names:
+            owner = defining_class(cls, name)
+            if (owner, name) not in self._watched:
+                watch(owner, name, self._changed)
+                self._watched.add((owner, name))
+
+    def _changed(self, obj, name, old, new):
+        """
+        Moves a registered employee's salary to its new value or position group.
+
+        The previous value is taken from what was counted rather than old,
+        so a second call for the same assignment changes nothing.
+        """
+        key = id(obj)
+        if self._members.get(key) is not obj:
+            return
+        group, salary = self._counted[key]
+        new_group, new_salary = group, salary
+        if name == "salary":
+            new_salary = new
+        else:
+            new_group = self._group(type(obj), new)
+        if new_group is not group:
+            group.remove(salary)
+            new_group.add(new_salary)
+        elif new_salary != salary:
+            group.replace(salary, new_salary)
+        else:
+            return
+        self._counted[key] = (new_group, new_salary)
+
+    def add(self, employee):
+        """
+        Registers an employee.
+
+        Args:
+            employee: The employee to register.
+
+        Raises:
+            TypeError: If the salary of the employee cannot be read.
+        """
+        self.update((employee,))
+
+    def update(self, employees):
+        """
+        Registers many employees.
+
+        Args:
+            employees (iterable): The employees to register.
+
+        Raises:
+            TypeError: If the salary of an employee cannot be read, e.g. writeonly
+                employees; the employees before it stay registered.
+        """
+        for employee in employees:
+            key = id(employee)
+            if key in self._members:
+                continue
+            salary = getattr(employee, "salary", MISSING)
+            if salary is MISSING:
+                raise TypeError(f"The salary of {employee!r} cannot be read")
+            cls = type(employee)
+            position = getattr(employee, "position", MISSING)
+            self._watch(cls, ("salary",) if position is MISSING else ("salary", "position"))
+            group = self._group(cls, None if position is MISSING else position)
+            group.add(salary)
+            self._members[key] = employee
+            self._counted[key] = (group, salary)
+
+    def remove(self, employee):
+        """
+        Unregisters an employee.
+
+        Args:
+            employee: The employee to unregister.
+
+        Raises:
+            KeyError: If the employee is not registered.
+        """
+        key = id(employee)
+        if self._members.get(key) is not employee:
+            raise KeyError(employee)
+        del self._members[key]
+        group, salary = self._counted.pop(key)
+        group.remove(salary)
+
+    def _select(self, position, cls):
+        """
+        Returns the groups of a position and of a class and its subclasses.
+        """
+        return [group for (klass, pos), group in self._groups.items()
+                if (position is MISSING or pos == position) and (cls is None or issubclass(klass, cls))]
+
+    def count(self, position=MISSING, cls=None):
+        """
+        Returns the number of employees.
+
+        Args:
+            position (str, optional): Only count this position; None selects the
+                employees without a position. Default is every position.
+            cls (type, optional): Only count instances of this class. Default is every class.
+
+        Returns:
+            int: The number of employees.
+        """
+        return sum(group.count for group in self._select(position, cls))
+
+    def total(self, position=MISSING, cls=None):
+        """
+        Returns the total monthly payroll.
+
+        Args:
+            position (str, optional): Only sum this position. Default is every position.
+            cls (type, optional): Only sum instances of this class. Default is every class.
+
+        Returns:
+            float: The sum of the salaries.
+        """
+        return sum(group.total for group in self._select(position, cls))
+
+    def mean(self, position=MISSING, cls=None):
+        """
+        Returns the mean salary.
+
+        Args:
+            position (str, optional): Only average this position. Default is every position.
+            cls (type, optional): Only average instances of this class. Default is every class.
+
+        Returns:
+            float: The mean salary, or None if no employee is selected.
+        """
+        groups = self._select(position, cls)
+        count = sum(group.count for group in groups)
+        return sum(group.total for group in groups) / count if count else None
+
+    def quantile(self, q, position=MISSING, cls=None):
+        """
+        Returns an estimate of a salary percentile, within the relative accuracy.
+
+        Args:
+            q (float): The quantile, between 0 and 1, e.g. 0.9 for the 90th percentile.
+            position (str, optional): Only use this position. Default is every position.
+            cls (type, optional): Only use instances of this class. Default is every class.
+
+        Returns:
+            float: The estimated salary, or None if no employee is selected.
+        """
+        groups = self._select(position, cls)
+        if len(groups) == 1:
+            return groups[0].sketch.quantile(q)
+        sketch = QuantileSketch(self.relative_accuracy)
+        for group in groups:
+            sketch.merge(group.sketch)
+        return sketch.quantile(q)
+
+    def by_position(self):
+        """
+        Returns the count and total payroll of every position.
+
+        Returns:
+            dict: For every position, a (count, total) tuple.
+        """
+        totals = {}
+        for (_, position), group in self._groups.items():
+            count, total = totals.get(position, (0, 0.0))
+            totals[position] = (count + group.count, total + group.total)
+        return {position: totals[position] for position in totals if totals[position][0]}
+
+    def by_class(self):
+        """
+        Returns the count and total payroll of every concrete class.
+
+        Returns:
+            dict: For every class, a (count, total) tuple.
+        """
+        totals = {}
+        for (cls, _), group in self._groups.items():
+            count, total = totals.get(cls, (0, 0.0))
+            totals[cls] = (count + group.count, total + group.total)
+        return {cls: totals[cls] for cls in totals if totals[cls][0]}
+
+    def close(self):
+        """
+        Stops watching salaries and positions, the aggregates are no longer kept up to date.
+        """
+        for owner, name in self._watched:
+            unwatch(owner, name, self._changed)
+        self._watched.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of registered employees."""
+        return len(self._members)
+
+    def __contains__(self, employee) -> bool:
+        """Checks whether an employee is registered."""
+        return self._members.get(id(employee)) is employee
+
+
+if __name__ == "__main__":
+    # Keep payroll figures of a small workforce up to date through raises and a promotion
+    bob = Employee("Bob", 23, 1000, "Driver")
+    payroll = PayrollAggregates([
+        Employee("Abi", 39, 2000, "Programmer"),
+        bob,
+        Employee("Mary", 31, 3000, "Driver"),
+        Developer("Bill", 44, 2000, "JS"),
+    ])
+    print(payroll.total(), payroll.mean(position="Driver"), payroll.total(cls=Developer))
+    bob.increase_salary(50)
+    bob.position = "Programmer"
+    print(payroll.by_position(), round(payroll.quantile(0.5)))
+    payroll.close()
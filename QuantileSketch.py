@@ -0,0 +1,198 @@
+from math import ceil, log
+
+
+class QuantileSketch:
+    """
+    A mergeable quantile sketch with a bounded relative error, after DDSketch.
+
+    Values are counted in logarithmic buckets: bucket i holds the values in
+    (gamma ** (i - 1), gamma ** i], with gamma = (1 + a) / (1 - a) for a
+    relative accuracy a. Every quantile is answered with a value within a
+    relative error of a of the true one, from a number of buckets that
+    grows with the log of the value range, not with the number of values.
+    Values can be removed again, and sketches with the same accuracy can be
+    merged by adding their bucket counts.
+
+    Negative values use buckets of their own and zeros a plain count.
+
+    Attributes:
+        relative_accuracy (float): The relative error bound of quantiles.
+        count (int): The number of values in the sketch.
+    """
+
+    def __init__(self, relative_accuracy=0.01) -> None:
+        """
+        Initializes a QuantileSketch object.
+
+        Args:
+            relative_accuracy (float, optional): The relative error bound, between
+                0 and 1. Default is 0.01.
+
+        Raises:
+            ValueError: If the accuracy is not between 0 and 1.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("The relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = log(self.gamma)
+        self._positive = {}
+        self._negative = {}
+        self._zeros = 0
+        self.count = 0
+
+    def _bucket(self, value):
+        """
+        Returns the bucket counts and the bucket index of a value, or None for zero.
+        """
+        if value > 0:
+            return self._positive, ceil(log(value) / self._log_gamma)
+        if value < 0:
+            return self._negative, ceil(log(-value) / self._log_gamma)
+        return None, 0
+
+    def add(self, value, count=1):
+        """
+        Adds a value to the sketch.
+
+        Args:
+            value (float): The value.
+            count (int, optional): How many times to add it. Default is 1.
+        """
+        buckets, index = self._bucket(value)
+        if buckets is None:
+            self._zeros += count
+        else:
+            buckets[index] = buckets.get(index, 0) + count
+        self.count += count
+
+    def remove(self, value, count=1):
+        """
+        Removes a value added before.
+
+        Args:
+            value (float): The value.
+            count (int, optional): How many times to remove it. Default is 1.
+
+        Raises:
+            ValueError: If the bucket of the value holds fewer than count values.
+        """
+        buckets, index = self._bucket(value)
+        held = self._zeros if buckets is None else buckets.get(index, 0)
+        if held < count:
+            raise ValueError(f"{value} is not in the sketch")
+        if buckets is None:
+            self._zeros -= count
+        elif held == count:
+            del buckets[index]
+        else:
+            buckets[index] = held - count
+        self.count -= count
+
+    def replace(self, old, new):
+        """
+        Replaces a value added before with another, e.g. after a raise.
+
+        Nothing changes when both values fall in the same bucket.
+
+        Args:
+            old (float): The value to remove.
+            new (float): The value to add.
+
+        Raises:
+            ValueError: If old is not in the sketch.
+        """
+        buckets, index = self._bucket(old)
+        new_buckets, new_index = self._bucket(new)
+        if new_buckets is not buckets or new_index != index:
+            self.remove(old)
+            self.add(new)
+        elif not (self._zeros if buckets is None else buckets.get(index, 0)):
+            raise ValueError(f"{old} is not in the sketch")
+
+    def merge(self, other):
+        """
+        Adds every value of another sketch to this one.
+
+        Args:
+            other (QuantileSketch): A sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches have different accuracies.
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+        for buckets, others in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in others.items():
+                buckets[index] = buckets.get(index, 0) + count
+        self._zeros += other._zeros
+        self.count += other.count
+
+    def copy(self):
+        """
+        Returns an independent copy of the sketch.
+        """
+        copy = QuantileSketch(self.relative_accuracy)
+        copy.merge(self)
+        return copy
+
+    def quantile(self, q):
+        """
+        Returns an estimate of a quantile of the values.
+
+        Args:
+            q (float): The quantile, between 0 and 1, e.g. 0.5 for the median.
+
+        Returns:
+            float: A value within the relative accuracy of the quantile, or None
+            if the sketch is empty.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        # The largest negative bucket holds the smallest values
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self._positive))
+
+    def _value(self, index):
+        """
+        Returns the value representing a bucket, within the relative accuracy of all its values.
+        """
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def __len__(self) -> int:
+        """Returns the number of values in the sketch."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """Returns the size and accuracy of the sketch."""
+        return f"<QuantileSketch with {self.count} values, relative accuracy {self.relative_accuracy}>"
+
+
+if __name__ == "__main__":
+    # Estimate salary percentiles, then merge in a second team
+    sketch = QuantileSketch()
+    for salary in range(1000, 5001, 10):
+        sketch.add(salary)
+    print(round(sketch.quantile(0.5)), round(sketch.quantile(0.9)))
+    team = QuantileSketch()
+    team.add(20000, count=400)
+    sketch.merge(team)
+    sketch.remove(1000)
+    print(round(sketch.quantile(0.5)), len(sketch))
@@ -0,0 +1,287 @@
+from BulkSalaryUpdates import bulk_formula
+from ImplementingClassInheritance import Developer, Tester
+from WatchingAttributes import MISSING
+
+
+class Scenario:
+    """
+    A what-if fork of a workforce that stores only the salaries it changes.
+
+    Employees are addressed by their row in the shared employee list. A
+    scenario keeps the salaries it changed in a delta layer and reads every
+    other salary through its parent, down to the employees themselves, so
+    forking takes the same time whatever the size of the workforce and the
+    records are never copied. A fork sees later changes of its parent for
+    the salaries it did not change itself.
+
+    Every change is one undo step. Discarding drops the delta layer, and
+    committing merges it into the parent, or assigns the salaries of a
+    scenario without parent to the employees; both take time in proportion
+    to the number of changed salaries only.
+
+    Attributes:
+        employees (list): The employees, shared by every fork.
+        parent (Scenario): The scenario forked from, or None for the live employees.
+    """
+
+    def __init__(self, employees, parent=None) -> None:
+        """
+        Initializes a Scenario object.
+
+        Args:
+            employees (iterable): The employees of the workforce.
+            parent (Scenario, optional): The scenario to fork. Default is None, a
+                scenario over the live employees.
+        """
+        self.employees = employees if isinstance(employees, list) else list(employees)
+        self.parent = parent
+        self._changes = {}
+        # The delta layers read by this scenario, its own first
+        self._layers = [self._changes] + (parent._layers if parent is not None else [])
+        # For every step, the salary each changed row had in the delta layer before it
+        self._undo = []
+        self._root = parent._root if parent is not None else self
+        self._rows = None
+
+    def fork(self):
+        """
+        Returns a new scenario starting from this one.
+        """
+        return Scenario(self.employees, self)
+
+    def rows_of(self, employees):
+        """
+        Returns the rows of employees, e.g. of the results of a registry query.
+
+        The first call builds a map from employee to row, shared by every fork.
+
+        Args:
+            employees (iterable): Employees of the workforce.
+
+        Returns:
+            list: Their rows.
+
+        Raises:
+            KeyError: If an employee is not part of the workforce.
+        """
+        root = self._root
+        if root._rows is None:
+            root._rows = {id(employee): row for row, employee in enumerate(self.employees)}
+        rows = root._rows
+        return [rows[id(employee)] for employee in employees]
+
+    def salary(self, row):
+        """
+        Returns the salary of an employee in the scenario.
+
+        Args:
+            row (int): The row of the employee.
+
+        Returns:
+            float: The salary.
+        """
+        for changes in self._layers:
+            if row in changes:
+                return changes[row]
+        return self.employees[row].salary
+
+    def salaries(self):
+        """
+        Returns an iterator over the salaries of every employee in the scenario, in row order.
+        """
+        return map(self.salary, range(len(self.employees)))
+
+    def changes(self):
+        """
+        Returns the salaries this scenario changed, by row.
+        """
+        return dict(self._changes)
+
+    def cost(self):
+        """
+        Returns how much the scenario changes the monthly payroll of its parent.
+        """
+        parent = self.parent
+        read = parent.salary if parent is not None else (lambda row: self.employees[row].salary)
+        return sum(salary - read(row) for row, salary in self._changes.items())
+
+    def _selected(self, rows, cls):
+        """
+        Returns the selected rows and their employees.
+        """
+        employees = self.employees
+        if rows is None:
+            rows = range(len(employees))
+        selected = ((row, employees[row]) for row in rows)
+        if cls is None:
+            return selected
+        return ((row, employee) for row, employee in selected if isinstance(employee, cls))
+
+    def _assign(self, salaries):
+        """
+        Records new salaries in the delta layer as one undo step.
+        """
+        changes = self._changes
+        step = {}
+        for row, salary in salaries:
+            if row not in step:
+                step[row] = changes.get(row, MISSING)
+            changes[row] = salary
+        if step:
+            self._undo.append(step)
+        return len(step)
+
+    def set_salaries(self, salaries):
+        """
+        Sets salaries in the scenario.
+
+        Args:
+            salaries (dict or iterable): The new salary of each row, as a dict or
+                as (row, salary) pairs.
+
+        Returns:
+            int: The number of employees changed.
+        """
+        return self._assign(salaries.items() if isinstance(salaries, dict) else salaries)
+
+    def apply(self, function, rows=None, cls=None):
+        """
+        Sets salaries computed by a function in the scenario.
+
+        Args:
+            function (callable): Called with an employee and its salary in the
+                scenario, returns the new salary.
+            rows (iterable, optional): The rows to update. Default is every row.
+            cls (type, optional): Only update instances of this class. Default is every class.
+
+        Returns:
+            int: The number of salaries changed.
+        """
+        salary = self.salary
+        updates = []
+        for row, employee in self._selected(rows, cls):
+            current = salary(row)
+            new = function(employee, current)
+            if new != current:
+                updates.append((row, new))
+        return self._assign(updates)
+
+    def increase_salaries(self, percent, bonus=0, rows=None, cls=None):
+        """
+        Raises salaries in the scenario the way increase_salary would.
+
+        Classes whose increase_salary adds a bonus, like Developer, get the
+        percentage followed by the bonus, the others the percentage only.
+
+        Args:
+            percent (float): The percentage to increase the salaries by.
+            bonus (float, optional): The bonus of every developer. Default is 0.
+            rows (iterable, optional): The rows to raise. Default is every row.
+            cls (type, optional): Only raise instances of this class. Default is every class.
+
+        Returns:
+            int: The number of salaries changed.
+
+        Raises:
+            TypeError: If an employee overrides increase_salary with no bulk equivalent.
+        """
+        def raised(employee, salary):
+            if bulk_formula(type(employee)):
+                return salary + salary * (percent / 100) + bonus
+            return salary + salary * (percent / 100)
+
+        return self.apply(raised, rows, cls)
+
+    def set_minimum_wage(self, minimum_wage, rows=None, cls=None):
+        """
+        Raises every salary below a minimum wage to it in the scenario.
+
+        Args:
+            minimum_wage (float): The new minimum wage.
+            rows (iterable, optional): The rows to check. Default is every row.
+            cls (type, optional): Only check instances of this class. Default is every class.
+
+        Returns:
+            int: The number of salaries changed.
+        """
+        return self.apply(lambda employee, salary: max(salary, minimum_wage), rows, cls)
+
+    def undo(self):
+        """
+        Reverts the last change of the scenario.
+
+        Raises:
+            ValueError: If there is no change to revert.
+        """
+        if not self._undo:
+            raise ValueError("Nothing to undo")
+        changes = self._changes
+        for row, salary in self._undo.pop().items():
+            if salary is MISSING:
+                del changes[row]
+            else:
+                changes[row] = salary
+
+    def discard(self):
+        """
+        Drops every change of the scenario.
+        """
+        self._changes.clear()
+        self._undo.clear()
+
+    def commit(self):
+        """
+        Applies the changes of the scenario to its parent and empties it.
+
+        A fork merges its changes into its parent as one undo step of the
+        parent. A scenario without parent assigns the salaries to the
+        employees; if a setter rejects one, e.g. on a minimum wage check, the
+        salaries already assigned are restored, the scenario keeps its
+        changes and the error is raised again.
+        """
+        if self.parent is not None:
+            self.parent._assign(self._changes.items())
+        else:
+            employees = self.employees
+            done = []
+            try:
+                for row, salary in self._changes.items():
+                    employee = employees[row]
+                    done.append((employee, getattr(employee, "salary", MISSING)))
+                    employee.salary = salary
+            except BaseException:
+                for employee, salary in done:
+                    if salary is not MISSING:
+                        employee.salary = salary
+                raise
+        self.discard()
+
+    def __len__(self) -> int:
+        """Returns the number of salaries the scenario changed."""
+        return len(self._changes)
+
+    def __repr__(self) -> str:
+        """Returns the size of the workforce and of the delta layer."""
+        return f"<Scenario of {len(self.employees)} employees with {len(self._changes)} changed salaries>"
+
+
+if __name__ == "__main__":
+    # Compare two what-if scenarios without touching the workforce
+    workforce = Scenario([
+        Tester("Abi", 23, 1200),
+        Developer("Bill", 44, 2000, "JS"),
+        Developer("Mary", 31, 3000, "Python"),
+    ])
+    raise_developers = workforce.fork()
+    raise_developers.increase_salaries(10, bonus=100, cls=Developer)
+    minimum_wage = workforce.fork()
+    minimum_wage.set_minimum_wage(2500)
+    print(raise_developers.cost(), minimum_wage.cost())
+    print(list(minimum_wage.salaries()))
+
+    # Undo the last step, then commit the raise to the live employees
+    raise_developers.increase_salaries(5)
+    raise_developers.undo()
+    raise_developers.commit()
+    workforce.commit()
+    print([employee.salary for employee in workforce.employees])
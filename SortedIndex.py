@@ -0,0 +1,204 @@
+from bisect import bisect_left, bisect_right, insort
+
+
+class SortedIndex:
+    """
+    A sorted collection of keys with O(log n) inserts and removals.
+
+    The keys are kept in a list of sorted buckets, each holding at most
+    ``2 * load`` keys, plus the largest key of every bucket. Inserting or
+    removing a key only shifts the keys of one bucket, instead of the whole
+    index as with a single sorted list.
+
+    Attributes:
+        load (int): The target bucket size. Default is 1000.
+    """
+
+    def __init__(self, keys=(), load=1000) -> None:
+        """
+        Initializes a SortedIndex object.
+
+        Args:
+            keys (iterable, optional): The keys to start with.
+            load (int, optional): The target bucket size. Default is 1000.
+        """
+        self.load = load
+        self._buckets = []
+        self._maxes = []
+        self._len = 0
+        self.update(keys)
+
+    def add(self, key):
+        """
+        Adds a key to the index.
+
+        Args:
+            key: The key to add.
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._buckets.append([key])
+            maxes.append(key)
+        else:
+            pos = bisect_right(maxes, key)
+            if pos == len(maxes):
+                pos -= 1
+                self._buckets[pos].append(key)
+                maxes[pos] = key
+            else:
+                insort(self._buckets[pos], key)
+            if len(self._buckets[pos]) > 2 * self.load:
+                self._split(pos)
+        self._len += 1
+
+    def _split(self, pos):
+        """
+        Splits an oversized bucket in two.
+
+        Args:
+            pos (int): The position of the bucket.
+        """
+        bucket = self._buckets[pos]
+        half = bucket[self.load:]
+        del bucket[self.load:]
+        self._buckets.insert(pos + 1, half)
+        self._maxes[pos] = bucket[-1]
+        self._maxes.insert(pos + 1, half[-1])
+
+    def remove(self, key):
+        """
+        Removes a key from the index.
+
+        Args:
+            key: The key to remove.
+
+        Raises:
+            ValueError: If the key is not in the index.
+        """
+        pos = bisect_left(self._maxes, key)
+        if pos < len(self._maxes):
+            bucket = self._buckets[pos]
+            i = bisect_left(bucket, key)
+            if bucket[i] == key:
+                del bucket[i]
+                self._len -= 1
+                if bucket:
+                    self._maxes[pos] = bucket[-1]
+                else:
+                    del self._buckets[pos]
+                    del self._maxes[pos]
+                return
+        raise ValueError(f"{key!r} is not in the index")
+
+    def update(self, keys):
+        """
+        Adds many keys at once by re-sorting and re-bucketing the index.
+
+        Args:
+            keys (iterable): The keys to add.
+        """
+        keys = list(keys)
+        if not keys:
+            return
+        if len(keys) < self.load:
+            for key in keys:
+                self.add(key)
+            return
+        for bucket in self._buckets:
+            keys.extend(bucket)
+        keys.sort()
+        self._buckets = [keys[i:i + self.load] for i in range(0, len(keys), self.load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(keys)
+
+    def below(self, bound):
+        """
+        Yields the keys less than a bound, in ascending order.
+
+        Costs O(log n + k) for k matching keys.
+
+        Args:
+            bound: The exclusive upper bound.
+
+        Yields:
+            The keys less than the bound.
+        """
+        last = bisect_left(self._maxes, bound)
+        for bucket in self._buckets[:last]:
+            yield from bucket
+        if last < len(self._buckets):
+            bucket = self._buckets[last]
+            yield from bucket[:bisect_left(bucket, bound)]
+
+    def between(self, low, high):
+        """
+        Yields the keys in the half-open range [low, high), in ascending order.
+
+        Args:
+            low: The inclusive lower bound.
+            high: The exclusive upper bound.
+
+        Yields:
+            The keys within the range.
+        """
+        first = bisect_left(self._maxes, low)
+        for pos in range(first, len(self._buckets)):
+            bucket = self._buckets[pos]
+            start = bisect_left(bucket, low) if pos == first else 0
+            if self._maxes[pos] < high:
+                yield from bucket[start:]
+            else:
+                yield from bucket[start:bisect_left(bucket, high)]
+                return
+
+    def count(self, low, high):
+        """
+        Counts the keys in the half-open range [low, high) without listing them.
+
+        Costs O(log n) plus one step per bucket in the range.
+
+        Args:
+            low: The inclusive lower bound.
+            high: The exclusive upper bound.
+
+        Returns:
+            int: The number of keys within the range.
+        """
+        if not low < high:
+            return 0
+        first = bisect_left(self._maxes, low)
+        last = bisect_left(self._maxes, high)
+        if first == len(self._buckets):
+            return 0
+        if first == last:
+            bucket = self._buckets[first]
+            return bisect_left(bucket, high) - bisect_left(bucket, low)
+        total = len(self._buckets[first]) - bisect_left(self._buckets[first], low)
+        total += sum(map(len, self._buckets[first + 1:last]))
+        if last < len(self._buckets):
+            total += bisect_left(self._buckets[last], high)
+        return total
+
+    def __len__(self) -> int:
+        """Returns the number of keys in the index."""
+        return self._len
+
+    def __iter__(self):
+        """Yields every key in ascending order."""
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __repr__(self) -> str:
+        """Returns the size of the index."""
+        return f"<SortedIndex with {self._len} keys>"
+
+
+if __name__ == "__main__":
+    # Keep salaries sorted while they change
+    index = SortedIndex([3000, 1200, 2500])
+    index.add(1000)
+    index.remove(2500)
+    print(list(index))
+    print(list(index.below(2000)))
+    print(list(index.between(1100, 3000)))
+    print(index.count(1100, 3000))
@@ -0,0 +1,162 @@
+import csv
+import io
+import json
+from collections import namedtuple
+from itertools import islice, starmap
+from operator import itemgetter
+
+from InstantiatingCustomClasses import Employee
+
+# The Employee constructor arguments, in order, and how to parse each
+FIELDS = ("name", "age", "salary", "position")
+CONVERTERS = {"name": str, "age": int, "salary": float, "position": str}
+
+
+def parse_csv(lines, fields=FIELDS):
+    """
+    Parses CSV lines with a header row into tuples of the requested fields.
+
+    Args:
+        lines (iterable): The lines of the file, header first.
+        fields (tuple, optional): The fields to keep, in output order. Default is all fields.
+
+    Yields:
+        tuple: The converted values of the requested fields.
+    """
+    reader = csv.reader(lines)
+    header = next(reader)
+    pick = itemgetter(*(header.index(field) for field in fields))
+    converters = [CONVERTERS[field] for field in fields]
+    if len(fields) == 1:
+        convert = converters[0]
+        for row in reader:
+            yield (convert(pick(row)),)
+    else:
+        for row in reader:
+            yield tuple([convert(value) for convert, value in zip(converters, pick(row))])
+
+
+def parse_jsonl(lines, fields=FIELDS):
+    """
+    Parses JSON lines, one object per line, into tuples of the requested fields.
+
+    Args:
+        lines (iterable): The lines of the file.
+        fields (tuple, optional): The fields to keep, in output order. Default is all fields.
+
+    Yields:
+        tuple: The converted values of the requested fields.
+    """
+    converters = [(field, CONVERTERS[field]) for field in fields]
+    for line in lines:
+        if line.strip():
+            record = json.loads(line)
+            yield tuple([convert(record[field]) for field, convert in converters])
+
+
+def validate(rows, salary_index, minimum_wage=1000, skip_invalid=False):
+    """
+    Checks every row against the minimum wage.
+
+    Args:
+        rows (iterable): The parsed rows.
+        salary_index (int): The position of the salary in each row.
+        minimum_wage (float, optional): The lowest salary allowed. Default is 1000.
+        skip_invalid (bool, optional): Drop rows below the minimum wage instead of raising.
+
+    Yields:
+        tuple: The rows whose salary is at least the minimum wage.
+
+    Raises:
+        ValueError: If a row is below the minimum wage and skip_invalid is False.
+    """
+    for number, row in enumerate(rows, 1):
+        if row[salary_index] < minimum_wage:
+            if skip_invalid:
+                continue
+            raise ValueError(f"Record {number}: minimum wage is ${minimum_wage}, got {row[salary_index]}")
+        yield row
+
+
+def chunked(items, size):
+    """
+    Groups items into lists of at most size items.
+
+    Args:
+        items (iterable): The items to group.
+        size (int): The chunk size.
+
+    Yields:
+        list: The next chunk.
+    """
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ingest(source, fmt="csv", fields=FIELDS, where=None, minimum_wage=1000,
+           skip_invalid=False, chunk_size=10_000):
+    """
+    Streams employees from a CSV or JSON lines export in bounded memory.
+
+    The stages are chained generators: parse, validate against the minimum
+    wage, filter, then build. Only chunk_size records are alive at a time.
+    When only some fields are requested, the other fields are never
+    converted or kept and the chunks hold named tuples instead of Employee
+    objects.
+
+    Args:
+        source (str or file): A path, or an open text file.
+        fmt (str, optional): "csv" or "jsonl". Default is "csv".
+        fields (tuple, optional): The fields to keep. Default is all fields, building Employee objects.
+        where (callable, optional): Keeps only the records it returns True for.
+            It receives a named tuple of the requested fields.
+        minimum_wage (float, optional): The lowest salary allowed. Default is 1000.
+        skip_invalid (bool, optional): Drop records below the minimum wage instead of raising.
+        chunk_size (int, optional): The number of records per chunk. Default is 10000.
+
+    Yields:
+        list: The next chunk of Employee objects or named tuples.
+    """
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as fp:
+            yield from ingest(fp, fmt, fields, where, minimum_wage, skip_invalid, chunk_size)
+        return
+
+    fields = tuple(fields)
+    parsed_fields = fields if "salary" in fields else fields + ("salary",)
+    parse = {"csv": parse_csv, "jsonl": parse_jsonl}[fmt]
+    rows = validate(parse(source, parsed_fields), parsed_fields.index("salary"), minimum_wage, skip_invalid)
+    if parsed_fields != fields:
+        rows = (row[:-1] for row in rows)
+
+    if fields == FIELDS and where is None:
+        records = starmap(Employee, rows)
+    else:
+        Record = namedtuple("Record", fields)
+        records = map(Record._make, rows)
+        if where is not None:
+            records = filter(where, records)
+        if fields == FIELDS:
+            records = starmap(Employee, records)
+    yield from chunked(records, chunk_size)
+
+
+if __name__ == "__main__":
+    # Ingest a small CSV export in chunks of two
+    export = io.StringIO(
+        "name,age,salary,position\n"
+        "Abi,39,2000,Programmer\n"
+        "Bob,23,1000,Driver\n"
+        "Mary,31,3000,Driver\n"
+    )
+    for chunk in ingest(export, chunk_size=2):
+        print(chunk)
+
+    # Skip the ages and keep only the drivers earning over 1500
+    export.seek(0)
+    for chunk in ingest(export, fields=("name", "salary", "position"), where=lambda r: r.position == "Driver" and r.salary > 1500):
+        print(chunk)
@@ -63,14 +63,163 @@ class Employee:
         self.project = project
 
 
-# Create an instance of Project
-p = Project("Django App", 20000, "Globomantics")
+class ProjectRegistry:
+    """
+    A flyweight registry sharing one Project instance per (name, client).
+
+    Loaders ask the registry for projects instead of creating them, so
+    every employee on a project refers to the same object. Employees put on
+    a project through assign are also kept in a set per project, so finding
+    the staff of a project does not scan the workforce. Employee.project
+    itself stays a plain attribute: assigning it directly works as before
+    but bypasses the staff sets, until the employee is passed to assign
+    again.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a ProjectRegistry object.
+        """
+        self._projects = {}
+        # The employees assigned to every project, by project id; the
+        # registry keeps its projects alive, so their ids identify them
+        self._staff = {}
+        # The project every assigned employee is in the staff of, which
+        # Employee.project may no longer be if it was assigned directly
+        self._assigned = {}
+
+    def get(self, name, payment, client):
+        """
+        Returns the shared project with the given name and client, creating it if needed.
+
+        Args:
+            name (str): The name of the project.
+            payment (int): The payment for the project.
+            client (str): The client for the project.
+
+        Returns:
+            Project: The shared instance.
 
-# Create an instance of Employee
-e = Employee("Abi", 39, 1000, p)
+        Raises:
+            ValueError: If the project is already registered with a different payment.
+        """
+        project = self._projects.get((name, client))
+        if project is None:
+            project = self._projects[name, client] = Project(name, payment, client)
+            self._staff[id(project)] = set()
+        elif project.payment != payment:
+            raise ValueError(f"{name} for {client} is registered with a payment of {project.payment}, not {payment}")
+        return project
+
+    def intern(self, project):
+        """
+        Returns the shared instance equal to a project, registering it if it is new.
 
-# Output the project details
-print(e.project)
+        Args:
+            project (Project): A project, e.g. one decoded from a file.
+
+        Returns:
+            Project: The shared instance.
+        """
+        return self.get(project.name, project.payment, project.client)
 
-# Notify the client about the project progress
-e.project.notify_client()
+    def assign(self, employee, project=None):
+        """
+        Puts an employee on a project and records it in the project's staff.
+
+        The employee leaves the staff of the project it was last assigned
+        to. The project is replaced by its shared instance.
+
+        Args:
+            employee (Employee): The employee.
+            project (Project, optional): The new project. Default is the employee's
+                current project, e.g. to index an employee created by a loader
+                or one whose project was assigned directly.
+
+        Returns:
+            Project: The shared instance the employee now works on.
+        """
+        if project is None:
+            project = employee.project
+        project = self.intern(project)
+        previous = self._assigned.get(employee)
+        if previous is not None:
+            self._staff[id(previous)].discard(employee)
+        employee.project = project
+        self._staff[id(project)].add(employee)
+        self._assigned[employee] = project
+        return project
+
+    def unassign(self, employee):
+        """
+        Removes an employee, e.g. one leaving the company, from the staff of its project.
+
+        The registry holds the employees it indexes, so they are only freed
+        once unassigned.
+
+        Args:
+            employee (Employee): An employee put on a project through assign.
+        """
+        project = self._assigned.pop(employee, None)
+        if project is not None:
+            self._staff[id(project)].discard(employee)
+
+    def employees(self, project):
+        """
+        Returns the employees assigned to a registered project.
+
+        Args:
+            project (Project): The shared project instance.
+
+        Returns:
+            list: The employees working on the project.
+
+        Raises:
+            KeyError: If the project is not the registered instance.
+        """
+        staff = self._staff.get(id(project))
+        if staff is None:
+            raise KeyError(project)
+        return list(staff)
+
+    def notify_clients(self):
+        """
+        Notifies the client of every project someone works on, once per project.
+        """
+        for project in self._projects.values():
+            if self._staff[id(project)]:
+                project.notify_client()
+
+    def __len__(self) -> int:
+        """Returns the number of registered projects."""
+        return len(self._projects)
+
+    def __iter__(self):
+        """Yields every registered project."""
+        return iter(self._projects.values())
+
+
+if __name__ == "__main__":
+    # Create an instance of Project
+    p = Project("Django App", 20000, "Globomantics")
+
+    # Create an instance of Employee
+    e = Employee("Abi", 39, 1000, p)
+
+    # Output the project details
+    print(e.project)
+
+    # Notify the client about the project progress
+    e.project.notify_client()
+
+    # Share one instance per project and look up who works on it
+    projects = ProjectRegistry()
+    mary = Employee("Mary", 25, 1200, projects.get("Django App", 20000, "Globomantics"))
+    bob = Employee("Bob", 31, 1500, Project("Django App", 20000, "Globomantics"))
+    projects.assign(mary)
+    projects.assign(bob)
+    print(mary.project is bob.project)
+    print([employee.name for employee in projects.employees(mary.project)])
+    projects.assign(bob, projects.get("Flask API", 8000, "Globomantics"))
+    print([employee.name for employee in projects.employees(mary.project)])
+    projects.notify_clients()
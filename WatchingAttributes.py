@@ -0,0 +1,417 @@
+MISSING = object()
+
+
+class _Watched:
+    """
+    A data descriptor that wraps an attribute and reports every assignment.
+
+    The wrapped attribute keeps working as before: slots, properties and
+    plain instance attributes are read and written through the original
+    descriptor (or the instance ``__dict__`` when there is none), then every
+    callback is called with ``(obj, name, old, new)``. The old value is only
+    read while a callback wants it; otherwise old is MISSING. Values cached
+    in the instance __dict__ that depend on the attribute are dropped
+    directly, without a callback call.
+
+    Attributes:
+        name (str): The name of the watched attribute.
+        original: The descriptor or class attribute this wrapper shadows, or None.
+        owned (bool): Whether the original was defined on the watched class itself.
+        callbacks (list): The callbacks called after every assignment.
+        old_callbacks (list): The callbacks that want the old value.
+        dropped (list): The names of the __dict__ entries dropped on every assignment.
+    """
+
+    def __init__(self, name, original, owned) -> None:
+        """
+        Initializes a _Watched object.
+
+        Args:
+            name (str): The name of the watched attribute.
+            original: The descriptor or class attribute this wrapper shadows, or None.
+            owned (bool): Whether the original was defined on the watched class itself.
+        """
+        self.name = name
+        self.owned = owned
+        self.callbacks = []
+        self.old_callbacks = []
+        self.dropped = []
+        self.__doc__ = getattr(original, "__doc__", None)
+        self.bind(original)
+
+    def bind(self, original):
+        """
+        Sets the attribute this wrapper delegates to.
+
+        Args:
+            original: The descriptor or class attribute to delegate to, or None.
+        """
+        self.original = original
+        # Without a data descriptor the value lives in the instance __dict__
+        self.uses_dict = not hasattr(type(original), "__set__")
+
+    def __get__(self, obj, objtype=None):
+        """
+        Reads the attribute through the original descriptor.
+        """
+        if obj is None:
+            return self
+        if self.uses_dict:
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                if self.original is None:
+                    raise AttributeError(self.name) from None
+            if hasattr(type(self.original), "__get__"):
+                return self.original.__get__(obj, objtype)
+            return self.original
+        return self.original.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        """
+        Writes the attribute through the original descriptor, drops the dependent values and calls the callbacks.
+        """
+        if self.uses_dict:
+            values = obj.__dict__
+            old = values.get(self.name, MISSING) if self.old_callbacks else MISSING
+            values[self.name] = value
+        else:
+            original = self.original
+            old = MISSING
+            if self.old_callbacks:
+                try:
+                    old = original.__get__(obj, type(obj))
+                except AttributeError:
+                    pass
+            original.__set__(obj, value)
+            values = obj.__dict__ if self.dropped else None
+        for cache_name in self.dropped:
+            values.pop(cache_name, None)
+        for callback in self.callbacks:
+            callback(obj, self.name, old, value)
+
+    def __delete__(self, obj):
+        """
+        Deletes the attribute through the original descriptor.
+        """
+        if self.uses_dict:
+            try:
+                del obj.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        else:
+            self.original.__delete__(obj)
+
+
+def _lookup(cls, name):
+    """
+    Finds the class attribute a new wrapper on cls would shadow.
+
+    Args:
+        cls (type): The class to search, following its MRO.
+        name (str): The attribute name.
+
+    Returns:
+        tuple: The attribute (or None) and whether it is defined on cls itself.
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name], klass is cls
+    return None, False
+
+
+def _repoint(cls, name, old, new):
+    """
+    Points the wrappers of subclasses that shadowed old at new instead.
+
+    Without this a subclass watched before its base would bypass the base
+    wrapper's callbacks.
+
+    Args:
+        cls (type): The class whose subclasses are updated.
+        name (str): The attribute name.
+        old: The attribute the subclass wrappers currently delegate to.
+        new: The attribute they should delegate to.
+    """
+    for subclass in cls.__subclasses__():
+        attribute = subclass.__dict__.get(name, MISSING)
+        if attribute is MISSING:
+            _repoint(subclass, name, old, new)
+        elif isinstance(attribute, _Watched) and attribute.original is old:
+            attribute.bind(new)
+
+
+def _wrapper(cls, name):
+    """
+    Returns the watch wrapper of an attribute of a class, wrapping the attribute first if needed.
+    """
+    wrapper = cls.__dict__.get(name)
+    if not isinstance(wrapper, _Watched):
+        original, owned = _lookup(cls, name)
+        wrapper = _Watched(name, original, owned)
+        setattr(cls, name, wrapper)
+        _repoint(cls, name, original, wrapper)
+    return wrapper
+
+
+def watch(cls, name, callback, old=True):
+    """
+    Calls a callback after every assignment to an attribute of a class.
+
+    The attribute is wrapped at class level the first time it is watched, so
+    classes nobody watches pay nothing. Works for slots, properties and plain
+    instance attributes.
+
+    Args:
+        cls (type): The class to watch, including its subclasses.
+        name (str): The name of the attribute.
+        callback (callable): Called as callback(obj, name, old, new); old is
+            MISSING if the attribute was not set on the instance before.
+        old (bool, optional): Whether the callback uses the old value. Reading
+            it costs a get per assignment, so callbacks that do not need it
+            pass False and get MISSING, unless another callback reads it.
+            Default is True.
+    """
+    wrapper = _wrapper(cls, name)
+    wrapper.callbacks.append(callback)
+    if old:
+        wrapper.old_callbacks.append(callback)
+
+
+def unwatch(cls, name, callback):
+    """
+    Stops calling a callback registered with watch.
+
+    The original attribute is restored once the last callback is removed.
+
+    Args:
+        cls (type): The watched class.
+        name (str): The name of the attribute.
+        callback (callable): The callback to remove.
+
+    Raises:
+        ValueError: If the callback is not watching the attribute.
+    """
+    wrapper = cls.__dict__.get(name)
+    if not isinstance(wrapper, _Watched):
+        raise ValueError(f"{cls.__name__}.{name} is not watched")
+    wrapper.callbacks.remove(callback)
+    if callback in wrapper.old_callbacks:
+        wrapper.old_callbacks.remove(callback)
+    if not wrapper.callbacks and not wrapper.dropped:
+        if wrapper.owned:
+            setattr(cls, name, wrapper.original)
+        else:
+            delattr(cls, name)
+        _repoint(cls, name, wrapper, wrapper.original)
+
+
+def defining_class(cls, name):
+    """
+    Returns the class to watch or replace an attribute on for instances of cls.
+
+    That is the class in the MRO of cls that defines the attribute, so all
+    its subclasses are covered at once; plain instance attributes, defined
+    by no class, belong to cls itself.
+
+    Args:
+        cls (type): The class of the instances.
+        name (str): The attribute name.
+
+    Returns:
+        type: The defining class, or cls.
+    """
+    for klass in cls.__mro__[:-1]:
+        if name in klass.__dict__:
+            return klass
+    return cls
+
+
+def class_attribute(owner, name):
+    """
+    Returns the attribute a class defines itself, looking through a watch wrapper.
+
+    Args:
+        owner (type): The class.
+        name (str): The attribute name.
+
+    Returns:
+        The descriptor or value the class defines, or None if it defines none.
+    """
+    attribute = owner.__dict__.get(name)
+    return attribute.original if isinstance(attribute, _Watched) else attribute
+
+
+def replace_class_attribute(owner, name, new):
+    """
+    Replaces the attribute a class defines, keeping a watch wrapper in front of it.
+
+    With a watch wrapper on the class, the wrapper delegates to the new
+    attribute and its callbacks keep being called; otherwise the class
+    attribute itself is replaced. Watch wrappers of subclasses that
+    delegated to the old attribute delegate to the new one.
+
+    Args:
+        owner (type): The class.
+        name (str): The attribute name.
+        new: The new descriptor or value, or None to remove the attribute and
+            use the instance __dict__.
+
+    Returns:
+        The attribute replaced, as class_attribute returns it.
+    """
+    current = owner.__dict__.get(name)
+    if isinstance(current, _Watched):
+        old = current.original
+        current.bind(new)
+    else:
+        old = current
+        if new is not None:
+            setattr(owner, name, new)
+        elif current is not None:
+            delattr(owner, name)
+    _repoint(owner, name, old, new)
+    return old
+
+
+class _SlotCachedProperty(property):
+    """
+    The property a cached_derived caching in a slot installs; derived is that cached_derived.
+    """
+
+
+class cached_derived:
+    """
+    A cached attribute that is recomputed only after one of its inputs changes.
+
+    Like functools.cached_property the value is cached in the instance
+    __dict__ under the same name, so later reads skip the descriptor. Unlike
+    it, classes with __slots__ are supported too, if they declare a slot
+    named ``_<name>`` to cache the value in. Slotted classes without one,
+    like those of ImplementingClassInheritance, have nowhere to keep the
+    value and are rejected; a subclass adding the slot can use it. The
+    listed input attributes are watched and any assignment to one of them
+    drops the cached value.
+
+    Attributes:
+        depends_on (tuple): The names of the attributes the value is derived from.
+        cache_name (str): The attribute holding the cached value.
+        in_slot (bool): Whether the value is cached in a slot.
+    """
+
+    def __init__(self, func=None, *, depends_on=()) -> None:
+        """
+        Initializes a cached_derived object.
+
+        Args:
+            func (callable, optional): Computes the value from the instance.
+            depends_on (tuple): The names of the attributes the value is derived from.
+        """
+        self.depends_on = tuple(depends_on)
+        self.func = None
+        if func is not None:
+            self(func)
+
+    def __call__(self, func):
+        """
+        Sets the function computing the value, so the object can be used as a decorator.
+
+        Args:
+            func (callable): Computes the value from the instance.
+
+        Returns:
+            cached_derived: This descriptor.
+        """
+        self.func = func
+        self.__doc__ = func.__doc__
+        return self
+
+    def __set_name__(self, owner, name):
+        """
+        Names the cache attribute and starts watching the inputs.
+        """
+        self.name = name
+        self.in_slot = hasattr(owner, f"_{name}")
+        self.cache_name = f"_{name}" if self.in_slot else name
+        if not self.in_slot and not owner.__dictoffset__:
+            raise TypeError(f"{owner.__name__} has no __dict__ or _{name} slot to cache {name} in")
+        for dependency in self.depends_on:
+            if self.in_slot:
+                watch(owner, dependency, self._invalidate, old=False)
+            else:
+                _wrapper(owner, dependency).dropped.append(self.cache_name)
+        if self.in_slot:
+            # A property calling a plain function is read faster than this
+            # descriptor's __get__, which matters as slot reads always go
+            # through the descriptor.
+            getter = _SlotCachedProperty(self._slot_getter(), doc=self.__doc__)
+            getter.derived = self
+            setattr(owner, name, getter)
+
+    def _slot_getter(self):
+        """
+        Builds the getter of the property used for classes caching in a slot.
+
+        Returns:
+            function: Returns the slot value, computing and storing it if unset.
+        """
+        cache_name = self.cache_name
+        func = self.func
+
+        def getter(obj):
+            try:
+                value = getattr(obj, cache_name)
+            except AttributeError:
+                value = MISSING
+            if value is MISSING:
+                value = func(obj)
+                setattr(obj, cache_name, value)
+            return value
+
+        return getter
+
+    def _invalidate(self, obj, name, old, new):
+        """
+        Drops the value cached in a slot after an input is assigned.
+
+        The new value is not compared with the old one: reading the old value
+        would cost every assignment a get, more than recomputing after the
+        rare assignment of an unchanged value. Values cached in the __dict__
+        are dropped by the watch wrapper itself.
+        """
+        # Marking the slot is cheaper than deleting it and catching the
+        # AttributeError when it was never read.
+        setattr(obj, self.cache_name, MISSING)
+
+    def __get__(self, obj, objtype=None):
+        """
+        Computes the value and caches it in the instance __dict__, where later reads find it.
+        """
+        if obj is None:
+            return self
+        value = self.func(obj)
+        setattr(obj, self.cache_name, value)
+        return value
+
+
+if __name__ == "__main__":
+    # A slotted class with a cached annual salary
+    class Contractor:
+        __slots__ = ("name", "salary", "_annual_salary")
+
+        def __init__(self, name, salary) -> None:
+            self.name = name
+            self.salary = salary
+
+        @cached_derived(depends_on=("salary",))
+        def annual_salary(self):
+            print("Computing the annual salary...")
+            return self.salary * 12
+
+    c = Contractor("Abi", 1200)
+    print(c.annual_salary)  # Computed
+    print(c.annual_salary)  # Cached
+    c.name = "Abigail"
+    print(c.annual_salary)  # Still cached, name is not an input
+    c.salary = 1500
+    print(c.annual_salary)  # Recomputed after the salary changed
@@ -0,0 +1,45 @@
+"""
+Compares notifying the clients of many projects one call at a time with
+AsyncNotifier, using sinks that wait a fixed latency per send.
+
+Run from the repository root:
+
+    python -m benchmarks.async_notifications [projects] [clients] [latency ms] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+from AsyncNotifications import MemorySink, notify_clients
+from UsingDataClasses import Project
+
+
+def send_sync(client, project, latency):
+    """A blocking sink call, as Project.notify_client would make to a real service."""
+    time.sleep(latency)
+
+
+def main(count=2000, clients=200, latency_ms=5, concurrency=50):
+    latency = latency_ms / 1000
+    projects = [Project(f"Project {i}", 1000, f"Client {i % clients}") for i in range(count)]
+
+    start = time.perf_counter()
+    for project in projects:
+        send_sync(project.client, project, latency)
+    serial = time.perf_counter() - start
+
+    sink = MemorySink(latency)
+    start = time.perf_counter()
+    failures = asyncio.run(notify_clients(projects, sink, concurrency))
+    concurrent = time.perf_counter() - start
+    assert not failures and sum(len(sent) for _, sent in sink.sent) == count
+
+    print(f"{count} projects, {clients} clients, {latency_ms}ms per send")
+    print(f"sync loop:     {serial:.2f}s, {count / serial:,.0f} projects/s, {count} sends")
+    print(f"AsyncNotifier: {concurrent:.2f}s, {count / concurrent:,.0f} projects/s, {len(sink.sent)} sends")
+    print(f"speedup:       {serial / concurrent:.0f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:5]]
+    main(*args)
@@ -0,0 +1,42 @@
+"""
+Compares calling increase_salary and has_slots on a mixed list of Tester
+and Developer objects one call at a time with call_batch.
+
+Run from the repository root:
+
+    python -m benchmarks.batch_dispatch [objects] [repeats]
+"""
+import sys
+
+from BatchDispatch import call_batch
+from ImplementingClassInheritance import Tester, Developer
+from benchmarks.timing import best_of
+
+
+def build(count):
+    """
+    Builds alternating Tester and Developer objects, the worst case for per-call caches.
+    """
+    return [Tester(f"Tester {i}", 30, 1000.0) if i % 2 else Developer(f"Developer {i}", 30, 1000.0, "JS")
+            for i in range(count)]
+
+
+def main(count=1_000_000, repeats=5):
+    mixed = build(count)
+    testers = [Tester(f"Tester {i}", 30, 1000.0) for i in range(count)]
+    assert call_batch(mixed, "has_slots") == [o.has_slots() for o in mixed]
+    for label, team in (("mixed", mixed), ("testers only", testers)):
+        print(f"{count} objects, {label}")
+        cases = [
+            ("increase_salary", lambda: [o.increase_salary(0.001) for o in team],
+             lambda: call_batch(team, "increase_salary", 0.001)),
+            ("has_slots", lambda: [o.has_slots() for o in team], lambda: call_batch(team, "has_slots")),
+        ]
+        for name, per_call, batched in cases:
+            loop = best_of(per_call, repeats)
+            batch = best_of(batched, repeats)
+            print(f"  {name:16} loop {loop * 1000:7.1f}ms, call_batch {batch * 1000:7.1f}ms, {loop / batch:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
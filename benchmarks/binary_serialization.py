@@ -0,0 +1,43 @@
+"""
+Compares checkpointing employees with eval(repr(...)) against the binary
+codec in BinarySerialization, then checks that employees streamed from a
+generator keep their own projects.
+
+Run from the repository root:
+
+    python -m benchmarks.binary_serialization [employees]
+"""
+import sys
+
+import UsingDataClasses
+from BinarySerialization import dumps, loads
+from InstantiatingCustomClasses import Employee
+from benchmarks.timing import timed
+
+
+def main(count=100_000):
+    employees = [Employee(f"Employee {i}", 20 + i % 45, 1000 + i % 9000 + 0.5, "Driver") for i in range(count)]
+
+    repr_eval, copies = timed(lambda: [eval(repr(e)) for e in employees], 1)
+    binary, copies = timed(lambda: loads(dumps(employees)), 1)
+    assert [vars(e) for e in copies] == [vars(e) for e in employees]
+
+    print(f"employees: {count}")
+    print(f"eval(repr(...)): {repr_eval:6.3f}s")
+    print(f"dumps/loads:     {binary:6.3f}s")
+    print(f"speedup:         {repr_eval / binary:6.1f}x")
+
+    # Projects of earlier blocks are freed while a generator is streamed, so
+    # new projects can get their ids
+    def staff():
+        for i in range(count // 5):
+            project = UsingDataClasses.Project(f"Project {i}", 1000 + i, "Globomantics")
+            yield UsingDataClasses.Employee(f"Employee {i}", 30, 1000.0, project)
+
+    streamed = loads(dumps(staff()))
+    assert [e.project.name for e in streamed] == [f"Project {i}" for i in range(count // 5)]
+    print(f"streamed:        {len(streamed)} employees with their own projects")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
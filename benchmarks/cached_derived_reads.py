@@ -0,0 +1,105 @@
+"""
+Times a read-heavy payroll report that reads annual_salary many times per
+employee, with the value recomputed on every read, cached by hand, and
+cached with cached_derived on a regular and a slotted class.
+
+Run from the repository root:
+
+    python -m benchmarks.cached_derived_reads [employees] [reads]
+"""
+import sys
+import time
+
+from ImplementingClassInheritance import Employee as SlottedEmployee
+from WatchingAttributes import cached_derived
+
+
+class Recomputed:
+    """An employee whose annual salary is recomputed on every read."""
+
+    def __init__(self, salary) -> None:
+        self.salary = salary
+
+    @property
+    def annual_salary(self):
+        return self.salary * 12
+
+
+class HandCached:
+    """An employee caching the annual salary by hand, as ManagingAttributeAccess used to."""
+
+    def __init__(self, salary) -> None:
+        self.salary = salary
+
+    @property
+    def salary(self):
+        return self._salary
+
+    @salary.setter
+    def salary(self, salary):
+        self._annual_salary = None
+        self._salary = salary
+
+    @property
+    def annual_salary(self):
+        if self._annual_salary is None:
+            self._annual_salary = self.salary * 12
+        return self._annual_salary
+
+
+class Derived:
+    """An employee caching the annual salary with cached_derived."""
+
+    def __init__(self, salary) -> None:
+        self.salary = salary
+
+    @cached_derived(depends_on=("salary",))
+    def annual_salary(self):
+        return self.salary * 12
+
+
+class SlottedDerived(SlottedEmployee):
+    """A slotted employee caching the annual salary with cached_derived."""
+
+    __slots__ = ("_annual_salary",)
+
+    def __init__(self, salary) -> None:
+        super().__init__("Employee", 30, salary)
+
+    @cached_derived(depends_on=("salary",))
+    def annual_salary(self):
+        return self.salary * 12
+
+
+def report(employees, reads):
+    """
+    Reads every annual salary several times, raising salaries once in between.
+
+    Args:
+        employees (list): The employees to report on.
+        reads (int): The number of reads per employee.
+
+    Returns:
+        float: The elapsed seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(reads // 2):
+        for employee in employees:
+            employee.annual_salary
+    for employee in employees:
+        employee.salary = employee.salary + 100
+    for _ in range(reads - reads // 2):
+        for employee in employees:
+            employee.annual_salary
+    return time.perf_counter() - start
+
+
+def main(count=100_000, reads=20):
+    print(f"employees: {count}, reads per employee: {reads}")
+    for cls in (Recomputed, HandCached, Derived, SlottedDerived):
+        employees = [cls(1000 + i % 9000) for i in range(count)]
+        print(f"{cls.__name__:15} {report(employees, reads):6.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
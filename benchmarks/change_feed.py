@@ -0,0 +1,73 @@
+"""
+Measures what a ChangeFeed costs salary assignments and raises: with no
+feed, with a feed subscribed to another class, with a feed subscribed to
+the class itself, and after the feed is closed. Then shows coalescing: many
+raises over a few employees leave one event per employee between drains.
+
+Run from the repository root:
+
+    python -m benchmarks.change_feed [employees] [raises per employee]
+"""
+import sys
+import time
+
+import InstantiatingCustomClasses
+from ChangeFeed import ChangeFeed
+from ImplementingClassInheritance import Developer, Tester
+from benchmarks.timing import best_of
+
+
+def measure(employees):
+    """
+    Returns the nanoseconds per salary assignment and per raise.
+    """
+    def assign():
+        for employee in employees:
+            employee.salary = 2000.0
+
+    def increase():
+        for employee in employees:
+            employee.increase_salary(1)
+
+    return [best_of(run) / len(employees) * 1e9 for run in (assign, increase)]
+
+
+def main(count=100_000, raises=100):
+    classes = {
+        "Developer (slots)": [Developer(f"Developer {i}", 30, 1000.0, "JS") for i in range(count)],
+        "Employee (__dict__)": [InstantiatingCustomClasses.Employee(f"Employee {i}", 30, 1000.0, "Programmer")
+                                for i in range(count)],
+    }
+    for label, employees in classes.items():
+        cls = type(employees[0])
+        feed = ChangeFeed(maxsize=2 * count)
+        rows = [("no feed", measure(employees))]
+        feed.subscribe(Tester)
+        rows.append(("feed on another class", measure(employees)))
+        feed.subscribe(cls)
+        rows.append(("subscribed", measure(employees)))
+        queued = len(feed)
+        feed.close()
+        rows.append(("after close", measure(employees)))
+        print(f"{label}: {queued} events queued for {count} employees")
+        for name, (assign, increase) in rows:
+            print(f"  {name:25} salary = {assign:7.1f} ns   increase_salary {increase:7.1f} ns")
+
+    employees = classes["Developer (slots)"][:1000]
+    with ChangeFeed() as feed:
+        feed.subscribe(Developer)
+        start = time.perf_counter()
+        for _ in range(raises):
+            for employee in employees:
+                employee.increase_salary(1)
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        batch = feed.drain()
+        drained = time.perf_counter() - start
+    print(f"{raises * len(employees)} raises of {len(employees)} employees in {elapsed:.3f} s "
+          f"coalesced into {len(batch)} events, drained in {drained * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100)
@@ -0,0 +1,52 @@
+"""
+Compares the memory held by a list of slotted Employee instances with the
+same records stored in a columnar EmployeeTable.
+
+Run from the repository root:
+
+    python -m benchmarks.columnar_memory [rows]
+"""
+import sys
+
+from ImplementingClassInheritance import Employee, Tester, Developer
+from ColumnarStorage import EmployeeTable
+from benchmarks.memory import measure
+
+FRAMEWORKS = ("JS", "Django", "Flask", "React")
+
+
+def make_employees(rows):
+    """
+    Builds a mixed list of Employee, Tester and Developer instances.
+
+    Args:
+        rows (int): The number of instances to build.
+
+    Returns:
+        list: The instances.
+    """
+    employees = []
+    for i in range(rows):
+        name = f"Employee {i % 5000}"
+        age = 20 + i % 45
+        salary = 1000.0 + i % 9000
+        if i % 3 == 0:
+            employees.append(Developer(name, age, salary, FRAMEWORKS[i % 4]))
+        elif i % 3 == 1:
+            employees.append(Tester(name, age, salary))
+        else:
+            employees.append(Employee(name, age, salary))
+    return employees
+
+
+def main(rows=1_000_000):
+    employees, list_bytes = measure(lambda: make_employees(rows))
+    table, table_bytes = measure(lambda: EmployeeTable(employees))
+    print(f"rows:            {rows}")
+    print(f"slotted objects: {list_bytes / rows:8.1f} bytes/row")
+    print(f"EmployeeTable:   {table_bytes / rows:8.1f} bytes/row")
+    print(f"ratio:           {list_bytes / table_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
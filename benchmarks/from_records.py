@@ -0,0 +1,44 @@
+"""
+Compares building employees one by one through the salary setter with the
+batch-validated ``from_records`` constructors.
+
+Run from the repository root:
+
+    python -m benchmarks.from_records [rows]
+"""
+import sys
+
+import AccessingClassAttributesMethods
+import ManagingAttributeAccess
+import writeonly
+from benchmarks.timing import best_of
+
+
+def main(rows=1_000_000):
+    cases = [
+        (
+            "AccessingClassAttributesMethods",
+            AccessingClassAttributesMethods.Employee,
+            [(f"Employee {i}", 20 + i % 45, 1000 + i % 9000) for i in range(rows)],
+        ),
+        (
+            "ManagingAttributeAccess",
+            ManagingAttributeAccess.Employee,
+            [(f"Employee {i}", 20 + i % 45, 1000 + i % 9000, "Driver") for i in range(rows)],
+        ),
+        (
+            "writeonly",
+            writeonly.Employee,
+            [(f"Employee {i}", 1000 + i % 9000) for i in range(rows)],
+        ),
+    ]
+    print(f"rows: {rows}")
+    for label, cls, records in cases:
+        per_object = best_of(lambda: [cls(*record) for record in records])
+        batch = best_of(lambda: cls.from_records(records))
+        print(f"{label:32} per-object {per_object:6.3f}s  from_records {batch:6.3f}s  "
+              f"speedup {per_object / batch:4.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
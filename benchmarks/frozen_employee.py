@@ -0,0 +1,41 @@
+"""
+Compares readonly.Employee with the tuple-backed FrozenEmployee: memory per
+instance, salary and name read latency, and building a set of them.
+
+Run from the repository root:
+
+    python -m benchmarks.frozen_employee [employees]
+"""
+import sys
+import timeit
+
+from benchmarks.memory import measure
+from benchmarks.timing import best_of
+from readonly import Employee, FrozenEmployee
+
+
+def main(count=1_000_000):
+    names = [f"Employee {i}" for i in range(count)]
+    employees, employee_bytes = measure(lambda: [Employee(name, 1000.0 + i) for i, name in enumerate(names)])
+    frozen, frozen_bytes = measure(lambda: [FrozenEmployee(name, 1000.0 + i) for i, name in enumerate(names)])
+    # The salary floats are shared by neither list, so subtract them from both
+    floats = count * sys.getsizeof(1000.0)
+    print(f"{count} employees")
+    print(f"memory, Employee:       {(employee_bytes - floats) / count:6.1f} bytes/instance")
+    print(f"memory, FrozenEmployee: {(frozen_bytes - floats) / count:6.1f} bytes/instance")
+
+    e, f = employees[0], frozen[0]
+    for attribute in ("salary", "name"):
+        for label, obj in (("Employee", e), ("FrozenEmployee", f)):
+            timer = timeit.Timer(f"obj.{attribute}", globals={"obj": obj})
+            number, _ = timer.autorange()
+            best = min(timer.repeat(5, number)) / number
+            print(f"read {attribute:6}, {label + ':':15} {best * 1e9:6.1f} ns")
+
+    setup = best_of(lambda: set(frozen), 1)
+    assert len(set(frozen)) == count
+    print(f"set of {count} FrozenEmployee: {setup:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
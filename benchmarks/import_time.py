@@ -0,0 +1,73 @@
+"""
+Measures the cold start of the classes_oop package and of every module,
+and checks that importing them prints nothing.
+
+Every import runs in a fresh interpreter with -X importtime, which reports
+the cumulative import time of each module; the best of a few runs counts.
+The package itself must stay far below the budget, since it imports no
+module until one is used.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time [budget ms] [runs]
+
+The run exits with status 1 if an import takes longer than the budget or
+writes to stdout.
+"""
+import os
+import re
+import subprocess
+import sys
+
+from classes_oop import MODULES
+
+# The last line of -X importtime output is the module imported by -c
+_TIMING = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$")
+
+
+def import_time(module, runs=5):
+    """
+    Returns the best cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module (str): The module to import.
+        runs (int, optional): The number of interpreters to start. Default is 5.
+
+    Returns:
+        tuple: The import time in milliseconds and what the import printed.
+    """
+    best, output = None, ""
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True, cwd=os.getcwd(),
+        )
+        output = process.stdout
+        microseconds = None
+        for line in process.stderr.splitlines():
+            match = _TIMING.search(line)
+            if match and match.group(2) == module:
+                microseconds = int(match.group(1))
+        if microseconds is not None and (best is None or microseconds < best):
+            best = microseconds
+    return best / 1000, output
+
+
+def main(budget=150.0, runs=5):
+    failures = 0
+    for module in ("classes_oop",) + MODULES:
+        milliseconds, output = import_time(module, runs)
+        status = "ok"
+        if output:
+            status = "prints on import"
+        elif milliseconds > budget:
+            status = "over budget"
+        failures += status != "ok"
+        print(f"{module:35} {milliseconds:8.2f} ms  {status}", flush=True)
+    print(f"{failures} imports over {budget:g} ms or with side effects")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else 150.0,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 5))
@@ -0,0 +1,49 @@
+"""
+Measures what Instrumentation costs: salary reads and writes, annual_salary
+reads and increase_salary calls on ManagingAttributeAccess.Employee before
+instrumenting, while instrumented, and after uninstrumenting.
+
+Run from the repository root:
+
+    python -m benchmarks.instrumentation_overhead [calls]
+"""
+import sys
+import timeit
+
+from Instrumentation import Instrumentation
+from ManagingAttributeAccess import Employee
+
+STATEMENTS = {
+    "salary get": "e.salary",
+    "salary set": "e.salary = 2000",
+    "annual_salary hit": "e.annual_salary",
+    "increase_salary": "e.increase_salary(0)",
+}
+
+
+def timings(number):
+    """
+    Returns the best time per call of every statement, in nanoseconds.
+    """
+    e = Employee("Abi", 39, 2000, "Programmer")
+    return {label: min(timeit.repeat(statement, number=number, repeat=5, globals={"e": e})) / number * 1e9
+            for label, statement in STATEMENTS.items()}
+
+
+def main(number=200_000):
+    before = timings(number)
+    instrumentation = Instrumentation()
+    instrumentation.instrument(Employee)
+    instrumented = timings(number)
+    instrumentation.uninstrument()
+    after = timings(number)
+    print(f"{'':18} {'before':>8} {'instrumented':>13} {'after':>8}")
+    for label in STATEMENTS:
+        print(f"{label:18} {before[label]:6.0f}ns {instrumented[label]:11.0f}ns {after[label]:6.0f}ns")
+    for key, entry in instrumentation.snapshot()["attributes"].items():
+        print(key, {operation: counts["calls"] if isinstance(counts, dict) else round(counts, 3)
+                    for operation, counts in entry.items()})
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,22 @@
+"""
+The memory measurement shared by the benchmarks.
+"""
+import tracemalloc
+
+
+def measure(build):
+    """
+    Measures the memory allocated by a callable that builds a container.
+
+    Args:
+        build (callable): Builds and returns the container.
+
+    Returns:
+        tuple: The container and the number of bytes it holds.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
@@ -0,0 +1,45 @@
+"""
+Measures the per-hire cost of creating employees from a date of birth: the
+original new_employee code, the cached single-hire path and the
+new_employees batch factory.
+
+Run from the repository root:
+
+    python -m benchmarks.new_employee_age [hires]
+"""
+import sys
+from datetime import date, timedelta
+
+from AccessingClassAttributesMethods import Employee
+from benchmarks.timing import best_of
+
+
+def original_new_employee(cls, name, dob):
+    """
+    The new_employee implementation before ages were cached.
+
+    Args:
+        cls (type): The Employee class.
+        name (str): The name of the employee.
+        dob (date): The date of birth of the employee.
+
+    Returns:
+        Employee: A new instance of Employee.
+    """
+    now = date.today()
+    age = now.year - dob.year - ((now.month, now.day) < (dob.month, dob.day))
+    return cls(name, age, cls.minimum_wage)
+
+
+def main(hires=200_000):
+    names = [f"Hire {i}" for i in range(hires)]
+    # Onboarding batches share a limited range of birth dates
+    dobs = [date(1960, 1, 1) + timedelta(days=i % 15000) for i in range(hires)]
+    print(f"hires: {hires}")
+    print(f"original new_employee: {best_of(lambda: [original_new_employee(Employee, n, d) for n, d in zip(names, dobs)], 1) / hires * 1e6:6.2f} us/hire")
+    print(f"cached new_employee:   {best_of(lambda: [Employee.new_employee(n, d) for n, d in zip(names, dobs)], 1) / hires * 1e6:6.2f} us/hire")
+    print(f"new_employees batch:   {best_of(lambda: Employee.new_employees(names, dobs), 1) / hires * 1e6:6.2f} us/hire")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
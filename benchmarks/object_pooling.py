@@ -0,0 +1,96 @@
+"""
+Compares allocating temporary Tester and Developer objects for what-if
+salary modeling with recycling them through an EmployeePool: allocation
+rate, and garbage collector runs before and after each workload.
+
+Every round builds a scenario team, raises it and throws it away, like a
+simulation evaluating one what-if after another, while the workforce it
+models stays in memory; the full collections triggered by the temporary
+objects have to scan it.
+
+Run from the repository root:
+
+    python -m benchmarks.object_pooling [employees per round] [rounds] [workforce]
+"""
+import gc
+import sys
+import time
+
+from ImplementingClassInheritance import Employee, Tester, Developer
+from ObjectPooling import EmployeePool
+
+
+def rows(size):
+    """
+    Returns the constructor arguments of a scenario team, half testers and half developers.
+    """
+    testers = [(f"Tester {i}", 30, 1000.0 + i) for i in range(size // 2)]
+    developers = [(f"Developer {i}", 30, 1000.0 + i, "JS") for i in range(size - size // 2)]
+    return testers, developers
+
+
+def allocate(size, rounds):
+    """
+    Runs the workload creating new objects every round.
+    """
+    testers, developers = rows(size)
+    total = 0.0
+    for _ in range(rounds):
+        team = [Tester(*row) for row in testers] + [Developer(*row) for row in developers]
+        for employee in team:
+            employee.increase_salary(10)
+            total += employee.salary
+    return total
+
+
+def pooled(size, rounds):
+    """
+    Runs the workload recycling the objects of the previous round.
+    """
+    testers, developers = rows(size)
+    pool = EmployeePool(capacity=size)
+    total = 0.0
+    for _ in range(rounds):
+        with pool.scope() as scope:
+            team = scope.acquire_many(Tester, testers) + scope.acquire_many(Developer, developers)
+            for employee in team:
+                employee.increase_salary(10)
+                total += employee.salary
+    return total
+
+
+def collections():
+    """
+    Returns the number of collections run so far in each generation.
+    """
+    return [generation["collections"] for generation in gc.get_stats()]
+
+
+def run(label, workload, size, rounds):
+    """
+    Runs a workload and prints its allocation rate and the collections it caused.
+    """
+    gc.collect()
+    before = collections()
+    start = time.perf_counter()
+    total = workload(size, rounds)
+    elapsed = time.perf_counter() - start
+    after = collections()
+    print(f"{label:9} {size * rounds / elapsed / 1e6:5.2f}M objects/s, {elapsed:6.2f}s")
+    print(f"          gc collections per generation before {before}, after {after}, "
+          f"ran {[b - a for a, b in zip(before, after)]}")
+    return total
+
+
+def main(size=10_000, rounds=100, live=1_000_000):
+    workforce = [Employee(f"Employee {i}", 30, 1000.0) for i in range(live)]
+    print(f"{rounds} rounds of {size} temporary employees, {len(workforce)} employees in memory")
+    expected = run("allocate", allocate, size, rounds)
+    actual = run("pooled", pooled, size, rounds)
+    assert expected == actual
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000)
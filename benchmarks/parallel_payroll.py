@@ -0,0 +1,33 @@
+"""
+Measures how ParallelPayroll scales from one process to every CPU, and
+checks each parallel run gives exactly the same salaries as the serial one.
+
+Run from the repository root:
+
+    python -m benchmarks.parallel_payroll [employees] [max workers]
+"""
+import os
+import sys
+import time
+
+from ManagingAttributeAccess import Employee
+from ParallelPayroll import run_payroll
+
+
+def main(count=1_000_000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    workforce = [Employee(f"Employee {i}", 20 + i % 45, 1000 + i % 9000, "Driver") for i in range(count)]
+    serial = None
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = run_payroll(workforce, 10, 50, workers=workers)
+        elapsed = time.perf_counter() - start
+        if serial is None:
+            serial, baseline = result, elapsed
+        assert result == serial, f"{workers} workers differ from the serial payroll"
+        print(f"{workers} workers: {elapsed:.3f}s, {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,83 @@
+"""
+Times dashboard payroll queries answered by PayrollAggregates against
+scans over every employee, and the cost the aggregates add to raises.
+
+Run from the repository root:
+
+    python -m benchmarks.payroll_aggregates [employees] [raises]
+"""
+import random
+import sys
+import time
+
+from ImplementingClassInheritance import Developer
+from InstantiatingCustomClasses import Employee
+from PayrollAggregates import PayrollAggregates
+from benchmarks.timing import timed
+
+POSITIONS = ("Programmer", "Driver", "Tester", "Manager")
+
+
+def build(count):
+    """
+    Builds a workforce that is three quarters employees and a quarter developers.
+    """
+    rng = random.Random(42)
+    quarter = count // 4
+    workforce = [Employee(f"Employee {i}", 30, rng.randint(1000, 10000), rng.choice(POSITIONS))
+                 for i in range(count - quarter)]
+    workforce += [Developer(f"Developer {i}", 30, rng.randint(1000, 10000), "JS") for i in range(quarter)]
+    return workforce
+
+
+def scan_dashboard(workforce):
+    """
+    Computes the dashboard figures by visiting every employee.
+    """
+    salaries = sorted(e.salary for e in workforce)
+    drivers = [e.salary for e in workforce if getattr(e, "position", None) == "Driver"]
+    return (sum(salaries), sum(salaries) / len(salaries), sum(drivers),
+            salaries[int(0.5 * (len(salaries) - 1))], salaries[int(0.9 * (len(salaries) - 1))])
+
+
+def aggregate_dashboard(payroll):
+    """
+    Reads the same figures from the running aggregates.
+    """
+    return (payroll.total(), payroll.mean(), payroll.total(position="Driver"),
+            payroll.quantile(0.5), payroll.quantile(0.9))
+
+
+def raise_all(workforce, count):
+    """
+    Raises the salaries of count random employees by 1%.
+    """
+    rng = random.Random(7)
+    for employee in rng.choices(workforce, k=count):
+        employee.increase_salary(1)
+
+
+def main(count=1_000_000, raises=100_000):
+    workforce = build(count)
+    print(f"{count} employees")
+    plain, _ = timed(lambda: raise_all(workforce, raises), 1)
+
+    start = time.perf_counter()
+    payroll = PayrollAggregates(workforce)
+    print(f"aggregating:       {time.perf_counter() - start:8.2f}s")
+    watched, _ = timed(lambda: raise_all(workforce, raises), 1)
+    print(f"raise, plain:      {plain / raises * 1e6:8.2f}us")
+    print(f"raise, aggregated: {watched / raises * 1e6:8.2f}us")
+
+    scan, expected = timed(lambda: scan_dashboard(workforce))
+    aggregated, actual = timed(lambda: aggregate_dashboard(payroll), 100)
+    print(f"dashboard, scan:       {scan * 1e3:10.3f}ms")
+    print(f"dashboard, aggregates: {aggregated * 1e3:10.3f}ms  ({scan / aggregated:.0f}x)")
+    for name, exact, estimate in zip(("total", "mean", "drivers", "p50", "p90"), expected, actual):
+        print(f"  {name:8} exact {exact:16.2f}  aggregated {estimate:16.2f}  error {abs(estimate / exact - 1):.2%}")
+    payroll.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
@@ -0,0 +1,93 @@
+"""
+Compares the memory held by a workforce whose loader creates a Project per
+employee with one whose loader shares projects through a ProjectRegistry,
+including the registry's reverse index.
+
+Run from the repository root:
+
+    python -m benchmarks.project_interning [employees] [projects]
+"""
+import sys
+
+from UsingDataClasses import Employee, Project, ProjectRegistry
+from benchmarks.memory import measure
+
+CLIENTS = ("Globomantics", "Carved Rock", "Wired Brain")
+
+
+def project_fields(i, projects):
+    """
+    Returns the project fields of the i-th record, parsed fresh as a loader would.
+    """
+    number = i % projects
+    # Joining builds a new client string per record, like parsing a file would
+    return f"Project {number}", 1000 * (number % 40 + 1), "".join(CLIENTS[number % 3])
+
+
+def load_duplicated(count, projects):
+    """
+    Loads a workforce the way a loader without a registry does, one Project per employee.
+
+    Args:
+        count (int): The number of employees.
+        projects (int): The number of distinct projects.
+
+    Returns:
+        list: The employees.
+    """
+    return [Employee(f"Employee {i}", 20 + i % 45, 1000 + i % 9000, Project(*project_fields(i, projects)))
+            for i in range(count)]
+
+
+def load_interned(count, projects, index=True):
+    """
+    Loads a workforce sharing its projects through a ProjectRegistry.
+
+    Args:
+        count (int): The number of employees.
+        projects (int): The number of distinct projects.
+        index (bool, optional): Whether to assign the employees, filling the
+            registry's staff index. Default is True.
+
+    Returns:
+        tuple: The employees and the registry.
+    """
+    registry = ProjectRegistry()
+    workforce = [Employee(f"Employee {i}", 20 + i % 45, 1000 + i % 9000, registry.get(*project_fields(i, projects)))
+                 for i in range(count)]
+    if index:
+        for employee in workforce:
+            registry.assign(employee)
+    return workforce, registry
+
+
+def main(count=100_000, projects=500):
+    duplicated, duplicated_bytes = measure(lambda: load_duplicated(count, projects))
+    del duplicated
+    (workforce, registry), unindexed_bytes = measure(lambda: load_interned(count, projects, index=False))
+    del workforce, registry
+    (workforce, registry), interned_bytes = measure(lambda: load_interned(count, projects))
+    assert len(registry) == projects
+
+    # Moving employees, directly or through assign, takes them off their old staff
+    moved = workforce[:projects]
+    previous = [employee.project for employee in moved]
+    target = registry.get("Moved", 1000, "Globomantics")
+    moved[1].project = target
+    for employee in moved:
+        registry.assign(employee, target)
+    assert set(map(id, registry.employees(target))) == set(map(id, moved))
+    assert all(employee not in registry.employees(project) for employee, project in zip(moved, previous))
+    registry.unassign(moved[0])
+    assert moved[0] not in registry.employees(target)
+
+    print(f"employees:  {count}, projects: {projects}")
+    print(f"duplicated: {duplicated_bytes / 2**20:8.1f} MB")
+    print(f"interned:   {unindexed_bytes / 2**20:8.1f} MB without the staff index, "
+          f"{interned_bytes / 2**20:.1f} MB with it")
+    print(f"saved:      {(duplicated_bytes - unindexed_bytes) / 2**20:8.1f} MB, "
+          f"{(duplicated_bytes - interned_bytes) / 2**20:.1f} MB with the staff index")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000, int(sys.argv[2]) if len(sys.argv) > 2 else 500)
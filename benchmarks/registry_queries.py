@@ -0,0 +1,89 @@
+"""
+Times typical workforce queries answered by EmployeeRegistry against
+linear scans over every employee, and the cost the registry adds to
+salary updates.
+
+Run from the repository root:
+
+    python -m benchmarks.registry_queries [employees] [repeats]
+"""
+import random
+import sys
+import time
+
+from EmployeeRegistry import EmployeeRegistry
+from ImplementingClassInheritance import Developer
+from InstantiatingCustomClasses import Employee
+from benchmarks.timing import timed
+
+POSITIONS = ("Programmer", "Driver", "Tester", "Manager")
+FRAMEWORKS = ("JS", "Django", "Go", "Rails", "Spring")
+
+
+def build(count):
+    """
+    Builds a workforce that is half employees and half developers.
+
+    Args:
+        count (int): The number of employees.
+
+    Returns:
+        list: The employees.
+    """
+    rng = random.Random(42)
+    half = count // 2
+    workforce = [Employee(f"Employee {i}", rng.randint(18, 65), rng.randint(1000, 10000), rng.choice(POSITIONS))
+                 for i in range(half)]
+    workforce += [Developer(f"Developer {i}", rng.randint(18, 65), rng.randint(1000, 10000), rng.choice(FRAMEWORKS))
+                  for i in range(count - half)]
+    return workforce
+
+
+def scan_js_developers(workforce, salary):
+    return [e for e in workforce if isinstance(e, Developer) and e.framework == "JS" and e.salary > salary]
+
+
+def scan_young_drivers(workforce, age):
+    return [e for e in workforce if getattr(e, "position", None) == "Driver" and e.age < age]
+
+
+def main(count=1_000_000, repeats=5):
+    workforce = build(count)
+    start = time.perf_counter()
+    registry = EmployeeRegistry(workforce)
+    print(f"Index {count} employees: {time.perf_counter() - start:.2f}s")
+
+    queries = [
+        ("JS developers earning over 9900",
+         lambda: scan_js_developers(workforce, 9900),
+         lambda: registry.find(Developer, framework="JS", salary=(9900.000001, None))),
+        ("Drivers under 20",
+         lambda: scan_young_drivers(workforce, 20),
+         lambda: registry.find(position="Driver", age=(None, 20))),
+        ("Salaries in [5000, 5010)",
+         lambda: [e for e in workforce if 5000 <= e.salary < 5010],
+         lambda: registry.find(salary=(5000, 5010))),
+    ]
+    for label, scan, query in queries:
+        scan_time, expected = timed(scan, repeats)
+        query_time, found = timed(query, repeats)
+        assert sorted(map(id, found)) == sorted(map(id, expected)), label
+        print(f"{label} ({len(found)} matches): scan {scan_time * 1000:.1f}ms, "
+              f"registry {query_time * 1000:.2f}ms, {scan_time / query_time:.0f}x")
+
+    sample = random.Random(7).sample(workforce, min(10_000, len(workforce)))
+    start = time.perf_counter()
+    for employee in sample:
+        employee.increase_salary(1)
+    indexed = time.perf_counter() - start
+    registry.close()
+    start = time.perf_counter()
+    for employee in sample:
+        employee.increase_salary(1)
+    plain = time.perf_counter() - start
+    print(f"Raise {len(sample)} employees: {plain * 1e6 / len(sample):.2f}µs each unindexed, "
+          f"{indexed * 1e6 / len(sample):.2f}µs each indexed")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,90 @@
+"""
+Times writing a nightly report line for every employee with one str() call
+and one write per line, and with ReportRenderer on its first (cold) and
+later (warm) runs, after raising 1% of the salaries, and on a report
+listing the same employees in reverse order.
+
+Run from the repository root:
+
+    python -m benchmarks.report_rendering [employees]
+"""
+import os
+import sys
+import tempfile
+
+import InstantiatingCustomClasses
+import ManagingAttributeAccess
+from ReportRendering import ReportRenderer
+from benchmarks.timing import best_of
+
+POSITIONS = ("Programmer", "Driver", "Tester", "Manager")
+
+
+def build(count):
+    """
+    Builds a workforce split between the two Employee classes with a __str__.
+
+    Args:
+        count (int): The number of employees.
+
+    Returns:
+        list: The employees.
+    """
+    half = count // 2
+    workforce = [InstantiatingCustomClasses.Employee(f"Employee {i}", 20 + i % 45, 1000 + i % 9000 + 0.25, POSITIONS[i % 4])
+                 for i in range(half)]
+    workforce += ManagingAttributeAccess.Employee.from_records(
+        (f"Employee {i}", 20 + i % 45, 1000 + i % 9000 + 0.25, POSITIONS[i % 4]) for i in range(half, count))
+    return workforce
+
+
+def report_per_line(workforce, path):
+    """
+    Writes the report with one str() call and one write per employee.
+    """
+    with open(path, "w", encoding="utf-8") as fp:
+        for employee in workforce:
+            fp.write(str(employee) + "\n")
+
+
+def report_rendered(renderer, workforce, path):
+    """
+    Writes the report with a ReportRenderer.
+    """
+    with open(path, "w", encoding="utf-8") as fp:
+        renderer.write(workforce, fp)
+
+
+def main(count=5_000_000):
+    workforce = build(count)
+    directory = tempfile.mkdtemp()
+    expected_path = os.path.join(directory, "expected.txt")
+    path = os.path.join(directory, "report.txt")
+    renderer = ReportRenderer()
+    try:
+        baseline = best_of(lambda: report_per_line(workforce, expected_path), 1)
+        cold = best_of(lambda: report_rendered(renderer, workforce, path), 1)
+        for employee in workforce[::100]:
+            employee.increase_salary(2)
+        report_per_line(workforce, expected_path)
+        warm = best_of(lambda: report_rendered(renderer, workforce, path), 1)
+        with open(expected_path, encoding="utf-8") as expected, open(path, encoding="utf-8") as rendered:
+            assert expected.read() == rendered.read()
+        workforce.reverse()
+        report_per_line(workforce, expected_path)
+        reordered = best_of(lambda: report_rendered(renderer, workforce, path), 1)
+        with open(expected_path, encoding="utf-8") as expected, open(path, encoding="utf-8") as rendered:
+            assert expected.read() == rendered.read()
+        print(f"{count} employees")
+        print(f"str() per line:      {baseline:.2f}s")
+        print(f"renderer, cold:      {cold:.2f}s")
+        print(f"renderer, warm:      {warm:.2f}s, {baseline / warm:.1f}x faster")
+        print(f"renderer, reordered: {reordered:.2f}s, {baseline / reordered:.1f}x faster")
+    finally:
+        for name in (expected_path, path):
+            os.remove(name)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
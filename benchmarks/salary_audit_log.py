@@ -0,0 +1,87 @@
+"""
+Measures sustained salary writes per second on writeonly.Employee with no
+audit log, with a log written synchronously on every assignment, and with
+the batched SalaryAuditLog, then checks the log replays to the final
+salaries.
+
+Run from the repository root:
+
+    python -m benchmarks.salary_audit_log [writes] [employees]
+"""
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from AuditLog import SalaryAuditLog
+from writeonly import Employee
+
+
+class SyncAuditLog:
+    """Writes and flushes every record as it is made, the approach SalaryAuditLog replaces."""
+
+    RECORD = struct.Struct("<dQdH")
+
+    def __init__(self, path) -> None:
+        self._fp = open(path, "ab")
+
+    def record(self, employee, salary):
+        name = employee.name.encode()
+        self._fp.write(self.RECORD.pack(time.time(), SalaryAuditLog.key(employee), salary, len(name)) + name)
+        self._fp.flush()
+
+    def close(self):
+        self._fp.close()
+
+
+def run(workforce, writes):
+    """
+    Raises salaries round-robin and returns the writes per second.
+    """
+    count = len(workforce)
+    start = time.perf_counter()
+    for i in range(writes):
+        workforce[i % count].salary = 1000 + i
+    return writes / (time.perf_counter() - start)
+
+
+def main(writes=1_000_000, employees=10_000):
+    workforce = Employee.from_records((f"Employee {i}", 1000) for i in range(employees))
+    directory = tempfile.mkdtemp()
+    sync_path = os.path.join(directory, "sync.log")
+    path = os.path.join(directory, "salaries.log")
+    try:
+        plain = run(workforce, writes)
+
+        Employee.audit_log = SyncAuditLog(sync_path)
+        synchronous = run(workforce, writes)
+        Employee.audit_log.close()
+
+        Employee.audit_log = SalaryAuditLog(path)
+        start = time.perf_counter()
+        batched = run(workforce, writes)
+        Employee.audit_log.close()
+        drained = writes / (time.perf_counter() - start)
+        Employee.audit_log = None
+
+        # Only the last write of each employee written to is kept
+        salaries = SalaryAuditLog.rebuild(path)
+        assert len(salaries) == min(writes, employees)
+        assert salaries == {SalaryAuditLog.key(workforce[i % employees]): (f"Employee {i % employees}", 1000 + i)
+                            for i in range(max(writes - employees, 0), writes)}
+        print(f"{writes} writes over {employees} employees")
+        print(f"no audit log:    {plain:12,.0f} writes/s")
+        print(f"synchronous log: {synchronous:12,.0f} writes/s")
+        print(f"SalaryAuditLog:  {batched:12,.0f} writes/s, {drained:,.0f} including the final flush")
+        print(f"log size:        {os.path.getsize(path) / writes:12.1f} bytes/write")
+    finally:
+        Employee.audit_log = None
+        for name in (sync_path, path):
+            if os.path.exists(name):
+                os.remove(name)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else 10_000)
@@ -0,0 +1,86 @@
+"""
+Runs Developer raises from a growing number of threads under one global
+lock and under ThreadSafeSalaries' striped locks, and counts lost updates.
+
+Every raise adds a bonus of 1 to a random developer, so the payroll must
+grow by exactly the number of raises. On a build with the GIL the threads
+never run Python code in parallel and the striped locks can only remove
+the waiting on the global lock; on a free-threaded build they let raises
+of different employees run at the same time. "striped" only locks
+increase_salary, "striped + sets" also locks salary assignments.
+
+Run from the repository root:
+
+    python -m benchmarks.salary_contention [raises per thread] [employees]
+"""
+import random
+import sys
+import sysconfig
+import threading
+import time
+
+from ConcurrentSalaries import ThreadSafeSalaries
+from ImplementingClassInheritance import Developer
+
+THREADS = (1, 2, 4, 8)
+BATCH = 100
+
+
+def run_threads(count, work):
+    """
+    Runs work(seed) in count threads at once and returns the elapsed time.
+    """
+    start_line = threading.Barrier(count + 1)
+
+    def worker(seed):
+        start_line.wait()
+        work(seed)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(count)]
+    for thread in threads:
+        thread.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(raises=20_000, employees=10_000):
+    team = [Developer(f"Developer {i}", 30, 1000.0, "JS") for i in range(employees)]
+    global_lock = threading.Lock()
+    safe = ThreadSafeSalaries()
+
+    def global_locked(seed):
+        for employee in random.Random(seed).choices(team, k=raises):
+            with global_lock:
+                employee.increase_salary(0, 1)
+
+    def striped(seed):
+        for employee in random.Random(seed).choices(team, k=raises):
+            employee.increase_salary(0, 1)
+
+    def batched(seed):
+        chosen = random.Random(seed).choices(team, k=raises)
+        for start in range(0, raises, BATCH):
+            safe.increase_salaries(chosen[start:start + BATCH], 0, 1)
+
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"{raises} raises per thread over {employees} developers, "
+          f"{'free-threaded' if free_threaded else 'GIL'} build")
+    for label, work, install in (("unlocked", striped, None), ("global lock", global_locked, None),
+                                 ("striped", striped, False), ("striped + sets", striped, True),
+                                 (f"batches of {BATCH}", batched, True)):
+        if install is not None:
+            safe.install(Developer, assignments=install)
+        for count in THREADS:
+            before = sum(employee.salary for employee in team)
+            elapsed = run_threads(count, work)
+            lost = round(before + count * raises - sum(employee.salary for employee in team))
+            print(f"{label:15} {count} threads {count * raises / elapsed / 1e3:8.0f}k raises/s, {lost} lost")
+        safe.uninstall()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10_000)
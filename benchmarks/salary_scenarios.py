@@ -0,0 +1,97 @@
+"""
+Measures fork time and memory of what-if salary scenarios held as delta
+layers over a shared workforce, against deep-copying the workforce for
+every scenario.
+
+Every scenario works on one team, a stride of the workforce: even
+scenarios raise the team's developers 10% plus a bonus, odd ones raise the
+team to a minimum wage. Deep copies are timed once, with their memory
+measured on a sample, and extrapolated to the number of scenarios, which
+would not fit in memory.
+
+Run from the repository root:
+
+    python -m benchmarks.salary_scenarios [employees] [scenarios]
+"""
+import copy
+import sys
+import time
+
+from ImplementingClassInheritance import Developer, Tester
+from SalaryScenarios import Scenario
+from benchmarks.memory import measure
+
+TEAMS = 199
+# The deep copy memory is measured on this many employees and scaled up
+SAMPLE = 100_000
+
+
+def build(count):
+    """
+    Builds a workforce that is half testers and half developers.
+    """
+    return [Developer(f"Employee {i}", 20 + i % 45, 1000.0 + i % 9000, "JS") if i % 2
+            else Tester(f"Employee {i}", 20 + i % 45, 1000.0 + i % 9000)
+            for i in range(count)]
+
+
+def run_scenarios(workforce, teams, scenarios):
+    """
+    Forks and fills the scenarios, returning them with the fork and update times.
+    """
+    forks, start = [], time.perf_counter()
+    for _ in range(scenarios):
+        forks.append(workforce.fork())
+    forked = time.perf_counter() - start
+    start = time.perf_counter()
+    for k, scenario in enumerate(forks):
+        team = teams[k % len(teams)]
+        if k % 2:
+            scenario.set_minimum_wage(2500 + k, rows=team)
+        else:
+            scenario.increase_salaries(10, bonus=k, rows=team, cls=Developer)
+    return forks, forked, time.perf_counter() - start
+
+
+def main(employees=1_000_000, scenarios=1000):
+    workforce = Scenario(build(employees))
+    teams = [range(team, employees, TEAMS) for team in range(TEAMS)]
+
+    start = time.perf_counter()
+    copy.deepcopy(workforce.employees)
+    copied = time.perf_counter() - start
+    sample = workforce.employees[:SAMPLE]
+    copied_bytes = measure(lambda: copy.deepcopy(sample))[1] * employees / len(sample)
+    print(f"deep copy:      {copied:8.2f} s {copied_bytes / 2**20:10.1f} MiB per scenario, "
+          f"{copied * scenarios:9.0f} s {copied_bytes * scenarios / 2**30:8.1f} GiB for {scenarios}")
+
+    forks, forked, updated = run_scenarios(workforce, teams, scenarios)
+    changed = sum(map(len, forks))
+    print(f"fork:           {forked * 1e3:8.2f} ms for {scenarios} ({forked / scenarios * 1e6:.2f} us each)")
+    print(f"update:         {updated:8.2f} s, {changed} salaries changed")
+
+    start = time.perf_counter()
+    costs = [scenario.cost() for scenario in forks]
+    print(f"cost:           {(time.perf_counter() - start) * 1e3:8.2f} ms for {scenarios}, "
+          f"the cheapest adds {min(costs):.0f} a month")
+    start = time.perf_counter()
+    forks[0].undo()
+    print(f"undo:           {(time.perf_counter() - start) * 1e3:8.2f} ms for one scenario")
+    start = time.perf_counter()
+    forks[1].commit()
+    workforce.commit()
+    print(f"commit:         {(time.perf_counter() - start) * 1e3:8.2f} ms for one scenario")
+    start = time.perf_counter()
+    for scenario in forks:
+        scenario.discard()
+    print(f"discard:        {(time.perf_counter() - start) * 1e3:8.2f} ms for {scenarios}")
+    del forks
+
+    forks, delta_bytes = measure(lambda: run_scenarios(workforce, teams, scenarios)[0])
+    print(f"delta layers:   {delta_bytes / 2**20:8.1f} MiB for {scenarios} "
+          f"({delta_bytes / max(1, sum(map(len, forks))):.0f} bytes per changed salary, undo included)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
@@ -0,0 +1,56 @@
+"""
+Measures how long a worker takes to open an employee snapshot and read its
+first and last rows, for snapshots of growing size.
+
+Run from the repository root:
+
+    python -m benchmarks.snapshot_startup [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from ColumnarStorage import EmployeeTable
+from EmployeeSnapshots import EmployeeSnapshot, write_snapshot
+from ImplementingClassInheritance import Employee, Developer
+
+
+def build_table(rows):
+    """
+    Builds a table of employees and developers without creating instances.
+
+    Args:
+        rows (int): The number of rows.
+
+    Returns:
+        EmployeeTable: The table.
+    """
+    table = EmployeeTable()
+    for i in range(rows):
+        if i % 2:
+            table.add(f"Employee {i}", 20 + i % 45, 1000.0 + i % 9000, Developer, "JS")
+        else:
+            table.add(f"Employee {i}", 20 + i % 45, 1000.0 + i % 9000, Employee)
+    return table
+
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    directory = tempfile.mkdtemp()
+    for rows in sizes:
+        path = os.path.join(directory, f"{rows}.snapshot")
+        write_snapshot(path, build_table(rows))
+        start = time.perf_counter()
+        snapshot = EmployeeSnapshot(path)
+        first, last = snapshot[0], snapshot[-1]
+        first.name, last.salary
+        elapsed = time.perf_counter() - start
+        print(f"{rows:>10} rows  {os.path.getsize(path) / 1e6:8.1f} MB  open + first access {elapsed * 1e3:6.3f} ms")
+        del first, last
+        snapshot.close()
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (10_000, 100_000, 1_000_000))
@@ -0,0 +1,68 @@
+"""
+Measures the throughput and peak memory of StreamingIngestion on a
+synthetic CSV export, building full Employee objects and projecting only
+names and salaries.
+
+Run from the repository root, ideally once per mode so the peak memory of
+one mode does not hide the other:
+
+    python -m benchmarks.streaming_ingestion [rows] [full|projected]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from StreamingIngestion import ingest
+
+POSITIONS = ("Programmer", "Driver", "Tester", "Manager")
+
+
+def write_export(path, rows):
+    """
+    Writes a synthetic CSV export without holding it in memory.
+
+    Args:
+        path (str): The file to write.
+        rows (int): The number of employees.
+    """
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write("name,age,salary,position\n")
+        for i in range(rows):
+            fp.write(f"Employee {i},{20 + i % 45},{1000 + i % 9000}.50,{POSITIONS[i % 4]}\n")
+
+
+def run(path, fields):
+    """
+    Ingests the export and discards every chunk.
+
+    Args:
+        path (str): The CSV export.
+        fields (tuple or None): The fields to keep, or None for full Employee objects.
+
+    Returns:
+        tuple: The number of records and the elapsed seconds.
+    """
+    options = {} if fields is None else {"fields": fields}
+    count = 0
+    start = time.perf_counter()
+    for chunk in ingest(path, **options):
+        count += len(chunk)
+    return count, time.perf_counter() - start
+
+
+def main(rows=10_000_000, mode="full"):
+    path = os.path.join(tempfile.mkdtemp(), "employees.csv")
+    write_export(path, rows)
+    try:
+        fields = None if mode == "full" else ("name", "salary")
+        count, elapsed = run(path, fields)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{mode}: {count} rows in {elapsed:.2f}s, {count / elapsed:,.0f} rows/s, peak RSS {peak:.0f} MB")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000, sys.argv[2] if len(sys.argv) > 2 else "full")
@@ -0,0 +1,267 @@
+"""
+Benchmarks every employee class of the project at several sizes and
+compares the results with a saved baseline.
+
+Covers construction, salary reads and writes, increase_salary, __str__ and
+__repr__, the classmethod factories and dataclass Project creation. The
+slotted classes of ImplementingClassInheritance and the dataclass Project
+run next to the __dict__ based classes of the other modules. Every result
+is the best time per object of a few runs, in nanoseconds.
+
+Run from the repository root:
+
+    python -m benchmarks.suite [--sizes 1000,100000,1000000] [--output results.json]
+                               [--baseline baseline.json] [--threshold 0.2] [--filter text]
+
+Save a baseline with --output, then pass it as --baseline to a later run;
+the run exits with status 1 if any case got slower by more than the
+threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import date, timedelta
+
+import AccessingClassAttributesMethods
+import ImplementingClassInheritance
+import InstantiatingCustomClasses
+import ManagingAttributeAccess
+import UsingDataClasses
+import readonly
+import writeonly
+from benchmarks.timing import best_of
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+_PROJECT = UsingDataClasses.Project("Django App", 20000, "Globomantics")
+
+# The constructor arguments of every class, by the fields they take
+ROWS = {
+    "name, age, salary, position": lambda i: (f"Employee {i}", 20 + i % 40, 1000.0 + i % 5000, "Programmer"),
+    "name, age, salary": lambda i: (f"Employee {i}", 20 + i % 40, 1000.0 + i % 5000),
+    "name, age, salary, framework": lambda i: (f"Employee {i}", 20 + i % 40, 1000.0 + i % 5000, "JS"),
+    "name, age, salary, project": lambda i: (f"Employee {i}", 20 + i % 40, 1000.0 + i % 5000, _PROJECT),
+    "name, salary": lambda i: (f"Employee {i}", 1000.0 + i % 5000),
+    "name, payment, client": lambda i: (f"Project {i}", 1000 + i % 5000, "Globomantics"),
+}
+
+# Every class with the fields its constructor takes
+CLASSES = {
+    "InstantiatingCustomClasses.Employee": (InstantiatingCustomClasses.Employee, "name, age, salary, position"),
+    "ManagingAttributeAccess.Employee": (ManagingAttributeAccess.Employee, "name, age, salary, position"),
+    "AccessingClassAttributesMethods.Employee": (AccessingClassAttributesMethods.Employee, "name, age, salary"),
+    "ImplementingClassInheritance.Employee": (ImplementingClassInheritance.Employee, "name, age, salary"),
+    "ImplementingClassInheritance.Tester": (ImplementingClassInheritance.Tester, "name, age, salary"),
+    "ImplementingClassInheritance.Developer": (ImplementingClassInheritance.Developer, "name, age, salary, framework"),
+    "UsingDataClasses.Employee": (UsingDataClasses.Employee, "name, age, salary, project"),
+    "UsingDataClasses.Project": (UsingDataClasses.Project, "name, payment, client"),
+    "readonly.Employee": (readonly.Employee, "name, salary"),
+    "readonly.FrozenEmployee": (readonly.FrozenEmployee, "name, salary"),
+    "writeonly.Employee": (writeonly.Employee, "name, salary"),
+}
+
+# The classes each access pattern applies to; readonly salaries cannot be
+# set and writeonly salaries cannot be read
+SALARY_GET = [name for name in CLASSES if not name.startswith(("writeonly.", "UsingDataClasses.Project"))]
+SALARY_SET = [name for name in CLASSES if not name.startswith(("readonly.", "UsingDataClasses.Project"))]
+INCREASE_SALARY = [name for name, (cls, _) in CLASSES.items() if hasattr(cls, "increase_salary")]
+RENDERED = [name for name, (cls, _) in CLASSES.items() if cls.__str__ is not object.__str__]
+
+CASES = {}
+
+
+def rows(name, count):
+    """
+    Returns the constructor arguments of count instances of a class.
+    """
+    row = ROWS[CLASSES[name][1]]
+    return [row(i) for i in range(count)]
+
+
+def build(name, count):
+    """
+    Returns count instances of a class.
+    """
+    cls = CLASSES[name][0]
+    return [cls(*row) for row in rows(name, count)]
+
+
+def _construct(name):
+    def setup(count):
+        cls, records = CLASSES[name][0], rows(name, count)
+        return lambda: [cls(*row) for row in records]
+    return setup
+
+
+def _salary_get(name):
+    def setup(count):
+        objects = build(name, count)
+        return lambda: [obj.salary for obj in objects]
+    return setup
+
+
+def _salary_set(name):
+    def setup(count):
+        objects = build(name, count)
+
+        def run():
+            for obj in objects:
+                obj.salary = 2000.0
+        return run
+    return setup
+
+
+def _increase_salary(name):
+    def setup(count):
+        objects = build(name, count)
+
+        def run():
+            for obj in objects:
+                obj.increase_salary(1)
+        return run
+    return setup
+
+
+def _render(name, render):
+    def setup(count):
+        objects = build(name, count)
+        return lambda: [render(obj) for obj in objects]
+    return setup
+
+
+for _name in CLASSES:
+    CASES[f"construct/{_name}"] = _construct(_name)
+for _name in SALARY_GET:
+    CASES[f"salary get/{_name}"] = _salary_get(_name)
+for _name in SALARY_SET:
+    CASES[f"salary set/{_name}"] = _salary_set(_name)
+for _name in INCREASE_SALARY:
+    CASES[f"increase_salary/{_name}"] = _increase_salary(_name)
+for _name in RENDERED:
+    CASES[f"str/{_name}"] = _render(_name, str)
+    CASES[f"repr/{_name}"] = _render(_name, repr)
+
+
+def _from_records(name):
+    def setup(count):
+        cls, records = CLASSES[name][0], rows(name, count)
+        return lambda: cls.from_records(records)
+    return setup
+
+
+for _name in ("ManagingAttributeAccess.Employee", "AccessingClassAttributesMethods.Employee", "writeonly.Employee"):
+    CASES[f"factory from_records/{_name}"] = _from_records(_name)
+
+
+def _new_employees(count):
+    names = [f"Employee {i}" for i in range(count)]
+    dobs = [date(1960, 1, 1) + timedelta(days=i % 15000) for i in range(count)]
+    return lambda: AccessingClassAttributesMethods.Employee.new_employees(names, dobs)
+
+
+def _new_employee(count):
+    new_employee = AccessingClassAttributesMethods.Employee.new_employee
+    hires = [(f"Employee {i}", date(1960, 1, 1) + timedelta(days=i % 15000)) for i in range(count)]
+    return lambda: [new_employee(name, dob) for name, dob in hires]
+
+
+def _from_employee(count):
+    employees = build("readonly.Employee", count)
+    from_employee = readonly.FrozenEmployee.from_employee
+    return lambda: [from_employee(employee) for employee in employees]
+
+
+CASES["factory new_employees/AccessingClassAttributesMethods.Employee"] = _new_employees
+CASES["factory new_employee/AccessingClassAttributesMethods.Employee"] = _new_employee
+CASES["factory from_employee/readonly.FrozenEmployee"] = _from_employee
+del _name
+
+
+def run_suite(sizes=SIZES, selected=None, repeats=3):
+    """
+    Runs the benchmark cases and returns their results.
+
+    Args:
+        sizes (iterable, optional): The numbers of objects per case.
+        selected (str, optional): Only run cases whose name contains this text.
+        repeats (int, optional): The runs per case and size; the best one counts. Default is 3.
+
+    Returns:
+        dict: The environment and, for every case, the nanoseconds per
+        object at every size.
+    """
+    results = {}
+    for name, setup in CASES.items():
+        if selected and selected not in name:
+            continue
+        results[name] = {}
+        for count in sizes:
+            run = setup(count)
+            # Small sizes run several times per measurement, so timer resolution does not matter
+            loops = max(1, 100_000 // count)
+            elapsed = best_of(lambda: [run() for _ in range(loops)], repeats)
+            del run
+            results[name][str(count)] = elapsed / (loops * count) * 1e9
+            print(f"{name:70} {count:>9} {results[name][str(count)]:9.1f} ns", flush=True)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Lists the cases slower than in a baseline by more than a threshold.
+
+    Cases or sizes missing from either run are skipped.
+
+    Args:
+        current (dict): Results returned by run_suite.
+        baseline (dict): Results saved from an earlier run.
+        threshold (float): The allowed slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        list: The (case, size, baseline ns, current ns) of every regression.
+    """
+    regressions = []
+    for name, timings in current["results"].items():
+        saved = baseline["results"].get(name, {})
+        for size, nanoseconds in timings.items():
+            if size in saved and nanoseconds > saved[size] * (1 + threshold):
+                regressions.append((name, size, saved[size], nanoseconds))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)),
+                        help="comma separated numbers of objects per case")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="slowdown flagged as a regression, default 0.2 for 20%%")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per case and size, default 3")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    current = run_suite(sizes, args.filter, args.repeats)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(current, fp, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        regressions = compare(current, baseline, args.threshold)
+        for name, size, before, after in regressions:
+            print(f"REGRESSION {name} at {size}: {before:.1f} ns -> {after:.1f} ns ({after / before - 1:+.0%})")
+        print(f"{len(regressions)} regressions beyond {args.threshold:.0%}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
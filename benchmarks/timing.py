@@ -0,0 +1,47 @@
+"""
+The timer shared by the benchmarks.
+
+Like timeit, the cyclic garbage collector is paused while timing, after a
+full collection, so the numbers measure the code rather than collections
+of whatever the benchmark keeps alive.
+"""
+import gc
+import time
+
+
+def timed(func, repeats=3):
+    """
+    Times several calls of a callable.
+
+    Args:
+        func (callable): The callable to time, called without arguments.
+        repeats (int, optional): The number of calls. Default is 3.
+
+    Returns:
+        tuple: The best elapsed seconds and the result of the last call.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def best_of(func, repeats=3):
+    """
+    Returns the best elapsed seconds of several calls of a callable.
+
+    Args:
+        func (callable): The callable to time, called without arguments.
+        repeats (int, optional): The number of calls. Default is 3.
+
+    Returns:
+        float: The best elapsed seconds.
+    """
+    return timed(func, repeats)[0]
@@ -0,0 +1,170 @@
+"""
+The example modules of the repository as one lazily loaded package.
+
+Importing the package imports none of the modules. Each module is imported
+the first time it is used, and every module only defines its classes and
+functions on import; the examples run only when a module is executed as a
+script. The modules live at the repository root, which must be on sys.path,
+as it is when running from there:
+
+    import classes_oop
+
+    classes_oop.readonly.FrozenEmployee("Abi", 2000)  # imports readonly
+    from classes_oop import ProjectRegistry           # imports UsingDataClasses
+    import classes_oop.AuditLog                       # imports AuditLog
+
+Either way the package module is the root module itself, not a copy.
+Classes with a name of their own are also available directly; the Employee
+classes are reached through their module, since several modules define one.
+
+A module defining a class of its own name, like SortedIndex, is always
+that class in the package namespace, however it was imported, so
+``from classes_oop import SortedIndex`` gives the class. The module itself
+is importlib.import_module("classes_oop.SortedIndex").
+"""
+import importlib
+import importlib.machinery
+import sys
+import types
+
+# The modules at the repository root
+MODULES = (
+    "AccessingClassAttributesMethods",
+    "AsyncNotifications",
+    "AuditLog",
+    "BatchDispatch",
+    "BinarySerialization",
+    "BulkSalaryUpdates",
+    "ChangeFeed",
+    "ColumnarStorage",
+    "ConcurrentSalaries",
+    "EmployeeRegistry",
+    "EmployeeSnapshots",
+    "ImplementingClassInheritance",
+    "InstantiatingCustomClasses",
+    "Instrumentation",
+    "ManagingAttributeAccess",
+    "ObjectPooling",
+    "ParallelPayroll",
+    "PayrollAggregates",
+    "QuantileSketch",
+    "ReportRendering",
+    "SalaryScenarios",
+    "SortedIndex",
+    "StreamingIngestion",
+    "UsingDataClasses",
+    "WatchingAttributes",
+    "readonly",
+    "writeonly",
+)
+
+# Classes exported by name, and the module defining each, besides the
+# classes named like their module
+CLASSES = {
+    "AsyncNotifier": "AsyncNotifications",
+    "ChangeEvent": "ChangeFeed",
+    "Developer": "ImplementingClassInheritance",
+    "EmployeePool": "ObjectPooling",
+    "EmployeeSnapshot": "EmployeeSnapshots",
+    "EmployeeTable": "ColumnarStorage",
+    "FrozenEmployee": "readonly",
+    "Project": "UsingDataClasses",
+    "ProjectRegistry": "UsingDataClasses",
+    "ReportRenderer": "ReportRendering",
+    "SalaryAuditLog": "AuditLog",
+    "Scenario": "SalaryScenarios",
+    "Tester": "ImplementingClassInheritance",
+    "ThreadSafeSalaries": "ConcurrentSalaries",
+    "cached_derived": "WatchingAttributes",
+}
+
+__all__ = sorted(set(MODULES) | set(CLASSES))
+
+
+def __getattr__(name):
+    """
+    Imports a module or class the first time it is used.
+
+    The result is stored in the package namespace, so later accesses do not
+    come back here, and modules are registered as classes_oop.<module> too.
+
+    Raises:
+        AttributeError: If the name is neither a module nor an exported class.
+    """
+    if name in MODULES:
+        module = importlib.import_module(name)
+        sys.modules[f"{__name__}.{name}"] = module
+        value = _exported(name, module)
+    elif name in CLASSES:
+        value = getattr(__getattr__(CLASSES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def _exported(name, module):
+    """
+    Returns what the package exports for one of its modules: the class of the same name if it defines one.
+    """
+    value = getattr(module, name, module)
+    return value if isinstance(value, type) else module
+
+
+class _Package(types.ModuleType):
+    """
+    The class of the package module, keeping the classes named like their module.
+
+    The import statement sets classes_oop.<module> to the module after
+    importing it, which would replace the class exported under that name.
+    """
+
+    def __setattr__(self, name, value):
+        if name in MODULES and isinstance(value, types.ModuleType):
+            value = _exported(name, value)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+class _ModuleAlias:
+    """
+    A meta path finder and loader importing classes_oop.<module> as the root module.
+
+    The modules are not files of the package, so without it the import
+    statement would not find them.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        """
+        Returns the spec of a module of the package, or None for any other name.
+        """
+        package, _, name = fullname.rpartition(".")
+        if package != __name__ or name not in MODULES:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self)
+
+    def create_module(self, spec):
+        """
+        Imports the root module, which becomes the package module.
+        """
+        module = importlib.import_module(spec.name.rpartition(".")[2])
+        spec.loader_state = module.__spec__
+        return module
+
+    def exec_module(self, module):
+        """
+        Gives the module back its own spec, which the import system replaced.
+        """
+        module.__spec__ = module.__spec__.loader_state
+
+
+if not any(isinstance(finder, _ModuleAlias) for finder in sys.meta_path):
+    # Last, so other imports never pay for it; it only answers classes_oop.<module>
+    sys.meta_path.append(_ModuleAlias())
+
+
+def __dir__():
+    """Lists the modules and classes, loaded or not."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,7 @@
+from collections import namedtuple
+from operator import itemgetter
+
+
 class Employee:
     """
     A class to represent an employee.
@@ -84,13 +88,106 @@ class Employee:
         """
         raise AttributeError("Salary is read only")
 
-# Create instances of Employee
-e = Employee('Abi', 2000)
-f = Employee('Bob', 1000)
 
-# Print the salary and details of the employee
-print(e.salary)
-print(e)
+class FrozenEmployee(namedtuple("FrozenEmployee", ("name", "salary"))):
+    """
+    A frozen, hashable employee stored as a (name, salary) named tuple.
+
+    Instances have no __dict__, so they take the memory of a two-item tuple,
+    and both attributes are read by C-level tuple getters. Equality and
+    hashing compare the name and salary, so instances can be set members or
+    dict keys, but a FrozenEmployee never equals a plain tuple.
+
+    Attributes
+    ----------
+    name : str
+        The name of the employee (read-only).
+    salary : float
+        The salary of the employee (read-only).
+
+    Methods
+    -------
+    from_employee(employee):
+        Returns a frozen copy of an Employee.
+    __str__():
+        Returns a string representation of the employee's details.
+    __repr__():
+        Returns the same representation as Employee.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_employee(cls, employee):
+        """
+        Returns a frozen copy of an Employee.
+
+        Parameters
+        ----------
+        employee : Employee
+            The employee to copy.
+
+        Returns
+        -------
+        FrozenEmployee
+            An employee with the same name and salary.
+        """
+        return cls(employee.name, employee.salary)
+
+    def _read_only(self, salary):
+        """Prevents modification of the salary attribute."""
+        raise AttributeError("Salary is read only")
+
+    salary = property(itemgetter(1), _read_only, doc="The salary of the employee.")
+    del _read_only
+
+    def __eq__(self, other):
+        """Compares the name and salary of two frozen employees."""
+        # Returning NotImplemented would let tuple.__eq__ match a plain tuple
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        """Negates __eq__, which tuple.__ne__ would bypass."""
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the employee's details.
+
+        Returns
+        -------
+        str
+            A formatted string containing the employee's name and salary.
+        """
+        return f"{self[0]} has a salary of ${self[1]:.2f}."
+
+    def __repr__(self) -> str:
+        """
+        Returns the same representation as Employee.
+
+        Returns
+        -------
+        str
+            A string that recreates an Employee with the same name and salary.
+        """
+        return f"Employee('{self[0]}', {self[1]})"
+
+
+if __name__ == "__main__":
+    # Create instances of Employee
+    e = Employee('Abi', 2000)
+    f = Employee('Bob', 1000)
+
+    # Print the salary and details of the employee
+    print(e.salary)
+    print(e)
+
+    # Try to set the salary (will raise an AttributeError)
+    # e.salary = 30000  # Uncommenting this line will raise an AttributeError
 
-# Try to set the salary (will raise an AttributeError)
-# e.salary = 30000  # Uncommenting this line will raise an AttributeError
\ No newline at end of file
+    # Freeze an employee and use it as a set member
+    frozen = FrozenEmployee.from_employee(e)
+    print(frozen.salary, frozen, repr(frozen))
+    print(frozen in {FrozenEmployee('Abi', 2000)}, frozen == ('Abi', 2000))
@@ -8,6 +8,8 @@ class Employee:
         The name of the employee.
     _salary : float
         The private salary attribute of the employee.
+    audit_log : AuditLog.SalaryAuditLog or None
+        Class attribute; when set, every salary written is recorded in it.
 
     Methods
     -------
@@ -19,8 +21,12 @@ class Employee:
         Returns a detailed string representation of the employee that can recreate the object.
     salary() -> float:
         Property that raises an AttributeError because salary is write-only.
+    from_records(records) -> list:
+        Creates employees in bulk without calling the salary setter per row.
     """
 
+    audit_log = None
+
     def __init__(self, name, salary) -> None:
         """
         Constructs all the necessary attributes for the employee object.
@@ -35,6 +41,48 @@ class Employee:
         self.name = name
         self.salary = salary  # Using the setter to enforce the minimum wage
 
+    @classmethod
+    def from_records(cls, records):
+        """
+        Creates employees in bulk from (name, salary) records.
+
+        The instances are filled in directly instead of going through the salary
+        setter for every row. A batch with a salary below the minimum wage is
+        scanned again so the error can list every failed row.
+
+        Parameters
+        ----------
+        records : iterable
+            The (name, salary) records.
+
+        Returns
+        -------
+        list
+            The new Employee instances, in record order.
+
+        Raises
+        ------
+        ValueError
+            If any salary is less than the minimum wage, listing every failed row.
+        """
+        records = list(records)
+        employees = []
+        new = cls.__new__
+        for name, salary in records:
+            if salary < 1000:
+                break
+            employee = new(cls)
+            employee.name = name
+            employee._salary = salary
+            employees.append(employee)
+        else:
+            if cls.audit_log is not None:
+                for employee in employees:
+                    cls.audit_log.record(employee, employee._salary)
+            return employees
+        failed = [row for row, (_, salary) in enumerate(records) if salary < 1000]
+        raise ValueError(f'Minimum wage is $1000; rows below it: {failed}')
+
     def increase_salary(self, percent: float) -> None:
         """
         Increases the salary of the employee by a given percentage.
@@ -45,6 +93,8 @@ class Employee:
             The percentage by which the salary should be increased.
         """
         self._salary += self._salary * (percent / 100)
+        if self.audit_log is not None:
+            self.audit_log.record(self, self._salary)
 
     def __str__(self) -> str:
         """
@@ -98,14 +148,18 @@ class Employee:
         if salary < 1000:
             raise ValueError('Minimum wage is $1000')
         self._salary = salary
+        if self.audit_log is not None:
+            self.audit_log.record(self, salary)
+
 
-# Create instances of Employee
-e = Employee('Abi', 2000)
-f = Employee('Bob', 1000)
+if __name__ == "__main__":
+    # Create instances of Employee
+    e = Employee('Abi', 2000)
+    f = Employee('Bob', 1000)
 
-# Increase the salary using the setter method
-e.salary = 25000
-print(e)
+    # Increase the salary using the setter method
+    e.salary = 25000
+    print(e)
 
-# Try to access the salary (will raise an AttributeError)
-# print(e.salary)  # Uncommenting this line will raise an AttributeError
+    # Try to access the salary (will raise an AttributeError)
+    # print(e.salary)  # Uncommenting this line will raise an AttributeError